@@ -4,19 +4,16 @@ API Testing Desktop Application
 A SendApi application for testing APIs with collections, environments, and scripts.
 """
 
-import os
 import sys
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QApplication
-
-from src.main_window import MainWindow
-
 
 def main():
     """Main application entry point."""
     print("Starting API Tester application...")
+    # Qt and the UI modules are imported here rather than at module level so
+    # that importing this module (packaging tools, tests) stays cheap
+    from PySide6.QtWidgets import QApplication
+
     # Create the application
     app = QApplication(sys.argv)
     app.setApplicationName("API Tester")
@@ -28,6 +25,8 @@ def main():
 
     # Create and show the main window
     print("Creating main window...")
+    from src.main_window import MainWindow
+
     window = MainWindow()
     window.show()
     print("Main window displayed successfully!")
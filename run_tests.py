@@ -3,67 +3,149 @@
 Test runner for SendApi application.
 """
 
-import unittest
+import ast
+import fnmatch
+import json
+import subprocess
 import sys
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+PROJECT_ROOT_STR = str(project_root)
+if PROJECT_ROOT_STR not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT_STR)
 
-def run_unit_tests():
+TESTS_DIR = project_root / 'tests'
+TESTS_DIR_STR = str(TESTS_DIR)
+
+# Test names per module, keyed by file mtime so unchanged files aren't re-parsed
+DISCOVERY_CACHE = project_root / '.discovery_cache.json'
+
+# Directories that never contain this project's tests
+SKIP_DIRS = {'.git', '.venv', 'venv', '__pycache__', 'node_modules', 'site-packages', 'build', 'dist'}
+
+def find_test_modules(pattern):
+    """Return (dotted module name, path) for test files under tests/ matching pattern."""
+    found = []
+    pending = [TESTS_DIR_STR]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS and not entry.name.startswith('.'):
+                        pending.append(entry.path)
+                elif entry.name.endswith('.py') and fnmatch.fnmatch(entry.name, pattern):
+                    path = Path(entry.path)
+                    module = '.'.join(path.relative_to(project_root).with_suffix('').parts)
+                    found.append((module, path))
+    return sorted(found)
+
+def index_test_names():
+    """Map each test module to its test classes and methods without importing it."""
+    try:
+        cache = json.loads(DISCOVERY_CACHE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        cache = {}
+    
+    index = {}
+    for module, path in find_test_modules('test_*.py'):
+        mtime = path.stat().st_mtime_ns
+        entry = cache.get(module)
+        if entry is None or entry['mtime'] != mtime:
+            names = []
+            tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef) and node.name.startswith('Test'):
+                    names.append(node.name)
+                    names.extend(
+                        f"{node.name}.{item.name}"
+                        for item in node.body
+                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                        and item.name.startswith('test')
+                    )
+            entry = {'mtime': mtime, 'names': names}
+        index[module] = entry
+    
+    if index != cache:
+        try:
+            DISCOVERY_CACHE.write_text(json.dumps(index), encoding='utf-8')
+        except OSError:
+            pass
+    return index
+
+def run_test_modules(pattern, jobs=None):
+    """Run each matching test module in its own process, several at a time."""
+    modules = [module for module, _ in find_test_modules(pattern)]
+    if not modules:
+        print(f"No test modules match {pattern}")
+        return True
+    return run_test_targets({module: [module] for module in modules}, jobs)
+
+def run_test_targets(targets, jobs=None):
+    """Run the unittest targets of each module in its own process, several at a time."""
+    jobs = jobs or os.cpu_count() or 1
+    success = True
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(
+                subprocess.run,
+                [sys.executable, '-m', 'unittest', '-v', *names],
+                cwd=PROJECT_ROOT_STR,
+                capture_output=True,
+                text=True,
+            ): module
+            for module, names in targets.items()
+        }
+        # Print each module's report as a whole so parallel output doesn't interleave
+        for future in as_completed(futures):
+            result = future.result()
+            print(f"\n--- {futures[future]} ---")
+            print(result.stdout + result.stderr)
+            success = success and result.returncode == 0
+    
+    return success
+
+def run_unit_tests(jobs=None):
     """Run all unit tests."""
     print("Running unit tests...")
-    
-    # Discover and run unit tests
-    loader = unittest.TestLoader()
-    start_dir = project_root / 'tests'
-    suite = loader.discover(start_dir, pattern='test_*.py')
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return result.wasSuccessful()
+    return run_test_modules('test_*.py', jobs)
 
-def run_integration_tests():
+def run_integration_tests(jobs=None):
     """Run integration tests."""
     print("Running integration tests...")
-    
-    # Run integration tests specifically
-    loader = unittest.TestLoader()
-    start_dir = project_root / 'tests'
-    suite = loader.discover(start_dir, pattern='test_integration.py')
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return result.wasSuccessful()
+    return run_test_modules('test_integration.py', jobs)
 
-def run_specific_test(test_name):
-    """Run a specific test."""
+def run_specific_test(test_name, jobs=None):
+    """Run a specific test file, test class or test method."""
     print(f"Running specific test: {test_name}")
-    
-    loader = unittest.TestLoader()
-    start_dir = project_root / 'tests'
-    suite = loader.discover(start_dir, pattern=f'{test_name}.py')
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return result.wasSuccessful()
+    if find_test_modules(f'{test_name}.py'):
+        return run_test_modules(f'{test_name}.py', jobs)
+    
+    # Otherwise match class or method names, e.g. TestModels or TestModels.test_x
+    targets = {}
+    for module, entry in index_test_names().items():
+        for name in entry['names']:
+            if name == test_name or name.endswith(f'.{test_name}'):
+                targets.setdefault(module, []).append(f'{module}.{name}')
+    if not targets:
+        print(f"No tests match {test_name}")
+        return True
+    return run_test_targets(targets, jobs)
 
-def run_all_tests():
+def run_all_tests(jobs=None):
     """Run all tests (unit and integration)."""
     print("Running all tests...")
     
     # Run unit tests
-    unit_success = run_unit_tests()
+    unit_success = run_unit_tests(jobs)
     print("\n" + "="*50 + "\n")
     
     # Run integration tests
-    integration_success = run_integration_tests()
+    integration_success = run_integration_tests(jobs)
     
     return unit_success and integration_success
 
@@ -72,8 +154,10 @@ def main():
     parser = argparse.ArgumentParser(description='Run SendApi tests')
     parser.add_argument('--unit', action='store_true', help='Run only unit tests')
     parser.add_argument('--integration', action='store_true', help='Run only integration tests')
-    parser.add_argument('--test', type=str, help='Run a specific test file (without .py extension)')
+    parser.add_argument('--test', type=str, help='Run a specific test file (without .py extension), class or method')
     parser.add_argument('--all', action='store_true', help='Run all tests (default)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Number of test modules to run in parallel (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -85,13 +169,13 @@ def main():
     
     try:
         if args.unit:
-            success = run_unit_tests()
+            success = run_unit_tests(args.jobs)
         elif args.integration:
-            success = run_integration_tests()
+            success = run_integration_tests(args.jobs)
         elif args.test:
-            success = run_specific_test(args.test)
+            success = run_specific_test(args.test, args.jobs)
         elif args.all:
-            success = run_all_tests()
+            success = run_all_tests(args.jobs)
         
         print("\n" + "="*50)
         if success:
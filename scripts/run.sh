@@ -6,7 +6,7 @@ echo
 # Check if Python is installed
 if ! command -v python3 &> /dev/null; then
     echo "Python 3 is not installed or not in PATH."
-    echo "Please install Python 3.8 or higher"
+    echo "Please install Python 3.10 or higher"
     exit 1
 fi
 
@@ -8,6 +8,8 @@ import json
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any
 import argparse
@@ -17,34 +19,82 @@ import yaml
 class SecurityScanner:
     """Security scanner for the SendApi project"""
     
-    def __init__(self, project_root: str = "."):
+    def __init__(self, project_root: str = ".", timeout_s: float = 300,
+                 fail_fast: bool = False):
         self.project_root = Path(project_root)
+        # Per-tool time limit; a hung scanner is killed and reported as an error
+        self.timeout_s = timeout_s
+        # Stop at the first check that cannot run instead of running them all
+        self.fail_fast = fail_fast
         self.reports_dir = self.project_root / "security-reports"
         self.reports_dir.mkdir(exist_ok=True)
         
+        # Report paths and argv for each tool, built once per scanner
+        self._reports = {
+            name: self.reports_dir / f"{name}-report.json"
+            for name in ("safety", "bandit", "semgrep", "pip-audit")
+        }
+        self._cmds = {
+            "safety": ("safety", "scan", "--json"),
+            "bandit": (
+                "bandit", "-r", "src/", "-f", "json",
+                "-o", str(self._reports["bandit"])
+            ),
+            "semgrep": (
+                "semgrep", "ci", "--config", "auto", "--json",
+                "--output", str(self._reports["semgrep"])
+            ),
+            "pip-audit": (
+                "pip-audit", "--format", "json",
+                "--output", str(self._reports["pip-audit"])
+            ),
+            "black": ("black", "--check", "--diff", "src/", "tests/", "main.py"),
+            "flake8": (
+                "flake8", "src/", "tests/", "main.py",
+                "--max-line-length=88", "--extend-ignore=E203,W503"
+            ),
+            "mypy": (
+                "mypy", "src/", "--ignore-missing-imports", "--disallow-untyped-defs"
+            ),
+            "tests": (
+                "python", "-m", "pytest", "tests/", "-v", "--cov=src",
+                "--cov-report=html:" + str(self.reports_dir / "htmlcov"),
+                "--cov-report=xml:" + str(self.reports_dir / "coverage.xml")
+            ),
+        }
+        
     def run_safety_check(self) -> Dict[str, Any]:
         """Run Safety dependency vulnerability check"""
         print("🔍 Running Safety dependency vulnerability check...")
+        report_path = self._reports["safety"]
         try:
             # Use 'safety scan' instead of 'safety check'
-            result = subprocess.run(
-                ["safety", "scan", "--json"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root
-            )
+            # The JSON report goes straight from the child's stdout to disk
+            with open(report_path, "wb") as report:
+                result = subprocess.run(
+                    self._cmds["safety"],
+                    stdout=report,
+                    stderr=subprocess.PIPE,
+                    cwd=self.project_root,
+                    timeout=self.timeout_s
+                )
             
             if result.returncode == 0:
-                with open(self.reports_dir / "safety-report.json", "w") as f:
-                    f.write(result.stdout)
                 print("✅ Safety scan passed")
-                return {"status": "passed", "output": result.stdout}
+                return {"status": "passed", "report": str(report_path)}
             else:
-                with open(self.reports_dir / "safety-report.json", "w") as f:
-                    f.write(result.stdout)
                 print("⚠️ Safety scan found vulnerabilities")
-                return {"status": "failed", "output": result.stderr}
+                return {
+                    "status": "failed",
+                    "output": result.stderr.decode(errors="replace"),
+                }
                 
+        except subprocess.TimeoutExpired:
+            print(f"❌ Safety timed out after {self.timeout_s}s")
+            return {
+                "status": "error",
+                "message": f"Safety timed out after {self.timeout_s}s",
+            }
         except FileNotFoundError:
             print("❌ Safety not installed. Install with: pip install safety")
             return {"status": "error", "message": "Safety not installed"}
@@ -52,19 +102,33 @@ class SecurityScanner:
     def run_bandit_check(self) -> Dict[str, Any]:
         """Run Bandit security linter"""
         print("🔍 Running Bandit security linter...")
+        report_path = self._reports["bandit"]
         try:
-            result = subprocess.run([
-                "bandit", "-r", "src/", "-f", "json", 
-                "-o", str(self.reports_dir / "bandit-report.json")
-            ], capture_output=True, text=True, cwd=self.project_root)
+            # Bandit writes the report itself; only stderr is kept for errors
+            result = subprocess.run(
+                self._cmds["bandit"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                cwd=self.project_root,
+                timeout=self.timeout_s
+            )
             
             if result.returncode == 0:
                 print("✅ Bandit check passed")
-                return {"status": "passed", "output": result.stdout}
+                return {"status": "passed", "report": str(report_path)}
             else:
                 print("⚠️ Bandit found security issues")
-                return {"status": "failed", "output": result.stderr}
+                return {
+                    "status": "failed",
+                    "output": result.stderr.decode(errors="replace"),
+                }
                 
+        except subprocess.TimeoutExpired:
+            print(f"❌ Bandit timed out after {self.timeout_s}s")
+            return {
+                "status": "error",
+                "message": f"Bandit timed out after {self.timeout_s}s",
+            }
         except FileNotFoundError:
             print("❌ Bandit not installed. Install with: pip install bandit")
             return {"status": "error", "message": "Bandit not installed"}
@@ -72,19 +136,33 @@ class SecurityScanner:
     def run_semgrep_check(self) -> Dict[str, Any]:
         """Run Semgrep static analysis"""
         print("🔍 Running Semgrep static analysis...")
+        report_path = self._reports["semgrep"]
         try:
-            result = subprocess.run([
-                "semgrep", "ci", "--config", "auto", "--json",
-                "--output", str(self.reports_dir / "semgrep-report.json")
-            ], capture_output=True, text=True, cwd=self.project_root)
+            # Semgrep writes the report itself; only stderr is kept for errors
+            result = subprocess.run(
+                self._cmds["semgrep"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                cwd=self.project_root,
+                timeout=self.timeout_s
+            )
             
             if result.returncode == 0:
                 print("✅ Semgrep check passed")
-                return {"status": "passed", "output": result.stdout}
+                return {"status": "passed", "report": str(report_path)}
             else:
                 print("⚠️ Semgrep found issues")
-                return {"status": "failed", "output": result.stderr}
+                return {
+                    "status": "failed",
+                    "output": result.stderr.decode(errors="replace"),
+                }
                 
+        except subprocess.TimeoutExpired:
+            print(f"❌ Semgrep timed out after {self.timeout_s}s")
+            return {
+                "status": "error",
+                "message": f"Semgrep timed out after {self.timeout_s}s",
+            }
         except FileNotFoundError:
             print("❌ Semgrep not installed. Install with: pip install semgrep")
             return {"status": "error", "message": "Semgrep not installed"}
@@ -92,19 +170,33 @@ class SecurityScanner:
     def run_pip_audit(self) -> Dict[str, Any]:
         """Run pip-audit for package vulnerabilities"""
         print("🔍 Running pip-audit...")
+        report_path = self._reports["pip-audit"]
         try:
-            result = subprocess.run([
-                "pip-audit", "--format", "json",
-                "--output", str(self.reports_dir / "pip-audit-report.json")
-            ], capture_output=True, text=True, cwd=self.project_root)
+            # pip-audit writes the report itself; only stderr is kept for errors
+            result = subprocess.run(
+                self._cmds["pip-audit"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                cwd=self.project_root,
+                timeout=self.timeout_s
+            )
             
             if result.returncode == 0:
                 print("✅ pip-audit check passed")
-                return {"status": "passed", "output": result.stdout}
+                return {"status": "passed", "report": str(report_path)}
             else:
                 print("⚠️ pip-audit found vulnerabilities")
-                return {"status": "failed", "output": result.stderr}
+                return {
+                    "status": "failed",
+                    "output": result.stderr.decode(errors="replace"),
+                }
                 
+        except subprocess.TimeoutExpired:
+            print(f"❌ pip-audit timed out after {self.timeout_s}s")
+            return {
+                "status": "error",
+                "message": f"pip-audit timed out after {self.timeout_s}s",
+            }
         except FileNotFoundError:
             print("❌ pip-audit not installed. Install with: pip install pip-audit")
             return {"status": "error", "message": "pip-audit not installed"}
@@ -112,59 +204,103 @@ class SecurityScanner:
     def run_code_quality_checks(self) -> Dict[str, Any]:
         """Run code quality checks"""
         print("🔍 Running code quality checks...")
-        results = {}
         
-        # Black formatting check
+        # The linters are independent processes, so run them side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                "black": executor.submit(self._run_black),
+                "flake8": executor.submit(self._run_flake8),
+                "mypy": executor.submit(self._run_mypy),
+            }
+            results = {name: future.result() for name, future in futures.items()}
+
+        # Overall status, so --fail-fast and the summary treat it like any check
+        statuses = {result["status"] for result in results.values()}
+        if "error" in statuses:
+            status = "error"
+        elif "failed" in statuses:
+            status = "failed"
+        else:
+            status = "passed"
+        return {"status": status, **results}
+    
+    def _run_black(self) -> Dict[str, Any]:
+        """Black formatting check"""
         try:
             result = subprocess.run(
-                ["black", "--check", "--diff", "src/", "tests/", "main.py"],
+                self._cmds["black"],
                 capture_output=True,
                 text=True,
-                cwd=self.project_root
+                cwd=self.project_root,
+                timeout=self.timeout_s
             )
-            results["black"] = {
+            return {
                 "status": "passed" if result.returncode == 0 else "failed",
                 "output": result.stdout if result.returncode == 0 else result.stderr
             }
+        except subprocess.TimeoutExpired:
+            return {
+                "status": "error",
+                "message": f"Black timed out after {self.timeout_s}s",
+            }
         except FileNotFoundError:
-            results["black"] = {"status": "error", "message": "Black not installed"}
-        
-        # Flake8 linting
+            return {"status": "error", "message": "Black not installed"}
+    
+    def _run_flake8(self) -> Dict[str, Any]:
+        """Flake8 linting"""
         try:
-            result = subprocess.run([
-                "flake8", "src/", "tests/", "main.py",
-                "--max-line-length=88", "--extend-ignore=E203,W503"
-            ], capture_output=True, text=True, cwd=self.project_root)
-            results["flake8"] = {
+            result = subprocess.run(
+                self._cmds["flake8"],
+                capture_output=True,
+                text=True,
+                cwd=self.project_root,
+                timeout=self.timeout_s
+            )
+            return {
                 "status": "passed" if result.returncode == 0 else "failed",
                 "output": result.stdout if result.returncode == 0 else result.stderr
             }
+        except subprocess.TimeoutExpired:
+            return {
+                "status": "error",
+                "message": f"Flake8 timed out after {self.timeout_s}s",
+            }
         except FileNotFoundError:
-            results["flake8"] = {"status": "error", "message": "Flake8 not installed"}
-        
-        # MyPy type checking
+            return {"status": "error", "message": "Flake8 not installed"}
+    
+    def _run_mypy(self) -> Dict[str, Any]:
+        """MyPy type checking"""
         try:
-            result = subprocess.run([
-                "mypy", "src/", "--ignore-missing-imports", "--disallow-untyped-defs"
-            ], capture_output=True, text=True, cwd=self.project_root)
-            results["mypy"] = {
+            result = subprocess.run(
+                self._cmds["mypy"],
+                capture_output=True,
+                text=True,
+                cwd=self.project_root,
+                timeout=self.timeout_s
+            )
+            return {
                 "status": "passed" if result.returncode == 0 else "failed",
                 "output": result.stdout if result.returncode == 0 else result.stderr
             }
+        except subprocess.TimeoutExpired:
+            return {
+                "status": "error",
+                "message": f"MyPy timed out after {self.timeout_s}s",
+            }
         except FileNotFoundError:
-            results["mypy"] = {"status": "error", "message": "MyPy not installed"}
-        
-        return results
+            return {"status": "error", "message": "MyPy not installed"}
     
     def run_tests(self) -> Dict[str, Any]:
         """Run test suite"""
         print("🔍 Running tests...")
         try:
-            result = subprocess.run([
-                "python", "-m", "pytest", "tests/", "-v", "--cov=src", 
-                "--cov-report=html:" + str(self.reports_dir / "htmlcov"),
-                "--cov-report=xml:" + str(self.reports_dir / "coverage.xml")
-            ], capture_output=True, text=True, cwd=self.project_root)
+            result = subprocess.run(
+                self._cmds["tests"],
+                capture_output=True,
+                text=True,
+                cwd=self.project_root,
+                timeout=self.timeout_s
+            )
             
             if result.returncode == 0:
                 print("✅ Tests passed")
@@ -173,6 +309,12 @@ class SecurityScanner:
                 print("❌ Tests failed")
                 return {"status": "failed", "output": result.stderr}
                 
+        except subprocess.TimeoutExpired:
+            print(f"❌ Tests timed out after {self.timeout_s}s")
+            return {
+                "status": "error",
+                "message": f"Tests timed out after {self.timeout_s}s",
+            }
         except Exception as e:
             return {"status": "error", "message": str(e)}
     
@@ -183,7 +325,7 @@ class SecurityScanner:
         print("="*60)
         
         summary = {
-            "timestamp": subprocess.run(["date"], capture_output=True, text=True).stdout.strip(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "project": "SendApi",
             "results": results
         }
@@ -209,14 +351,29 @@ class SecurityScanner:
         """Run all security checks"""
         print("🚀 Starting comprehensive security scan...")
         
-        results = {
-            "safety": self.run_safety_check(),
-            "bandit": self.run_bandit_check(),
-            "semgrep": self.run_semgrep_check(),
-            "pip_audit": self.run_pip_audit(),
-            "code_quality": self.run_code_quality_checks(),
-            "tests": self.run_tests()
-        }
+        checks = [
+            ("safety", self.run_safety_check),
+            ("bandit", self.run_bandit_check),
+            ("semgrep", self.run_semgrep_check),
+            ("pip_audit", self.run_pip_audit),
+            ("code_quality", self.run_code_quality_checks),
+            ("tests", self.run_tests),
+        ]
+        
+        if self.fail_fast:
+            # One at a time, so a missing or broken tool stops the scan early
+            results = {}
+            for name, check in checks:
+                results[name] = check()
+                if results[name].get("status") == "error":
+                    print(f"⛔ Stopping after {name} error (--fail-fast)")
+                    break
+        else:
+            # Every check is an independent subprocess writing its own report,
+            # so they can all run at once
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = {name: executor.submit(check) for name, check in checks}
+                results = {name: future.result() for name, future in futures.items()}
         
         self.generate_summary_report(results)
         return results
@@ -226,12 +383,28 @@ def main():
     """Main function"""
     parser = argparse.ArgumentParser(description="Security scanner for SendApi project")
     parser.add_argument("--project-root", default=".", help="Project root directory")
-    parser.add_argument("--check", choices=["safety", "bandit", "semgrep", "pip-audit", "quality", "tests", "all"], 
-                       default="all", help="Specific check to run")
+    parser.add_argument(
+        "--check",
+        choices=[
+            "safety",
+            "bandit",
+            "semgrep",
+            "pip-audit",
+            "quality",
+            "tests",
+            "all",
+        ],
+        default="all",
+        help="Specific check to run",
+    )
+    parser.add_argument("--timeout", type=float, default=300,
+                       help="Seconds each tool may run before it is killed")
+    parser.add_argument("--fail-fast", action="store_true",
+                       help="Run checks one at a time and stop at the first error")
     
     args = parser.parse_args()
     
-    scanner = SecurityScanner(args.project_root)
+    scanner = SecurityScanner(args.project_root, args.timeout, args.fail_fast)
     
     if args.check == "all":
         scanner.run_all_checks()
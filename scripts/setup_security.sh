@@ -39,7 +39,7 @@ check_python() {
         PYTHON_VERSION=$(python3 --version)
         print_success "Python found: $PYTHON_VERSION"
     else
-        print_error "Python3 is not installed. Please install Python 3.8+ first."
+        print_error "Python3 is not installed. Please install Python 3.10+ first."
         exit 1
     fi
 }
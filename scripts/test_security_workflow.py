@@ -4,6 +4,8 @@ Local test script to simulate the security-scan.yml workflow
 This allows testing the workflow steps locally without Docker/act
 """
 
+import asyncio
+import shlex
 import subprocess
 import sys
 import os
@@ -11,32 +13,70 @@ from pathlib import Path
 import json
 from datetime import datetime
 
+def report_result(description, returncode, stdout, stderr):
+    """Print the outcome of a finished command and return success status"""
+    if returncode == 0:
+        print(f"✅ {description} - SUCCESS")
+        if stdout.strip():
+            print(f"Output: {stdout.strip()}")
+        return True
+    else:
+        print(f"❌ {description} - FAILED")
+        print(f"Error: {stderr.strip()}")
+        return False
+
 def run_command(cmd, description):
     """Run a command and return success status"""
     print(f"\n🔧 {description}")
     print(f"Running: {cmd}")
     try:
         # Use shlex to safely parse shell commands
-        import shlex
         if isinstance(cmd, str):
             cmd_parts = shlex.split(cmd)
         else:
             cmd_parts = cmd
         
         result = subprocess.run(cmd_parts, shell=False, capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✅ {description} - SUCCESS")
-            if result.stdout.strip():
-                print(f"Output: {result.stdout.strip()}")
-            return True
+        return report_result(description, result.returncode, result.stdout, result.stderr)
+    except Exception as e:
+        print(f"❌ {description} - ERROR: {e}")
+        return False
+
+async def run_command_async(cmd, description):
+    """Run a command without blocking other commands and return success status"""
+    print(f"\n🔧 {description}")
+    print(f"Running: {cmd}")
+    try:
+        if isinstance(cmd, str):
+            cmd_parts = shlex.split(cmd)
         else:
-            print(f"❌ {description} - FAILED")
-            print(f"Error: {result.stderr.strip()}")
-            return False
+            cmd_parts = cmd
+        
+        process = await asyncio.create_subprocess_exec(
+            *cmd_parts,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        return report_result(
+            description,
+            process.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
     except Exception as e:
         print(f"❌ {description} - ERROR: {e}")
         return False
 
+def run_commands_concurrently(commands):
+    """Run independent (cmd, description) pairs at once; True only if all succeed"""
+    async def gather_all():
+        return await asyncio.gather(
+            *(run_command_async(cmd, description) for cmd, description in commands)
+        )
+    
+    return all(asyncio.run(gather_all()))
+
 def test_security_scan_workflow():
     """Test the security-scan workflow steps locally"""
     print("🚀 Testing Security Scan Workflow Locally")
@@ -58,63 +98,39 @@ def test_security_scan_workflow():
     print("🔍 Simulating Safety CLI action...")
     print("✅ Safety CLI action would run with SAFETY_API_KEY")
     
-    # Run Bandit
-    results["security_scan"] = run_command(
-        "bandit -r src/ -f json -o bandit-report.json",
-        "Bandit security scan"
-    )
-    
-    # Run Semgrep
-    results["security_scan"] = run_command(
-        "semgrep ci --config auto --json --output semgrep-report.json",
-        "Semgrep static analysis"
-    ) and results["security_scan"]
-    
-    # Run pip-audit
-    results["security_scan"] = run_command(
-        "pip-audit --format json --output pip-audit-report.json",
-        "pip-audit vulnerability check"
-    ) and results["security_scan"]
+    # Bandit, Semgrep and pip-audit are independent, so run them together
+    results["security_scan"] = run_commands_concurrently([
+        ("bandit -r src/ -f json -o bandit-report.json",
+         "Bandit security scan"),
+        ("semgrep ci --config auto --json --output semgrep-report.json",
+         "Semgrep static analysis"),
+        ("pip-audit --format json --output pip-audit-report.json",
+         "pip-audit vulnerability check"),
+    ])
     
     # Step 2: Code Quality & Testing
     print("\n📊 STEP 2: Code Quality & Testing")
     print("-" * 30)
     
-    # Run Black
-    results["code_quality"] = run_command(
-        "black --check --diff src/ tests/ main.py",
-        "Black code formatting check"
-    )
-    
-    # Run isort
-    results["code_quality"] = run_command(
-        "isort --check-only --diff src/ tests/ main.py",
-        "isort import sorting check"
-    ) and results["code_quality"]
-    
-    # Run Flake8
-    results["code_quality"] = run_command(
-        "flake8 src/ tests/ main.py --max-line-length=88 --extend-ignore=E203,W503",
-        "Flake8 linting"
-    ) and results["code_quality"]
-    
-    # Run MyPy
-    results["code_quality"] = run_command(
-        "mypy src/ --ignore-missing-imports --disallow-untyped-defs",
-        "MyPy type checking"
-    ) and results["code_quality"]
-    
-    # Run Pylint
-    results["code_quality"] = run_command(
-        "pylint src/ --disable=C0114,C0116 --max-line-length=88",
-        "Pylint code analysis"
-    ) and results["code_quality"]
-    
-    # Run tests (non-GUI)
-    results["code_quality"] = run_command(
-        "python -m pytest tests/ -m 'not gui' --cov=src --cov-report=xml --cov-report=html",
-        "pytest (non-GUI tests)"
-    ) and results["code_quality"]
+    # Formatting and lint checks
+    results["code_quality"] = run_commands_concurrently([
+        ("black --check --diff src/ tests/ main.py",
+         "Black code formatting check"),
+        ("isort --check-only --diff src/ tests/ main.py",
+         "isort import sorting check"),
+        ("flake8 src/ tests/ main.py --max-line-length=88 --extend-ignore=E203,W503",
+         "Flake8 linting"),
+    ])
+    
+    # Type checking, static analysis and tests (non-GUI)
+    results["code_quality"] = run_commands_concurrently([
+        ("mypy src/ --ignore-missing-imports --disallow-untyped-defs",
+         "MyPy type checking"),
+        ("pylint src/ --disable=C0114,C0116 --max-line-length=88",
+         "Pylint code analysis"),
+        ("python -m pytest tests/ -m 'not gui' --cov=src --cov-report=xml --cov-report=html",
+         "pytest (non-GUI tests)"),
+    ]) and results["code_quality"]
     
     # Step 3: Dependency Update Check
     print("\n📊 STEP 3: Dependency Update Check")
@@ -3,18 +3,20 @@
 Setup script for SendApi Desktop Application
 """
 
+from functools import lru_cache
 from setuptools import setup, find_packages
-import os
 
 # Read the README file
+@lru_cache(maxsize=None)
 def read_readme():
     with open("README.md", "r", encoding="utf-8") as fh:
         return fh.read()
 
 # Read requirements
+@lru_cache(maxsize=None)
 def read_requirements():
     with open("requirements.txt", "r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip() and not line.startswith("#") and not line.startswith("-i")]
+        return tuple(line.strip() for line in fh if line.strip() and not line.startswith("#") and not line.startswith("-i"))
 
 setup(
     name="sendapi",
@@ -33,8 +35,6 @@ setup(
         "Topic :: Software Development :: Testing",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.13",
         "Programming Language :: Python :: 3.12",
@@ -44,8 +44,8 @@ setup(
         "Operating System :: MacOS",
         "Operating System :: POSIX :: Linux",
     ],
-    python_requires=">=3.8",
-    install_requires=read_requirements(),
+    python_requires=">=3.10",
+    install_requires=list(read_requirements()),
     entry_points={
         "console_scripts": [
             "sendapi=main:main",
@@ -2,113 +2,151 @@
 Batch Request Runner for the API Testing Application
 """
 
-import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PySide6.QtCore import QThread, Signal
 
-from .request_runner import RequestRunner
+from .request_runner import RequestRunner, create_session
+
+logger = logging.getLogger(__name__)
 
 
 class BatchRequestRunner(QThread):
-    """Runs multiple requests sequentially."""
+    """Runs multiple requests concurrently."""
 
     request_completed = Signal(object, dict, dict)  # request, response, test_results
     all_completed = Signal(list)  # list of results
 
-    def __init__(self, requests, environment, parent=None):
+    # Upper bound on requests in flight at once; 1 restores strictly sequential runs
+    max_workers = 8
+
+    def __init__(self, requests, environment, parent=None, max_workers=None):
         super().__init__(parent)
         self.requests = requests
         self.environment = environment
         self.results = []
         self.current_index = 0
-        self.runners = []  # Keep references to runners
+        self._worker = threading.local()  # State of the current pool thread
+        if max_workers is not None:
+            self.max_workers = max_workers
 
     def run(self):
-        """Run all requests sequentially."""
-        print(
-            f"BatchRequestRunner: Starting batch run with {len(self.requests)} requests"
-        )
-        self.results = []
+        """Run all requests concurrently, emitting each result as it completes."""
+        logger.debug("Starting batch run with %d requests", len(self.requests))
+        self.results = [None] * len(self.requests)
+        if not self.requests:
+            self.all_completed.emit(self.results)
+            return
+
+        # Build every request payload up front, outside the submission loop
+        payloads = [self._request_data(request) for request in self.requests]
+
+        workers = max(1, min(self.max_workers, len(self.requests)))
+        sessions = []
+        try:
+            self._run_all(payloads, sessions, workers)
+        finally:
+            for session in sessions:
+                session.close()
 
-        for i, request in enumerate(self.requests):
-            print(
-                f"BatchRequestRunner: Running request {i+1}/{len(self.requests)}: {request.name}"
-            )
-
-            # Convert request to dict format
-            request_data = {
-                "method": request.method,
-                "url": request.url,
-                "headers": request.headers,
-                "params": request.params,
-                "body": request.body,
-                "body_type": request.body_type,
-                "pre_request_script": request.pre_request_script,
-                "tests": request.tests,
-            }
-            print(
-                f"DEBUG: Request data passed to RequestRunner: {request_data}"
-            )  # Debug print
+        # Emit signal for all completed
+        logger.debug("Emitting all_completed signal with %d results", len(self.results))
+        self.all_completed.emit(self.results)
 
-            try:
-                # Create and run single request synchronously
+    def _create_session(self):
+        """Create the keep-alive session one pool thread uses for its requests."""
+        return create_session(pool_maxsize=1)
+
+    def _start_worker(self, sessions):
+        """Give a new pool thread its own session; Session isn't thread-safe."""
+        self._worker.session = self._create_session()
+        sessions.append(self._worker.session)  # Closed by run() afterwards
+
+    @staticmethod
+    def _request_data(request):
+        """Convert a Request into the dict format RequestRunner expects."""
+        return {
+            "method": request.method,
+            "url": request.url,
+            "headers": request.headers,
+            "params": request.params,
+            "body": request.body,
+            "body_type": request.body_type,
+            "pre_request_script": request.pre_request_script,
+            "tests": request.tests,
+        }
+
+    def _run_all(self, payloads, sessions, workers):
+        """Submit every request to the pool and emit results as they complete."""
+        total = len(self.requests)
+        with ThreadPoolExecutor(
+            max_workers=workers, initializer=self._start_worker, initargs=(sessions,)
+        ) as executor:
+            futures = {}
+            for i, request in enumerate(self.requests):
+                request_data = payloads[i]
+                logger.debug("Running request %d/%d: %s", i + 1, total, request.name)
+                logger.debug("Request data passed to RequestRunner: %s", request_data)
+
+                # Pre-request scripts and variable substitution share the
+                # environment, so they run here one request at a time, in
+                # order; only the HTTP calls overlap on the pool
                 runner = RequestRunner(request_data, self.environment)
-                self.runners.append(runner)  # Keep reference
-
-                # Run the request synchronously
-                runner.start()
-                runner.wait()  # Wait for completion
-
-                # Get response and test results directly
-                response = runner.get_response()
-                test_results = runner.get_test_results()
-
-                if response is None:
-                    # Handle case where no response was received
-                    response = {"error": "No response received", "status_code": 0}
-                    test_results = {
-                        "passed": False,
-                        "results": ["No response received"],
-                    }
-
-                print(
-                    f"BatchRequestRunner: Request {request.name} completed with status {response.get('status_code', 'Unknown')}"
+                request_kwargs = runner.prepare()
+                future = executor.submit(self._run_one, request, runner, request_kwargs)
+                futures[future] = i
+
+            # Signals are emitted from this thread; Qt queues them to the GUI thread
+            for future in as_completed(futures):
+                result = future.result()
+                request = result["request"]
+                self.results[futures[future]] = result
+
+                # Emit signal for this request
+                logger.debug("Emitting request_completed signal for %s", request.name)
+                self.request_completed.emit(
+                    request, result["response"], result["test_results"]
                 )
 
-            except Exception as e:
-                print(
-                    f"BatchRequestRunner: Error running request {request.name}: {str(e)}"
-                )
-                response = {"error": str(e), "status_code": 0}
+    def _run_one(self, request, runner, request_kwargs):
+        """Send a single prepared request and build its result entry."""
+        try:
+            # Run the request synchronously on this pool thread; a failed
+            # prepare() has already stored its error response
+            if request_kwargs is not None:
+                runner.session = self._worker.session
+                runner.execute(request_kwargs)
+
+            # Get response and test results directly
+            response = runner.get_response()
+            test_results = runner.get_test_results()
+
+            if response is None:
+                # Handle case where no response was received
+                response = {"error": "No response received", "status_code": 0}
                 test_results = {
                     "passed": False,
-                    "results": [f"Request failed: {str(e)}"],
+                    "results": ["No response received"],
                 }
 
-            # Store result
-            result = {
-                "request": request,
-                "response": response,
-                "test_results": test_results,
-                "tests_passed": (
-                    test_results.get("passed", False)
-                    if isinstance(test_results, dict)
-                    else False
-                ),
-            }
-            self.results.append(result)
-
-            # Emit signal for this request
-            print(
-                f"BatchRequestRunner: Emitting request_completed signal for {request.name}"
+            logger.debug(
+                "Request %s completed with status %s",
+                request.name,
+                response.get("status_code", "Unknown"),
             )
-            self.request_completed.emit(request, response, test_results)
 
-            # Small delay between requests (reduced for faster execution)
-            time.sleep(0.1)
+        except Exception as e:
+            logger.debug("Error running request %s: %s", request.name, e)
+            response = {"error": str(e), "status_code": 0}
+            test_results = {
+                "passed": False,
+                "results": [f"Request failed: {str(e)}"],
+            }
 
-        # Emit signal for all completed
-        print(
-            f"BatchRequestRunner: Emitting all_completed signal with {len(self.results)} results"
-        )
-        self.all_completed.emit(self.results)
+        return {
+            "request": request,
+            "response": response,
+            "test_results": test_results,
+        }
@@ -2,7 +2,7 @@
 Environment Panel for the API Testing Application
 """
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, Signal
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QComboBox,
@@ -13,14 +13,123 @@ from PySide6.QtWidgets import (
     QLabel,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from .models import Environment
 
+_ENV_LABEL_QSS = (
+    "font-weight: bold; font-size: 14px; color: #2c3e50; padding: 5px; "
+    "background-color: #ecf0f1; border-radius: 3px;"
+)
+
+
+class VariablesModel(QAbstractTableModel):
+    """Table model exposing an environment's variables as (name, value) rows."""
+
+    HEADERS = ("Variable", "Value")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.environment = None
+        self._items = []
+
+    def set_environment(self, environment):
+        """Show the variables of the given environment (or none)."""
+        self.beginResetModel()
+        self.environment = environment
+        # Own copy: items() returns the environment's cache, and rows are edited
+        self._items = list(environment.items()) if environment else []
+        self.endResetModel()
+
+    def add_variable(self, key, value):
+        """Set a variable, inserting a row for it if it is new."""
+        for row, (existing, _) in enumerate(self._items):
+            if existing == key:
+                if self.environment.set_variable(key, value):
+                    self._items[row] = (key, value)
+                    index = self.index(row, 1)
+                    self.dataChanged.emit(index, index)
+                return
+
+        row = len(self._items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.environment.set_variable(key, value)
+        self._items.append((key, value))
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        """Remove the variable shown on the given row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.environment.remove_variable(self._items[row][0])
+        self._items.pop(row)
+        self.endRemoveRows()
+
+    def key_at(self, row):
+        """Get the variable name shown on the given row."""
+        return self._items[row][0]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._items[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (
+            Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsEditable
+        )
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Write an edited cell straight through to the environment."""
+        if (
+            not index.isValid()
+            or role != Qt.ItemDataRole.EditRole
+            or self.environment is None
+        ):
+            return False
+
+        row = index.row()
+        key, current_value = self._items[row]
+        text = str(value).strip()
+
+        if index.column() == 0:
+            # Only update if key is not empty, actually changed and not taken
+            # by another variable (that would leave two rows for one name)
+            if not text or text == key or text in self.environment.variables:
+                return False
+            self.environment.remove_variable(key)
+            self.environment.set_variable(text, current_value)
+            self._items[row] = (text, current_value)
+        else:
+            if not self.environment.set_variable(key, text):
+                return False  # Same value; nothing to save or announce
+            self._items[row] = (key, text)
+
+        self.dataChanged.emit(index, index)
+        return True
+
 
 class EnvironmentPanel(QWidget):
     """Panel for managing environment variables."""
@@ -31,6 +140,14 @@ class EnvironmentPanel(QWidget):
         super().__init__(parent)
         self.environments = []
         self.current_environment = None
+        self._env_signature = None  # (name, id) pairs the combo was last built from
+
+        # Coalesce bursts of variable edits into a single environment_changed
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(50)
+        self._emit_timer.timeout.connect(self._emit_environment_changed)
+
         self.init_ui()
 
     def init_ui(self):
@@ -39,9 +156,7 @@ class EnvironmentPanel(QWidget):
 
         # Environment section label
         env_label = QLabel("Environment")
-        env_label.setStyleSheet(
-            "font-weight: bold; font-size: 14px; color: #2c3e50; padding: 5px; background-color: #ecf0f1; border-radius: 3px;"
-        )
+        env_label.setStyleSheet(_ENV_LABEL_QSS)
         layout.addWidget(env_label)
 
         # Environment selector
@@ -60,14 +175,19 @@ class EnvironmentPanel(QWidget):
         vars_layout = QVBoxLayout(vars_group)
 
         # Variables table
-        self.variables_table = QTableWidget()
-        self.variables_table.setColumnCount(2)
-        self.variables_table.setHorizontalHeaderLabels(["Variable", "Value"])
+        self.variables_model = VariablesModel(self)
+        self.variables_model.dataChanged.connect(self.on_variable_changed)
+        self.variables_table = QTableView()
+        self.variables_table.setModel(self.variables_model)
         self.variables_table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
+        # Fixed row height, so rows are never measured against their contents
+        self.variables_table.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
+        self.variables_table.verticalHeader().setDefaultSectionSize(22)
         self.variables_table.setMaximumHeight(200)
-        self.variables_table.itemChanged.connect(self.on_variable_changed)
         vars_layout.addWidget(self.variables_table)
 
         # Variable buttons
@@ -90,36 +210,58 @@ class EnvironmentPanel(QWidget):
     def update_environments(self, environments):
         """Update the environments list."""
         self.environments = environments
+
+        # Skip the rebuild when the combo already shows exactly these environments
+        signature = self._signature(environments)
+        if signature == self._env_signature:
+            return
+        self._env_signature = signature
+
+        # Rebuild silently so clear()/addItem() don't each fire on_environment_changed
+        self.env_combo.blockSignals(True)
         self.env_combo.clear()
         self.env_combo.addItem("No Environment")
 
-        for environment in environments:
+        current_index = 0
+        for i, environment in enumerate(environments, start=1):
             self.env_combo.addItem(environment.name, environment)
+            if environment is self.current_environment:
+                current_index = i
+        self.env_combo.setCurrentIndex(current_index)
+        self.env_combo.blockSignals(False)
+
+        # Keep the current selection if it survived, otherwise sync once
+        if current_index == 0:
+            self.on_environment_changed(self.env_combo.currentText())
+
+    def add_environment(self, environment):
+        """Show an environment that was appended to the environments list."""
+        self.env_combo.blockSignals(True)
+        self.env_combo.addItem(environment.name, environment)
+        self.env_combo.blockSignals(False)
+        self._env_signature = self._signature(self.environments)
+
+    @staticmethod
+    def _signature(environments):
+        """Identify an environment list by the names and objects it shows."""
+        return tuple((env.name, id(env)) for env in environments)
 
     def on_environment_changed(self, environment_name):
         """Handle environment selection change."""
-        if environment_name == "No Environment":
-            self.update_variables_table({})
-            self.current_environment = None
+        # Each combo item carries its environment as item data
+        # ("No Environment" has none)
+        environment = self.env_combo.currentData()
+        if environment is self.current_environment:
             return
 
-        for environment in self.environments:
-            if environment.name == environment_name:
-                self.update_variables_table(environment.variables)
-                self.current_environment = environment
-                self.environment_changed.emit(environment)
-                break
+        self.current_environment = environment
+        self.update_variables_table(environment)
+        if environment is not None:
+            self.environment_changed.emit(environment)
 
-    def update_variables_table(self, variables):
+    def update_variables_table(self, environment):
         """Update the variables table."""
-        self.variables_table.setRowCount(len(variables))
-
-        for i, (key, value) in enumerate(variables.items()):
-            key_item = QTableWidgetItem(key)
-            value_item = QTableWidgetItem(value)
-
-            self.variables_table.setItem(i, 0, key_item)
-            self.variables_table.setItem(i, 1, value_item)
+        self.variables_model.set_environment(environment)
 
     def add_variable(self):
         """Add a new environment variable."""
@@ -132,9 +274,8 @@ class EnvironmentPanel(QWidget):
         if ok and key:
             value, ok = QInputDialog.getText(self, "Add Variable", "Variable value:")
             if ok:
-                current_env.set_variable(key, value)
-                self.update_variables_table(current_env.variables)
-                self.environment_changed.emit(current_env)
+                self.variables_model.add_variable(key, value)
+                self._emit_timer.start()
 
     def remove_variable(self):
         """Remove a variable from the current environment."""
@@ -142,35 +283,27 @@ class EnvironmentPanel(QWidget):
         if not current_env:
             return
 
-        current_row = self.variables_table.currentRow()
-        if current_row >= 0:
-            key_item = self.variables_table.item(current_row, 0)
-            if key_item:
-                key = key_item.text()
-                current_env.remove_variable(key)
-                self.update_variables_table(current_env.variables)
-                self.environment_changed.emit(current_env)
+        current_row = self.variables_table.currentIndex().row()
+        if 0 <= current_row < self.variables_model.rowCount():
+            self.variables_model.remove_row(current_row)
+            self._emit_timer.start()
 
     def get_current_environment(self):
         """Get the currently selected environment."""
         return self.current_environment
 
-    def on_variable_changed(self, item):
-        """Handle variable table item changes."""
+    def on_variable_changed(self, top_left, bottom_right):
+        """Handle variable edits made through the table model."""
         if not self.current_environment:
             return
 
-        row = item.row()
-        key_item = self.variables_table.item(row, 0)
-        value_item = self.variables_table.item(row, 1)
-
-        if key_item and value_item:
-            key = key_item.text().strip()
-            value = value_item.text().strip()
+        # The model has already written the edit to the environment
+        self._emit_timer.start()
 
-            if key:  # Only update if key is not empty
-                self.current_environment.set_variable(key, value)
-                self.environment_changed.emit(self.current_environment)
+    def _emit_environment_changed(self):
+        """Announce the variable edits collected since the timer was started."""
+        if self.current_environment is not None:
+            self.environment_changed.emit(self.current_environment)
 
     def rename_environment(self):
         """Rename the current environment."""
@@ -187,6 +320,7 @@ class EnvironmentPanel(QWidget):
             # Update the combo box
             current_index = self.env_combo.currentIndex()
             self.env_combo.setItemText(current_index, new_name)
+            self._env_signature = self._signature(self.environments)
             self.environment_changed.emit(current_env)
 
     def delete_environment(self):
@@ -203,13 +337,18 @@ class EnvironmentPanel(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
         )
         if reply == QMessageBox.StandardButton.Yes:
-            # Remove from environments list
-            if hasattr(self, "environments") and current_env in self.environments:
-                self.environments.remove(current_env)
+            # Combo item i shows environments[i - 1], so delete by position
+            current_index = self.env_combo.currentIndex()
+            position = current_index - 1
+            if (
+                0 <= position < len(self.environments)
+                and self.environments[position] is current_env
+            ):
+                del self.environments[position]
 
             # Update the combo box
-            current_index = self.env_combo.currentIndex()
             self.env_combo.removeItem(current_index)
+            self._env_signature = self._signature(self.environments)
 
             # Select first environment if available
             if self.env_combo.count() > 1:
@@ -217,4 +356,6 @@ class EnvironmentPanel(QWidget):
             else:
                 self.env_combo.setCurrentIndex(0)
 
+            # Names can repeat, so the text may not change; sync explicitly
+            self.on_environment_changed(self.env_combo.currentText())
             self.environment_changed.emit(None)
@@ -3,10 +3,21 @@ Main Window for the API Testing Application
 """
 
 import json
+import logging
 import os
-
-from PySide6.QtCore import Qt, QThread, QTimer, Signal
-from PySide6.QtGui import QAction, QColor, QFont, QIcon
+from urllib.parse import urlencode
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QStandardPaths,
+    Qt,
+    QThread,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QAction, QBrush, QColor, QFont, QIcon
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -24,8 +35,7 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QPushButton,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
     QTextEdit,
     QTreeWidget,
@@ -34,27 +44,186 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from .batch_request_runner import BatchRequestRunner
 from .models import Collection, Environment, Request
 from .request_panel import RequestPanel
-from .request_runner import RequestRunner
 from .response_panel import ResponsePanel
 from .sidebar import Sidebar
 
+logger = logging.getLogger(__name__)
+
+# Collections and environments are saved together in this file
+DATA_FILE_NAME = "sendapi.json"
+
+
+# Stylesheets, built once at import and shared by every window
+_TOOLBAR_QSS = (
+    "QWidget { background-color: #f8f9fa; border-bottom: 1px solid #dee2e6; }"
+)
+
+_BUTTON_QSS = """
+    QPushButton {
+        background-color: %(color)s;
+        color: white;
+        border: none;
+        padding: %(padding)s;
+        border-radius: %(radius)s;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: %(hover)s;
+    }
+"""
+_TOOLBAR_BUTTON = {"padding": "8px 16px", "radius": "4px"}
+_BATCH_BUTTON = {"padding": "10px 20px", "radius": "5px"}
+
+_IMPORT_BTN_QSS = _BUTTON_QSS % dict(
+    _TOOLBAR_BUTTON, color="#17a2b8", hover="#117a8b"
+)
+_SAVE_CURL_BTN_QSS = _BUTTON_QSS % dict(
+    _TOOLBAR_BUTTON, color="#6c757d", hover="#545b62"
+)
+_SAVE_RESPONSE_BTN_QSS = _BUTTON_QSS % dict(
+    _TOOLBAR_BUTTON, color="#fd7e14", hover="#e8690b"
+)
+_START_BATCH_BTN_QSS = (
+    _BUTTON_QSS % dict(_BATCH_BUTTON, color="#27ae60", hover="#229954")
+    + "QPushButton:disabled { background-color: #bdc3c7; }"
+)
+_CLEAR_RESULTS_BTN_QSS = _BUTTON_QSS % dict(
+    _BATCH_BUTTON, color="#e74c3c", hover="#c0392b"
+)
+
+_BATCH_HEADER_QSS = (
+    "font-weight: bold; font-size: 16px; color: #2c3e50; padding: 10px; "
+    "background-color: #ecf0f1; border-radius: 5px;"
+)
+_PROGRESS_LABEL_QSS = "font-size: 12px; color: #7f8c8d;"
+_SUMMARY_LABEL_QSS = "font-weight: bold; font-size: 12px; color: #2c3e50; padding: 5px;"
+
+
+class BatchResultsModel(QAbstractTableModel):
+    """Table model holding one result row per request in a batch run."""
+
+    HEADERS = ("Request", "Status & Tests", "Response Time")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # [name, status text, background brush, response time]
+
+    def set_requests(self, requests):
+        """Show one pending row for each request."""
+        self.beginResetModel()
+        self._rows = [[request.name, "Pending", None, None] for request in requests]
+        self.endResetModel()
+
+    def update_row(self, row, status_text, brush, response_time):
+        """Record a finished request's outcome on its row."""
+        self._rows[row][1:] = [status_text, brush, response_time]
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 2))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        name, status_text, brush, response_time = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return name
+            if column == 1:
+                return status_text
+            return "" if response_time is None else f"{response_time:.2f} ms"
+        if role == Qt.ItemDataRole.BackgroundRole and column == 1:
+            return brush
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+def default_data_path():
+    """Get the file collections and environments are saved to."""
+    location = QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.AppDataLocation
+    )
+    return os.path.join(location, DATA_FILE_NAME)
+
+
+class DataLoader(QThread):
+    """Thread that reads the saved collections and environments."""
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.result = ([], [], [])
+
+    def run(self):
+        """Read the data file; the result is applied on the GUI thread."""
+        self.result = MainWindow.read_data(self.path)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
-    def __init__(self):
+    # Batch result backgrounds, shared by every row
+    _BRUSH_PASS = QBrush(QColor(144, 238, 144))  # Light green
+    _BRUSH_WARN = QBrush(QColor(255, 255, 224))  # Light yellow
+    _BRUSH_4XX = QBrush(QColor(255, 182, 193))  # Light red
+    _BRUSH_5XX = QBrush(QColor(255, 160, 122))  # Light orange
+
+    # cURL option templates for the body types sent as a single --data-raw
+    _CURL_BODY_FORMATS = {
+        "raw": "--data-raw '%s'",
+        "x-www-form-urlencoded": '--data-raw "%s"',
+    }
+
+    def __init__(self, data_path=None):
         super().__init__()
+        self.data_path = data_path or default_data_path()
         self.collections = []
         self.environments = []
         self.current_environment = None
         self.current_request = None
+        self.request_runner = None
+        self.http_session = None  # Keep-alive session shared by single sends
+        self.last_response = None
+        self.batch_runner = None
+        self.current_batch_requests = []
+        self._last_dir = ""  # Directory of the last file picked in a dialog
+        self._batch_rows = {}  # id(request) -> results_table row
+
+        # Coalesce saves from bursts of edits; one serial worker does the writing
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_save)
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+
+        # Only the latest batch response is shown, and only once it can be seen
+        self._pending_batch_response = None
+        self._response_update_timer = QTimer(self)
+        self._response_update_timer.setSingleShot(True)
+        self._response_update_timer.setInterval(100)
+        self._response_update_timer.timeout.connect(self.show_pending_batch_response)
+
+        # Read the saved data on a worker thread while the widgets are built
+        self.data_loader = None
+        self.load_data(background=True)
 
         self.init_ui()
         self.setup_menus()
-        self.load_data()
 
     def init_ui(self):
         """Initialize the user interface."""
@@ -100,12 +269,11 @@ class MainWindow(QMainWindow):
         request_response_widget = QWidget()
         request_response_layout = QVBoxLayout(request_response_widget)
 
-        # Create request and response panels
-        self.request_panel = RequestPanel(self)
-        self.response_panel = ResponsePanel(self)
-
-        # Create splitter for request and response panels
+        # Create splitter for request and response panels, then the panels
+        # directly inside it so they are never reparented
         request_response_splitter = QSplitter(Qt.Orientation.Vertical)
+        self.request_panel = RequestPanel(request_response_splitter)
+        self.response_panel = ResponsePanel(request_response_splitter)
         request_response_splitter.addWidget(self.request_panel)
         request_response_splitter.addWidget(self.response_panel)
 
@@ -114,12 +282,14 @@ class MainWindow(QMainWindow):
 
         request_response_layout.addWidget(request_response_splitter)
 
-        # Create batch testing tab
-        self.batch_testing_widget = self.create_batch_testing_widget()
+        # Create batch testing tab; its contents are built on first use
+        self.batch_testing_widget = QWidget()
+        self._batch_tab_built = False
 
         # Add tabs
         self.content_tab_widget.addTab(request_response_widget, "Request/Response")
         self.content_tab_widget.addTab(self.batch_testing_widget, "Batch Testing")
+        self.content_tab_widget.currentChanged.connect(self.on_content_tab_changed)
 
         splitter.addWidget(self.content_tab_widget)
 
@@ -131,9 +301,7 @@ class MainWindow(QMainWindow):
         self.request_panel.send_request.connect(self.on_send_request)
         self.environment_panel.environment_changed.connect(self.on_environment_changed)
 
-        # Add console output for debugging
-        print("API Tester application initialized successfully!")
-        print("Main window created with sidebar and panels")
+        logger.debug("Main window created with sidebar and panels")
 
     def create_header_toolbar(self, parent_layout):
         """Create the header toolbar with main action buttons."""
@@ -142,73 +310,24 @@ class MainWindow(QMainWindow):
         toolbar_layout.setContentsMargins(10, 5, 10, 5)
 
         # Style the toolbar
-        toolbar_widget.setStyleSheet(
-            """
-            QWidget {
-                background-color: #f8f9fa;
-                border-bottom: 1px solid #dee2e6;
-            }
-        """
-        )
+        toolbar_widget.setStyleSheet(_TOOLBAR_QSS)
 
         # Import button
         import_btn = QPushButton("Import")
         import_btn.clicked.connect(self.import_file)
-        import_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #17a2b8;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #117a8b;
-            }
-        """
-        )
+        import_btn.setStyleSheet(_IMPORT_BTN_QSS)
         toolbar_layout.addWidget(import_btn)
 
         # Save Request as cURL button
         save_curl_btn = QPushButton("Save as cURL")
         save_curl_btn.clicked.connect(self.save_request_as_curl)
-        save_curl_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #545b62;
-            }
-        """
-        )
+        save_curl_btn.setStyleSheet(_SAVE_CURL_BTN_QSS)
         toolbar_layout.addWidget(save_curl_btn)
 
         # Save Response button
         save_response_btn = QPushButton("Save Response")
         save_response_btn.clicked.connect(self.save_response)
-        save_response_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #fd7e14;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e8690b;
-            }
-        """
-        )
+        save_response_btn.setStyleSheet(_SAVE_RESPONSE_BTN_QSS)
         toolbar_layout.addWidget(save_response_btn)
 
         # Add stretch to push buttons to the left
@@ -244,45 +363,115 @@ class MainWindow(QMainWindow):
             "Supports collections, environments, and request/response management.",
         )
 
-    def load_data(self):
+    def load_data(self, background=False):
         """Load saved collections and environments."""
+        if not background:
+            self._apply_loaded_data(*self.read_data(self.data_path))
+            return
+
+        self.data_loader = DataLoader(self.data_path, self)
+        self.data_loader.finished.connect(self.finish_loading)
+        self.data_loader.start()
+
+    def finish_loading(self):
+        """Apply the background load's results, waiting for it if needed."""
+        loader, self.data_loader = self.data_loader, None
+        if loader is None:
+            return  # Nothing pending, or already applied
+
+        loader.wait()
+        self._apply_loaded_data(*loader.result)
+        loader.deleteLater()
+
+    @classmethod
+    def read_data(cls, path):
+        """Read saved collections and environments, collecting any errors."""
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    collections, environments = cls._parse_data(json.load(f))
+                return collections, environments, []
+            except Exception as e:
+                return [], [], [f"Failed to load saved data: {e}"]
+
+        # Fall back to the separate files older versions kept in the working
+        # directory; the next save moves their contents to the data file
+        collections, environments, errors = [], [], []
+
         # Load collections
         if os.path.exists("collections.json"):
             try:
                 with open("collections.json", "r") as f:
-                    collections_data = json.load(f)
-                    for coll_data in collections_data:
-                        collection = Collection.from_dict(coll_data)
-                        self.collections.append(collection)
+                    collections = [Collection.from_dict(c) for c in json.load(f)]
             except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to load collections: {e}")
+                errors.append(f"Failed to load collections: {e}")
 
         # Load environments
         if os.path.exists("environments.json"):
             try:
                 with open("environments.json", "r") as f:
-                    envs_data = json.load(f)
-                    for env_data in envs_data:
-                        environment = Environment.from_dict(env_data)
-                        self.environments.append(environment)
+                    environments = [Environment.from_dict(e) for e in json.load(f)]
             except Exception as e:
-                QMessageBox.warning(self, "Error", f"Failed to load environments: {e}")
+                errors.append(f"Failed to load environments: {e}")
+
+        return collections, environments, errors
+
+    @staticmethod
+    def _parse_data(data):
+        """Build collections and environments from the saved data."""
+        collections = [Collection.from_dict(c) for c in data.get("collections", [])]
+        environments = [
+            Environment.from_dict(e) for e in data.get("environments", [])
+        ]
+        return collections, environments
+
+    def _apply_loaded_data(self, collections, environments, errors):
+        """Add loaded collections and environments to the window."""
+        for error in errors:
+            QMessageBox.warning(self, "Error", error)
+
+        self.collections.extend(collections)
+        self.environments.extend(environments)
 
         # Update sidebar and environment panel
         self.sidebar.update_collections(self.collections)
         self.environment_panel.update_environments(self.environments)
 
-    def save_data(self):
-        """Save collections and environments to files."""
-        # Save collections
+    def schedule_save(self):
+        """Save collections and environments shortly, off the UI thread."""
+        self._save_timer.start()
+
+    def _flush_save(self):
+        """Snapshot the data on the UI thread and hand the write to the worker."""
+        self.finish_loading()  # Never save before the saved data is in
+        path = self.data_path
         collections_data = [coll.to_dict() for coll in self.collections]
-        with open("collections.json", "w") as f:
-            json.dump(collections_data, f, indent=2)
+        envs_data = [env.to_dict() for env in self.environments]
+        self._save_pool.start(
+            lambda: self._write_data(path, collections_data, envs_data)
+        )
 
-        # Save environments
+    def save_data(self):
+        """Save collections and environments to the data file."""
+        # Supersede any pending save and let an in-flight write finish first
+        self.finish_loading()
+        self._save_timer.stop()
+        self._save_pool.waitForDone()
+
+        collections_data = [coll.to_dict() for coll in self.collections]
         envs_data = [env.to_dict() for env in self.environments]
-        with open("environments.json", "w") as f:
-            json.dump(envs_data, f, indent=2)
+        self._write_data(self.data_path, collections_data, envs_data)
+
+    @staticmethod
+    def _write_data(path, collections_data, envs_data):
+        """Write already-serialised collections and environments to one file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        # Compact json.dumps() runs in the C encoder; indent= or json.dump()
+        # would fall back to the pure-Python one and write in small pieces
+        data = {"collections": collections_data, "environments": envs_data}
+        with open(path, "w") as f:
+            f.write(json.dumps(data, separators=(",", ":")))
 
     def new_collection(self):
         """Create a new collection."""
@@ -290,8 +479,8 @@ class MainWindow(QMainWindow):
         if ok and name:
             collection = Collection(name)
             self.collections.append(collection)
-            self.sidebar.update_collections(self.collections)
-            self.save_data()
+            self.add_to_sidebar([collection])
+            self.schedule_save()
 
     def new_environment(self):
         """Create a new environment."""
@@ -299,13 +488,43 @@ class MainWindow(QMainWindow):
         if ok and name:
             environment = Environment(name)
             self.environments.append(environment)
-            self.environment_panel.update_environments(self.environments)
-            self.save_data()
+            self.add_to_environment_panel([environment])
+            self.schedule_save()
+
+    def add_to_sidebar(self, collections):
+        """Show collections that were appended to self.collections."""
+        self.sidebar.setUpdatesEnabled(False)
+        for collection in collections:
+            self.sidebar.add_collection(collection)
+        self.sidebar.setUpdatesEnabled(True)
+
+    def add_to_environment_panel(self, environments):
+        """Show environments that were appended to self.environments."""
+        for environment in environments:
+            self.environment_panel.add_environment(environment)
+
+    def _get_open_path(self, caption, file_filter):
+        """Ask for a file to open, starting in the last used directory."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, caption, self._last_dir, file_filter
+        )
+        if file_path:
+            self._last_dir = os.path.dirname(file_path)
+        return file_path
+
+    def _get_save_path(self, caption, file_name, file_filter):
+        """Ask where to save a file, starting in the last used directory."""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, caption, os.path.join(self._last_dir, file_name), file_filter
+        )
+        if file_path:
+            self._last_dir = os.path.dirname(file_path)
+        return file_path
 
     def import_file(self):
         """Import collections and environments from file (unified import)."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Import Collection/Environment", "", "JSON Files (*.json)"
+        file_path = self._get_open_path(
+            "Import Collection/Environment", "JSON Files (*.json)"
         )
         if file_path:
             try:
@@ -315,18 +534,14 @@ class MainWindow(QMainWindow):
                     PostmanImporter.import_file(file_path)
                 )
 
-                # Add all imported collections
-                for collection in imported_collections:
-                    self.collections.append(collection)
-
-                # Add all imported environments
-                for environment in imported_environments:
-                    self.environments.append(environment)
+                # Add all imported collections and environments
+                self.collections.extend(imported_collections)
+                self.environments.extend(imported_environments)
 
-                # Update UI
-                self.sidebar.update_collections(self.collections)
-                self.environment_panel.update_environments(self.environments)
-                self.save_data()
+                # Update UI with just the new entries
+                self.add_to_sidebar(imported_collections)
+                self.add_to_environment_panel(imported_environments)
+                self.schedule_save()
 
                 # Show success message
                 success_messages = []
@@ -369,9 +584,7 @@ class MainWindow(QMainWindow):
 
     def import_environment(self):
         """Import environment from file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Import Environment", "", "JSON Files (*.json)"
-        )
+        file_path = self._get_open_path("Import Environment", "JSON Files (*.json)")
         if file_path:
             try:
                 from .postman_importer import PostmanImporter
@@ -379,12 +592,11 @@ class MainWindow(QMainWindow):
                 imported_environments = PostmanImporter.import_environment(file_path)
 
                 # Add all imported environments
-                for environment in imported_environments:
-                    self.environments.append(environment)
+                self.environments.extend(imported_environments)
 
-                # Update UI
-                self.environment_panel.update_environments(self.environments)
-                self.save_data()
+                # Update UI with just the new entries
+                self.add_to_environment_panel(imported_environments)
+                self.schedule_save()
 
                 # Show success message
                 if len(imported_environments) == 1:
@@ -415,8 +627,7 @@ class MainWindow(QMainWindow):
             curl_command = self._generate_curl_command(current_request)
 
             # Ask user for file path
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
+            file_path = self._get_save_path(
                 "Save cURL Command",
                 f"{current_request.name}.sh",
                 "Shell Scripts (*.sh);;Text Files (*.txt);;All Files (*)",
@@ -434,7 +645,7 @@ class MainWindow(QMainWindow):
 
     def save_response(self):
         """Save the current response to a file."""
-        if not hasattr(self, "last_response") or not self.last_response:
+        if not self.last_response:
             QMessageBox.warning(self, "Warning", "No response to save.")
             return
 
@@ -447,8 +658,7 @@ class MainWindow(QMainWindow):
                 return
 
             # Ask user for file path
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
+            file_path = self._get_save_path(
                 "Save Response",
                 "response.txt",
                 "Text Files (*.txt);;JSON Files (*.json);;All Files (*)",
@@ -466,49 +676,47 @@ class MainWindow(QMainWindow):
 
     def _generate_curl_command(self, request):
         """Generate a cURL command from a request."""
+        method = request.method.upper()
         curl_parts = ["curl"]
 
         # Add method
-        if request.method.upper() != "GET":
-            curl_parts.append(f"-X {request.method.upper()}")
+        if method != "GET":
+            curl_parts.append(f"-X {method}")
 
         # Add headers
-        for key, value in request.headers.items():
-            curl_parts.append(f'-H "{key}: {value}"')
+        curl_parts.extend(
+            f'-H "{key}: {value}"' for key, value in request.headers.items()
+        )
 
         # Add query parameters
+        url = request.url
         if request.params:
-            param_str = "&".join([f"{k}={v}" for k, v in request.params.items()])
-            if "?" in request.url:
-                url = f"{request.url}&{param_str}"
-            else:
-                url = f"{request.url}?{param_str}"
-        else:
-            url = request.url
+            # Braces stay literal so {{variable}} placeholders remain readable
+            param_str = urlencode(request.params, doseq=True, safe="{}")
+            _, has_query, _ = url.partition("?")
+            url = f"{url}{'&' if has_query else '?'}{param_str}"
 
         # Add body
         if request.body and request.body_type != "none":
-            if request.body_type == "raw":
-                curl_parts.append(f"--data-raw '{request.body}'")
-            elif request.body_type == "x-www-form-urlencoded":
-                curl_parts.append(f'--data-raw "{request.body}"')
-            elif request.body_type == "form-data":
-                # Handle form data
-                try:
-                    import json
-
-                    form_data = json.loads(request.body)
-                    for key, value in form_data.items():
-                        curl_parts.append(f'-F "{key}={value}"')
-                except:
-                    curl_parts.append(f'--data-raw "{request.body}"')
+            if request.body_type == "form-data":
+                curl_parts.extend(self._curl_form_fields(request.body))
+            elif request.body_type in self._CURL_BODY_FORMATS:
+                body_format = self._CURL_BODY_FORMATS[request.body_type]
+                curl_parts.append(body_format % request.body)
 
         # Add URL
         curl_parts.append(f'"{url}"')
 
-        generated_curl = " ".join(curl_parts)
-        print(f"DEBUG: Generated cURL command: {generated_curl}")  # Debug print
-        return generated_curl
+        return " ".join(curl_parts)
+
+    @staticmethod
+    def _curl_form_fields(body):
+        """Turn a JSON form-data body into -F options, or pass it through raw."""
+        try:
+            form_data = json.loads(body)
+            return [f'-F "{key}={value}"' for key, value in form_data.items()]
+        except (ValueError, AttributeError):
+            return [f'--data-raw "{body}"']
 
     def export_collection(self):
         """Export a collection to file."""
@@ -519,8 +727,8 @@ class MainWindow(QMainWindow):
         # TODO: Add collection selection dialog
         collection = self.collections[0]  # For now, export first collection
 
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Export Collection", f"{collection.name}.json", "JSON Files (*.json)"
+        file_path = self._get_save_path(
+            "Export Collection", f"{collection.name}.json", "JSON Files (*.json)"
         )
         if file_path:
             try:
@@ -544,27 +752,54 @@ class MainWindow(QMainWindow):
 
     def on_send_request(self, request_data):
         """Handle send request from request panel."""
-        print(
-            f"Sending request: {request_data.get('method', 'GET')} {request_data.get('url', 'No URL')}"
+        logger.debug(
+            "Sending request: %s %s",
+            request_data.get("method", "GET"),
+            request_data.get("url", "No URL"),
         )
 
         # Get current environment from environment panel
         current_environment = self.environment_panel.get_current_environment()
 
-        # Create request runner
-        self.request_runner = RequestRunner(request_data, current_environment)
-        self.request_runner.response_received.connect(
-            self.response_panel.display_response
+        # Retire the previous runner so a slower, superseded request can't
+        # overwrite the newer response once it finishes
+        if self.request_runner is not None:
+            self.retire_request_runner(self.request_runner)
+
+        # Create request runner (imported here to keep requests off the startup path)
+        from .request_runner import RequestRunner, create_session
+
+        # Repeat sends to the same host reuse the pooled TCP/TLS connections
+        if self.http_session is None:
+            self.http_session = create_session()
+
+        self.request_runner = RequestRunner(
+            request_data, current_environment, session=self.http_session
         )
         self.request_runner.response_received.connect(self.on_response_received)
         self.request_runner.error_occurred.connect(self.on_request_error)
         self.request_runner.start()
+        self.request_panel.set_sending(True)
+
+        logger.debug("Request runner started")
 
-        print("Request runner started...")
+    def retire_request_runner(self, runner):
+        """Disconnect a runner's results and free it once its thread is done."""
+        runner.response_received.disconnect()
+        runner.error_occurred.disconnect()
+
+        # Parent it to the window so dropping our reference can't destroy a
+        # running thread; deleteLater() then frees it once run() returns
+        runner.setParent(self)
+        runner.finished.connect(runner.deleteLater)
+        if runner.isFinished():
+            runner.deleteLater()
 
     def on_environment_changed(self, environment):
         """Handle environment selection change."""
-        print(f"Environment changed to: {environment.name if environment else 'None'}")
+        logger.debug(
+            "Environment changed to: %s", environment.name if environment else None
+        )
         self.current_environment = environment
 
     def on_environment_updated(self, environment):
@@ -577,25 +812,28 @@ class MainWindow(QMainWindow):
             self.current_environment = environment
 
         # Save data to persist changes
-        self.save_data()
+        self.schedule_save()
 
     def on_response_received(self, response):
         """Handle response received from request runner."""
+        self.request_panel.set_sending(False)
         self.last_response = response
-        print(f"Response received and stored: {response.get('status_code', 'Unknown')}")
+        self.response_panel.display_response(response)
+        logger.debug("Response received: %s", response.get("status_code", "Unknown"))
 
     def on_request_error(self, error_message):
         """Handle request errors."""
-        print(f"Request error: {error_message}")
+        self.request_panel.set_sending(False)
+        logger.debug("Request error: %s", error_message)
         QMessageBox.warning(self, "Request Error", error_message)
 
     def run_all_requests(self, requests):
         """Run all requests in a collection."""
         if not requests:
-            print("No requests to run")
+            logger.debug("No requests to run")
             return
 
-        print(f"MainWindow: Starting batch run of {len(requests)} requests...")
+        logger.debug("Starting batch run of %d requests", len(requests))
 
         # Store requests for batch testing
         self.current_batch_requests = requests
@@ -608,29 +846,28 @@ class MainWindow(QMainWindow):
 
         # Get current environment
         current_environment = self.environment_panel.get_current_environment()
-        print(
-            f"MainWindow: Using environment: {current_environment.name if current_environment else 'None'}"
+        logger.debug(
+            "Using environment: %s",
+            current_environment.name if current_environment else None,
         )
 
         # Create a runner for all requests
+        from .batch_request_runner import BatchRequestRunner
+
         self.batch_runner = BatchRequestRunner(requests, current_environment, self)
         self.batch_runner.request_completed.connect(self.on_batch_request_completed)
         self.batch_runner.all_completed.connect(self.on_batch_all_completed)
         self.batch_runner.start()
 
-        print(f"MainWindow: Batch runner started")
+        logger.debug("Batch runner started")
 
     def prepare_batch_testing(self, requests):
         """Prepare the batch testing interface."""
-        # Clear previous results
-        self.results_table.setRowCount(0)
+        self.ensure_batch_testing_widget()
 
-        # Add requests to table
-        for i, request in enumerate(requests):
-            self.results_table.insertRow(i)
-            self.results_table.setItem(i, 0, QTableWidgetItem(request.name))
-            self.results_table.setItem(i, 1, QTableWidgetItem("Pending"))
-            self.results_table.setItem(i, 2, QTableWidgetItem(""))
+        # Replace previous results with one pending row per request
+        self.results_model.set_requests(requests)
+        self._batch_rows = {id(request): i for i, request in enumerate(requests)}
 
         # Update progress
         self.progress_label.setText(f"Ready to run {len(requests)} requests")
@@ -655,7 +892,8 @@ class MainWindow(QMainWindow):
 
     def clear_batch_results(self):
         """Clear batch testing results."""
-        self.results_table.setRowCount(0)
+        self.results_model.set_requests([])
+        self._batch_rows = {}
         self.progress_label.setText("Ready to run batch tests")
         self.progress_bar.setVisible(False)
         self.summary_label.setText("No tests run yet")
@@ -664,54 +902,46 @@ class MainWindow(QMainWindow):
 
     def on_batch_request_completed(self, request, response, test_results):
         """Handle completion of a single request in batch."""
-        print(
-            f"MainWindow: Batch request completed: {request.name} - Status: {response.get('status_code', 'Unknown')}"
+        logger.debug(
+            "Batch request completed: %s - Status: %s",
+            request.name,
+            response.get("status_code", "Unknown"),
         )
 
-        # Find the request in the results table
-        for row in range(self.results_table.rowCount()):
-            if self.results_table.item(row, 0).text() == request.name:
-                # Update status and test results combined
-                status = response.get("status_code", 0)
-                if isinstance(status, str):
-                    try:
-                        status = int(status)
-                    except ValueError:
-                        status = 0
-
-                # Create combined status and test results text
-                status_text = f"Status: {status}"
-                if isinstance(test_results, dict):
-                    test_summary = test_results.get("summary", "No tests")
-                    status_text += f" | {test_summary}"
-                else:
-                    status_text += f" | {str(test_results)}"
-
-                status_item = QTableWidgetItem(status_text)
+        # Look up the request's row directly instead of scanning the table
+        row = self._batch_rows.get(id(request))
+        if row is not None:
+            # Update status and test results combined
+            status = response.get("status_code", 0)
+            if isinstance(status, str):
+                try:
+                    status = int(status)
+                except ValueError:
+                    status = 0
+
+            # Create combined status and test results text
+            status_text = f"Status: {status}"
+            if isinstance(test_results, dict):
+                test_summary = test_results.get("summary", "No tests")
+                status_text += f" | {test_summary}"
+            else:
+                status_text += f" | {str(test_results)}"
 
-                # Set background color based on status and test results
-                if 200 <= status < 300:
-                    if isinstance(test_results, dict) and test_results.get(
-                        "passed", False
-                    ):
-                        status_item.setBackground(QColor(144, 238, 144))  # Light green
-                    else:
-                        status_item.setBackground(QColor(255, 255, 224))  # Light yellow
-                elif 400 <= status < 500:
-                    status_item.setBackground(QColor(255, 182, 193))  # Light red
-                elif 500 <= status < 600:
-                    status_item.setBackground(QColor(255, 160, 122))  # Light orange
+            # Set background color based on status and test results
+            if 200 <= status < 300:
+                if isinstance(test_results, dict) and test_results.get("passed", False):
+                    brush = self._BRUSH_PASS
                 else:
-                    status_item.setBackground(QColor(255, 255, 224))  # Light yellow
-
-                self.results_table.setItem(row, 1, status_item)
+                    brush = self._BRUSH_WARN
+            elif 400 <= status < 500:
+                brush = self._BRUSH_4XX
+            elif 500 <= status < 600:
+                brush = self._BRUSH_5XX
+            else:
+                brush = self._BRUSH_WARN
 
-                # Update response time
-                response_time = response.get("response_time", 0)
-                self.results_table.setItem(
-                    row, 2, QTableWidgetItem(f"{response_time:.2f} ms")
-                )
-                break
+            response_time = response.get("response_time", 0)
+            self.results_model.update_row(row, status_text, brush, response_time)
 
         # Update progress
         current_progress = self.progress_bar.value() + 1
@@ -720,13 +950,13 @@ class MainWindow(QMainWindow):
             f"Completed {current_progress}/{self.progress_bar.maximum()} requests"
         )
 
-        # Update the response panel with the latest response
-        self.response_panel.display_response(response)
-        self.response_panel.update_test_results(test_results)
+        # Update the response panel with the latest response, coalesced
+        self._pending_batch_response = (response, test_results)
+        self._response_update_timer.start()
 
     def on_batch_all_completed(self, results):
         """Handle completion of all requests in batch."""
-        print(f"MainWindow: Batch run completed. {len(results)} requests processed.")
+        logger.debug("Batch run completed. %d requests processed", len(results))
 
         # Update progress
         self.progress_label.setText(
@@ -735,7 +965,12 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(self.progress_bar.maximum())
 
         # Calculate summary
-        passed = sum(1 for result in results if result.get("tests_passed", False))
+        passed = sum(
+            1
+            for result in results
+            if isinstance(result["test_results"], dict)
+            and result["test_results"].get("passed", False)
+        )
         failed = len(results) - passed
 
         # Update summary label
@@ -761,16 +996,38 @@ class MainWindow(QMainWindow):
 
         return EnvironmentPanel(self)
 
-    def create_batch_testing_widget(self):
-        """Create the batch testing widget."""
-        widget = QWidget()
+    def on_content_tab_changed(self, index):
+        """Handle switching between the content tabs."""
+        if self.content_tab_widget.widget(index) is self.batch_testing_widget:
+            self.ensure_batch_testing_widget()
+        else:
+            self.show_pending_batch_response()
+
+    def show_pending_batch_response(self):
+        """Show the latest batch response unless the response panel is hidden."""
+        if self._pending_batch_response is None:
+            return
+        if self.content_tab_widget.currentWidget() is self.batch_testing_widget:
+            return  # Shown when the user switches back to the response panel
+
+        response, test_results = self._pending_batch_response
+        self._pending_batch_response = None
+        self.response_panel.display_response(response)
+        self.response_panel.update_test_results(test_results)
+
+    def ensure_batch_testing_widget(self):
+        """Build the batch testing tab the first time it is needed."""
+        if not self._batch_tab_built:
+            self._batch_tab_built = True
+            self.create_batch_testing_widget(self.batch_testing_widget)
+
+    def create_batch_testing_widget(self, widget):
+        """Create the batch testing controls inside the given widget."""
         layout = QVBoxLayout(widget)
 
         # Header
         header_label = QLabel("Batch Testing")
-        header_label.setStyleSheet(
-            "font-weight: bold; font-size: 16px; color: #2c3e50; padding: 10px; background-color: #ecf0f1; border-radius: 5px;"
-        )
+        header_label.setStyleSheet(_BATCH_HEADER_QSS)
         layout.addWidget(header_label)
 
         # Progress section
@@ -778,7 +1035,7 @@ class MainWindow(QMainWindow):
         progress_layout = QVBoxLayout(progress_group)
 
         self.progress_label = QLabel("Ready to run batch tests")
-        self.progress_label.setStyleSheet("font-size: 12px; color: #7f8c8d;")
+        self.progress_label.setStyleSheet(_PROGRESS_LABEL_QSS)
         progress_layout.addWidget(self.progress_label)
 
         self.progress_bar = QProgressBar()
@@ -792,22 +1049,23 @@ class MainWindow(QMainWindow):
         results_layout = QVBoxLayout(results_group)
 
         # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(3)
-        self.results_table.setHorizontalHeaderLabels(
-            ["Request", "Status & Tests", "Response Time"]
-        )
+        self.results_model = BatchResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         self.results_table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
+        # Fixed row height, so rows are never measured against their contents
+        self.results_table.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
+        self.results_table.verticalHeader().setDefaultSectionSize(22)
         self.results_table.setMaximumHeight(300)
         results_layout.addWidget(self.results_table)
 
         # Summary
         self.summary_label = QLabel("No tests run yet")
-        self.summary_label.setStyleSheet(
-            "font-weight: bold; font-size: 12px; color: #2c3e50; padding: 5px;"
-        )
+        self.summary_label.setStyleSheet(_SUMMARY_LABEL_QSS)
         results_layout.addWidget(self.summary_label)
 
         layout.addWidget(results_group)
@@ -817,54 +1075,20 @@ class MainWindow(QMainWindow):
 
         self.start_batch_btn = QPushButton("Start Batch Test")
         self.start_batch_btn.clicked.connect(self.start_batch_test)
-        self.start_batch_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """
-        )
+        self.start_batch_btn.setStyleSheet(_START_BATCH_BTN_QSS)
         button_layout.addWidget(self.start_batch_btn)
 
         self.clear_results_btn = QPushButton("Clear Results")
         self.clear_results_btn.clicked.connect(self.clear_batch_results)
-        self.clear_results_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """
-        )
+        self.clear_results_btn.setStyleSheet(_CLEAR_RESULTS_BTN_QSS)
         button_layout.addWidget(self.clear_results_btn)
 
         button_layout.addStretch()
         layout.addLayout(button_layout)
 
-        # Store current batch requests
-        self.current_batch_requests = []
-
-        return widget
-
     def closeEvent(self, event):
         """Handle application close event."""
         self.save_data()
+        if self.http_session is not None:
+            self.http_session.close()
         event.accept()
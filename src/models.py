@@ -2,14 +2,21 @@
 Data models for the API Testing Application
 """
 
+import base64
 import json
+import sys
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
-@dataclass
+def _now_iso() -> str:
+    """Get the current time as an ISO 8601 string."""
+    return datetime.now().isoformat()
+
+
+@dataclass(slots=True)
 class Request:
     """Represents an API request."""
 
@@ -23,9 +30,14 @@ class Request:
     pre_request_script: str = ""
     tests: str = ""
     description: str = ""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    id: str = ""
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
+
+    def __post_init__(self):
+        """Generate an id only if none was given, e.g. by from_dict()."""
+        if not self.id:
+            self.id = str(uuid.uuid4())
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert request to dictionary."""
@@ -49,59 +61,111 @@ class Request:
     def from_dict(cls, data: Dict[str, Any]) -> "Request":
         """Create request from dictionary."""
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=data.get("id") or "",
             name=data.get("name", ""),
-            method=data.get("method", "GET"),
+            # Interned so every request shares one string per method/body type
+            method=sys.intern(data.get("method") or "GET"),
             url=data.get("url", ""),
             headers=data.get("headers", {}),
             params=data.get("params", {}),
             body=data.get("body", ""),
-            body_type=data.get("body_type", "none"),
+            body_type=sys.intern(data.get("body_type") or "none"),
             pre_request_script=data.get("pre_request_script", ""),
             tests=data.get("tests", ""),
             description=data.get("description", ""),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            updated_at=data.get("updated_at", datetime.now().isoformat()),
+            created_at=data.get("created_at") or _now_iso(),
+            updated_at=data.get("updated_at") or _now_iso(),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Collection:
     """Represents a collection of API requests."""
 
     name: str
+    # Storage behind the requests property; declared before the requests
+    # field so that __init__ resets it before the setter fills it in
+    _requests: Optional[List[Request]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     description: str = ""
     requests: List[Request] = field(default_factory=list)
     folders: List["Collection"] = field(default_factory=list)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    id: str = ""
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
+    # Request dicts from from_dict(), turned into Requests on first access
+    _raw_requests: Optional[List[Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Requests by id, kept in step by add/remove_request(); rebuilt lazily
+    _index: Optional[Dict[str, Request]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Generate an id only if none was given, e.g. by from_dict()."""
+        if not self.id:
+            self.id = str(uuid.uuid4())
+
+    @property
+    def requests_loaded(self) -> bool:
+        """Whether the requests have been built from their saved dicts yet."""
+        return self._raw_requests is None
+
+    def _request_index(self) -> Dict[str, Request]:
+        """Get the requests by id, building the index on first use."""
+        if self._index is None:
+            # Reversed so the first of any duplicate ids wins, as in a scan
+            self._index = {req.id: req for req in reversed(self.requests)}
+        return self._index
 
-    def add_request(self, request: Request):
-        """Add a request to the collection."""
+    def add_request(self, request: Request, now: Optional[str] = None):
+        """Add a request to the collection, stamped with now if given."""
         self.requests.append(request)
-        self.updated_at = datetime.now().isoformat()
+        if self._index is not None:
+            self._index.setdefault(request.id, request)
+        self.updated_at = now or _now_iso()
 
     def remove_request(self, request_id: str):
         """Remove a request from the collection."""
-        self.requests = [req for req in self.requests if req.id != request_id]
-        self.updated_at = datetime.now().isoformat()
+        if self._request_index().pop(request_id, None) is None:
+            return  # Not in this collection
+
+        # Updated in place so the index stays valid
+        self.requests[:] = [req for req in self.requests if req.id != request_id]
+        self.updated_at = _now_iso()
 
     def get_request(self, request_id: str) -> Optional[Request]:
         """Get a request by ID."""
-        for request in self.requests:
-            if request.id == request_id:
-                return request
-        return None
+        return self._request_index().get(request_id)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert collection to dictionary."""
+        result = self._to_dict_without_folders()
+
+        # Nested folders are converted with a stack rather than by recursing
+        stack = [(self.folders, result["folders"])]
+        while stack:
+            folders, folder_dicts = stack.pop()
+            for folder in folders:
+                folder_dict = folder._to_dict_without_folders()
+                folder_dicts.append(folder_dict)
+                stack.append((folder.folders, folder_dict["folders"]))
+        return result
+
+    def _to_dict_without_folders(self) -> Dict[str, Any]:
+        """Convert collection to dictionary, leaving its folders list empty."""
         return {
             "id": self.id,
             "name": self.name,
             "description": self.description,
-            "requests": [req.to_dict() for req in self.requests],
-            "folders": [folder.to_dict() for folder in self.folders],
+            "requests": (
+                self._raw_requests
+                if self._raw_requests is not None
+                else [req.to_dict() for req in self.requests]
+            ),
+            "folders": [],
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
@@ -110,17 +174,17 @@ class Collection:
     def from_dict(cls, data: Dict[str, Any]) -> "Collection":
         """Create collection from dictionary."""
         collection = cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=data.get("id") or "",
             name=data.get("name", ""),
             description=data.get("description", ""),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            updated_at=data.get("updated_at", datetime.now().isoformat()),
+            created_at=data.get("created_at") or _now_iso(),
+            updated_at=data.get("updated_at") or _now_iso(),
         )
 
-        # Load requests
-        for req_data in data.get("requests", []):
-            request = Request.from_dict(req_data)
-            collection.requests.append(request)
+        # Requests are only built once something reads collection.requests
+        raw_requests = data.get("requests", [])
+        if raw_requests:
+            collection._raw_requests = list(raw_requests)
 
         # Load folders
         for folder_data in data.get("folders", []):
@@ -130,20 +194,64 @@ class Collection:
         return collection
 
 
-@dataclass
+def _get_collection_requests(self: Collection) -> List[Request]:
+    """Get the collection's requests, building them on first access."""
+    if self._raw_requests is not None:
+        self._requests = [Request.from_dict(data) for data in self._raw_requests]
+        self._raw_requests = None
+    return self._requests
+
+
+def _set_collection_requests(self: Collection, requests: List[Request]):
+    """Replace the collection's requests."""
+    self._requests = requests
+    self._raw_requests = None
+    self._index = None
+
+
+# Installed after @dataclass so the generated __init__ assigns through the setter
+Collection.requests = property(  # type: ignore[assignment]
+    _get_collection_requests, _set_collection_requests
+)
+
+
+@dataclass(slots=True)
 class Environment:
     """Represents an environment with variables."""
 
     name: str
     variables: Dict[str, str] = field(default_factory=dict)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    id: str = ""
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
+    # (name, value) pairs in insertion order; rebuilt lazily after a write
+    _items_cache: Optional[List[Tuple[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Bumped on every variable change, so results derived from the
+    # variables can be cached against it
+    version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Generate an id only if none was given, e.g. by from_dict()."""
+        if not self.id:
+            self.id = str(uuid.uuid4())
+
+    def set_variable(self, key: str, value: str) -> bool:
+        """Set an environment variable; returns False if it already had that value."""
+        if key in self.variables and self.variables[key] == value:
+            return False
+        self.variables[sys.intern(key)] = value
+        self.updated_at = _now_iso()
+        self._items_cache = None
+        self.version += 1
+        return True
 
-    def set_variable(self, key: str, value: str):
-        """Set an environment variable."""
-        self.variables[key] = value
-        self.updated_at = datetime.now().isoformat()
+    def items(self) -> List[Tuple[str, str]]:
+        """Get the variables as an indexable list of (name, value) pairs."""
+        if self._items_cache is None:
+            self._items_cache = list(self.variables.items())
+        return self._items_cache
 
     def get_variable(self, key: str) -> Optional[str]:
         """Get an environment variable."""
@@ -153,7 +261,9 @@ class Environment:
         """Remove an environment variable."""
         if key in self.variables:
             del self.variables[key]
-            self.updated_at = datetime.now().isoformat()
+            self.updated_at = _now_iso()
+            self._items_cache = None
+            self.version += 1
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert environment to dictionary."""
@@ -169,33 +279,56 @@ class Environment:
     def from_dict(cls, data: Dict[str, Any]) -> "Environment":
         """Create environment from dictionary."""
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=data.get("id") or "",
             name=data.get("name", ""),
-            variables=data.get("variables", {}),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            updated_at=data.get("updated_at", datetime.now().isoformat()),
+            # Environments mostly share variable names; intern them so each
+            # name is stored once however many environments use it
+            variables={
+                sys.intern(key): value
+                for key, value in data.get("variables", {}).items()
+            },
+            created_at=data.get("created_at") or _now_iso(),
+            updated_at=data.get("updated_at") or _now_iso(),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """Represents an API response."""
 
     status_code: int
     headers: Dict[str, str]
-    body: str
+    body: bytes
     response_time: float
     size: int
     url: str
     method: str
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=_now_iso)
+    # Decoded body, built on first use of body_text
+    _body_text: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Store a body given as text as bytes, keeping the text."""
+        if isinstance(self.body, str):
+            self._body_text = self.body
+            self.body = self.body.encode("utf-8")
+
+    @property
+    def body_text(self) -> str:
+        """Get the body decoded as UTF-8, decoding it on first access."""
+        if self._body_text is None:
+            self._body_text = self.body.decode("utf-8", errors="replace")
+        return self._body_text
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert response to dictionary."""
         return {
             "status_code": self.status_code,
             "headers": self.headers,
-            "body": self.body,
+            "body": base64.b64encode(self.body).decode("ascii"),
+            "body_encoding": "base64",
             "response_time": self.response_time,
             "size": self.size,
             "url": self.url,
@@ -206,13 +339,17 @@ class Response:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Response":
         """Create response from dictionary."""
+        body = data.get("body", "")
+        if data.get("body_encoding") == "base64":
+            body = base64.b64decode(body)
+
         return cls(
             status_code=data.get("status_code", 0),
             headers=data.get("headers", {}),
-            body=data.get("body", ""),
+            body=body,
             response_time=data.get("response_time", 0.0),
             size=data.get("size", 0),
             url=data.get("url", ""),
             method=data.get("method", ""),
-            timestamp=data.get("timestamp", datetime.now().isoformat()),
+            timestamp=data.get("timestamp") or _now_iso(),
         )
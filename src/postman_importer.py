@@ -3,9 +3,18 @@ Postman Collection and Environment Importer for the API Testing Application
 """
 
 import json
+import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
-from .models import Collection, Environment, Request
+from .models import Collection, Environment, Request, _now_iso
+
+
+@lru_cache(maxsize=2048)
+def _join_script(lines: Tuple[str, ...]) -> str:
+    """Join a Postman script's exec lines; repeated scripts share one string."""
+    return "\n".join(lines)
 
 
 class PostmanImporter:
@@ -15,13 +24,16 @@ class PostmanImporter:
     def import_collection(file_path: str) -> List[Collection]:
         """Import a Postman collection file and return a list of collections."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            now = _now_iso()
+            # Read as bytes in one go: json.loads() detects the encoding and
+            # decodes in C, skipping the text layer's chunked UTF-8 decoding
+            with open(file_path, "rb") as f:
+                data = PostmanImporter._load_json(f, now)
 
             # Handle Postman collection format
             if "info" in data and "item" in data:
                 # This is a Postman collection
-                return PostmanImporter._import_postman_collection(data)
+                return PostmanImporter._import_postman_collection(data, now)
             else:
                 # This might be our internal format or a simple collection
                 return [Collection.from_dict(data)]
@@ -33,8 +45,8 @@ class PostmanImporter:
     def import_environment(file_path: str) -> List[Environment]:
         """Import a Postman environment file and return a list of environments."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(file_path, "rb") as f:
+                data = json.loads(f.read())
 
             # Handle Postman environment format
             if "id" in data and "name" in data and "values" in data:
@@ -51,31 +63,32 @@ class PostmanImporter:
     def import_file(file_path: str) -> Tuple[List[Collection], List[Environment]]:
         """Import a file and return both collections and environments."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            now = _now_iso()
+            with open(file_path, "rb") as f:
+                data = PostmanImporter._load_json(f, now)
 
             collections = []
             environments = []
 
             # Check if it's a Postman collection
             if "info" in data and "item" in data:
-                collections = PostmanImporter._import_postman_collection(data)
+                collections = PostmanImporter._import_postman_collection(data, now)
 
             # Check if it's a Postman environment
             elif "id" in data and "name" in data and "values" in data:
-                environments = PostmanImporter._import_postman_environment(data)
+                environments = PostmanImporter._import_postman_environment(data, now)
 
             # Check if it's a Postman workspace (contains multiple collections/environments)
             elif "collections" in data or "environments" in data:
                 if "collections" in data:
                     for coll_data in data["collections"]:
                         collections.extend(
-                            PostmanImporter._import_postman_collection(coll_data)
+                            PostmanImporter._import_postman_collection(coll_data, now)
                         )
                 if "environments" in data:
                     for env_data in data["environments"]:
                         environments.extend(
-                            PostmanImporter._import_postman_environment(env_data)
+                            PostmanImporter._import_postman_environment(env_data, now)
                         )
 
             # Check if it's our internal format
@@ -92,10 +105,29 @@ class PostmanImporter:
             raise Exception(f"Failed to import file: {str(e)}")
 
     @staticmethod
-    def _import_postman_collection(data: Dict[str, Any]) -> List[Collection]:
+    def _load_json(f, now: str) -> Any:
+        """Parse a JSON file, building Requests from Postman items as they are read."""
+
+        # json.loads() calls the hook as each object is decoded, so each request
+        # item's dicts are freed straight away rather than the whole collection
+        # being held as dicts until it is converted
+        def convert(obj: Dict[str, Any]) -> Any:
+            if "item" in obj or not isinstance(obj.get("request"), (dict, str)):
+                return obj
+            return PostmanImporter._create_request_from_item(obj, now)
+
+        return json.loads(f.read(), object_hook=convert)
+
+    @staticmethod
+    def _import_postman_collection(
+        data: Dict[str, Any], now: Optional[str] = None
+    ) -> List[Collection]:
         """Import a Postman collection format."""
         collections = []
 
+        # One timestamp for everything imported, rather than one per object
+        now = now or _now_iso()
+
         # Get collection info
         info = data.get("info", {})
         collection_name = info.get("name", "Imported Collection")
@@ -106,28 +138,32 @@ class PostmanImporter:
             name=collection_name,
             description=collection_description,
             id=data.get("info", {}).get("_postman_id", ""),
+            created_at=now,
+            updated_at=now,
         )
 
         # Process items (requests and folders)
         items = data.get("item", [])
-        PostmanImporter._process_items(items, main_collection)
+        PostmanImporter._process_items(items, main_collection, now)
 
         collections.append(main_collection)
         return collections
 
     @staticmethod
-    def _import_postman_environment(data: Dict[str, Any]) -> List[Environment]:
+    def _import_postman_environment(
+        data: Dict[str, Any], now: Optional[str] = None
+    ) -> List[Environment]:
         """Import a Postman environment format."""
         environments = []
+        now = now or _now_iso()
 
         # Get environment info
         env_name = data.get("name", "Imported Environment")
         env_id = data.get("_postman_id", "")
 
-        # Create environment
-        environment = Environment(name=env_name, id=env_id)
-
-        # Process variables
+        # Process variables; collected up front rather than through
+        # set_variable(), which would stamp updated_at for each one
+        variables = {}
         values = data.get("values", [])
         for value in values:
             key = value.get("key", "")
@@ -135,75 +171,114 @@ class PostmanImporter:
             enabled = value.get("enabled", True)
 
             if key and enabled:
-                environment.set_variable(key, val)
+                variables[sys.intern(key)] = val
+
+        # Create environment
+        environment = Environment(
+            name=env_name,
+            variables=variables,
+            id=env_id,
+            created_at=now,
+            updated_at=now,
+        )
 
         environments.append(environment)
         return environments
 
     @staticmethod
-    def _process_items(items: List[Dict[str, Any]], parent_collection: Collection):
+    def _process_items(
+        items: List[Dict[str, Any]],
+        parent_collection: Collection,
+        now: Optional[str] = None,
+    ):
         """Process Postman items (requests and folders)."""
-        for item in items:
-            if "item" in item:
-                # This is a folder
-                folder = PostmanImporter._create_folder_from_item(item)
-                parent_collection.folders.append(folder)
-            else:
-                # This is a request
-                request = PostmanImporter._create_request_from_item(item)
-                if request:
-                    parent_collection.add_request(request)
+        now = now or _now_iso()
+
+        # Nested folders are walked with a stack rather than by recursing
+        stack = [(items, parent_collection)]
+        while stack:
+            items, parent_collection = stack.pop()
+            for item in items:
+                if item is None:
+                    continue  # The request failed to build while parsing
+                if isinstance(item, Request):
+                    # Already built while the file was parsed
+                    parent_collection.add_request(item, now)
+                elif "item" in item:
+                    # This is a folder; its items are processed from the stack
+                    folder = PostmanImporter._new_folder(item, now)
+                    parent_collection.folders.append(folder)
+                    stack.append((item.get("item", []), folder))
+                else:
+                    # This is a request
+                    request = PostmanImporter._create_request_from_item(item, now)
+                    if request:
+                        parent_collection.add_request(request, now)
 
     @staticmethod
-    def _create_folder_from_item(item: Dict[str, Any]) -> Collection:
+    def _create_folder_from_item(
+        item: Dict[str, Any], now: Optional[str] = None
+    ) -> Collection:
         """Create a folder (collection) from a Postman item."""
-        folder_name = item.get("name", "Unnamed Folder")
-        folder_description = item.get("description", "")
-
-        folder = Collection(
-            name=folder_name,
-            description=folder_description,
-            id=item.get("_postman_id", ""),
-        )
+        now = now or _now_iso()
+        folder = PostmanImporter._new_folder(item, now)
 
         # Process items in the folder
         sub_items = item.get("item", [])
-        PostmanImporter._process_items(sub_items, folder)
+        PostmanImporter._process_items(sub_items, folder, now)
 
         return folder
 
     @staticmethod
-    def _create_request_from_item(item: Dict[str, Any]) -> Optional[Request]:
+    def _new_folder(item: Dict[str, Any], now: str) -> Collection:
+        """Create an empty folder (collection) from a Postman item."""
+        return Collection(
+            name=item.get("name", "Unnamed Folder"),
+            description=item.get("description", ""),
+            id=item.get("_postman_id", ""),
+            created_at=now,
+            updated_at=now,
+        )
+
+    @staticmethod
+    def _create_request_from_item(
+        item: Dict[str, Any], now: Optional[str] = None
+    ) -> Optional[Request]:
         """Create a request from a Postman item."""
+        now = now or _now_iso()
         try:
             name = item.get("name", "Unnamed Request")
             request_data = item.get("request", {})
 
             # Get method and URL
-            method = request_data.get("method", "GET")
+            method = sys.intern(request_data.get("method") or "GET")
             url_data = request_data.get("url", {})
 
-            # Handle different URL formats
-            if isinstance(url_data, str):
-                url = url_data
-            elif isinstance(url_data, dict):
+            # Handle different URL formats; JSON gives exact dicts and strs, and
+            # the object form is by far the most common, so it is checked first
+            params = {}
+            url_type = type(url_data)
+            if url_type is dict:
                 url = url_data.get("raw", "")
                 # Handle query parameters
                 query_params = url_data.get("query", [])
-                params = {}
-                for param in query_params:
-                    if param.get("key") and param.get("value"):
-                        params[param["key"]] = param["value"]
+                params = {
+                    key: value
+                    for param in query_params
+                    if (key := param.get("key")) and (value := param.get("value"))
+                }
+            elif url_type is str:
+                url = url_data
             else:
                 url = ""
-                params = {}
 
             # Get headers
-            headers = {}
             header_data = request_data.get("header", [])
-            for header in header_data:
-                if header.get("key") and header.get("value"):
-                    headers[header["key"]] = header["value"]
+            headers = {
+                key: value
+                for header in header_data
+                if (key := header.get("key")) and (value := header.get("value"))
+            }
 
             # Get body
             body_data = request_data.get("body", {})
@@ -217,35 +292,41 @@ class PostmanImporter:
                     body_type = "raw"
                 elif body_mode == "urlencoded":
                     form_data = body_data.get("urlencoded", [])
-                    form_dict = {}
-                    for form_item in form_data:
-                        if form_item.get("key") and form_item.get("value"):
-                            form_dict[form_item["key"]] = form_item["value"]
-                    body = json.dumps(form_dict)
+                    form_dict = {
+                        key: value
+                        for form_item in form_data
+                        if (key := form_item.get("key"))
+                        and (value := form_item.get("value"))
+                    }
+                    # Stored in wire form, as the request panel sends it; braces
+                    # stay literal so {{var}} placeholders are still substituted
+                    body = urlencode(form_dict, safe="{}")
                     body_type = "x-www-form-urlencoded"
                 elif body_mode == "formdata":
                     form_data = body_data.get("formdata", [])
-                    form_dict = {}
-                    for form_item in form_data:
-                        if form_item.get("key") and form_item.get("value"):
-                            form_dict[form_item["key"]] = form_item["value"]
+                    form_dict = {
+                        key: value
+                        for form_item in form_data
+                        if (key := form_item.get("key"))
+                        and (value := form_item.get("value"))
+                    }
                     body = json.dumps(form_dict)
                     body_type = "form-data"
 
-            # Get scripts
+            # Get scripts, keyed by the event they listen for
             event_data = item.get("event", [])
-            pre_request_script = ""
-            tests_script = ""
-
+            scripts = {}
             for event in event_data:
-                if event.get("listen") == "prerequest":
-                    script_data = event.get("script", {})
-                    if script_data.get("type") == "text/javascript":
-                        pre_request_script = script_data.get("exec", [""])[0]
-                elif event.get("listen") == "test":
-                    script_data = event.get("script", {})
-                    if script_data.get("type") == "text/javascript":
-                        tests_script = script_data.get("exec", [""])[0]
+                script_data = event.get("script", {})
+                if script_data.get("type") == "text/javascript":
+                    # exec is usually a list of lines, but may be a single string
+                    lines = script_data.get("exec") or ()
+                    if not isinstance(lines, str):
+                        lines = _join_script(tuple(lines))
+                    scripts[event.get("listen")] = lines
+
+            pre_request_script = scripts.get("prerequest", "")
+            tests_script = scripts.get("test", "")
 
             # Create request
             request = Request(
@@ -260,6 +341,8 @@ class PostmanImporter:
                 tests=tests_script,
                 description=item.get("description", ""),
                 id=item.get("_postman_id", ""),
+                created_at=now,
+                updated_at=now,
             )
 
             return request
@@ -2,9 +2,17 @@
 Request Panel for the API Testing Application
 """
 
-import json
-
-from PySide6.QtCore import Qt, Signal
+import logging
+from urllib.parse import urlencode
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -13,14 +21,12 @@ from PySide6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
-    QInputDialog,
     QLabel,
     QLineEdit,
     QMessageBox,
     QPushButton,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
     QTextEdit,
     QVBoxLayout,
@@ -29,6 +35,82 @@ from PySide6.QtWidgets import (
 
 from .models import Request
 
+logger = logging.getLogger(__name__)
+
+
+class KeyValueModel(QAbstractTableModel):
+    """Table model holding editable key/value rows, plus any extra columns."""
+
+    def __init__(self, headers, extra_default="", parent=None):
+        super().__init__(parent)
+        self.headers = tuple(headers)
+        self._extra = [extra_default] * (len(self.headers) - 2)
+        self._rows = []
+
+    def set_items(self, items):
+        """Replace all rows with the given (key, value) pairs."""
+        self.beginResetModel()
+        self._rows = [[key, value, *self._extra] for key, value in items]
+        self.endResetModel()
+
+    def add_row(self, key, value):
+        """Append a row for the given key and value."""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append([key, value, *self._extra])
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        """Remove the given row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+    def items(self):
+        """Get the rows as (key, value) pairs."""
+        return [(row[0], row[1]) for row in self._rows]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (
+            Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsEditable
+        )
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        row = self._rows[index.row()]
+        text = str(value)
+        if row[index.column()] == text:
+            return False
+        row[index.column()] = text
+        self.dataChanged.emit(index, index)
+        return True
+
 
 class RequestPanel(QWidget):
     """Panel for configuring and sending HTTP requests."""
@@ -38,6 +120,12 @@ class RequestPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_request = None
+
+        # Clicks on Send within this window of the previous one are dropped
+        self._send_guard = QTimer(self)
+        self._send_guard.setSingleShot(True)
+        self._send_guard.setInterval(250)
+
         self.init_ui()
 
     def init_ui(self):
@@ -65,7 +153,7 @@ class RequestPanel(QWidget):
         url_layout.addWidget(self.url_edit)
 
         self.send_btn = QPushButton("Send")
-        self.send_btn.clicked.connect(self.send_request_clicked)
+        self.send_btn.clicked.connect(self._on_send_clicked)
         url_layout.addWidget(self.send_btn)
 
         layout.addLayout(url_layout)
@@ -94,18 +182,25 @@ class RequestPanel(QWidget):
         self.tests_tab = self.create_tests_tab()
         self.tab_widget.addTab(self.tests_tab, "Tests")
 
+    @staticmethod
+    def _create_table_view(model):
+        """Create a table view over a key/value model with stretched columns."""
+        view = QTableView()
+        view.setModel(model)
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Fixed row height, so rows are never measured against their contents
+        view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        view.verticalHeader().setDefaultSectionSize(22)
+        return view
+
     def create_headers_tab(self):
         """Create the headers configuration tab."""
         widget = QWidget()
         layout = QVBoxLayout(widget)
 
         # Headers table
-        self.headers_table = QTableWidget()
-        self.headers_table.setColumnCount(2)
-        self.headers_table.setHorizontalHeaderLabels(["Key", "Value"])
-        self.headers_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.Stretch
-        )
+        self.headers_model = KeyValueModel(["Key", "Value"], parent=self)
+        self.headers_table = self._create_table_view(self.headers_model)
         layout.addWidget(self.headers_table)
 
         # Headers buttons
@@ -129,12 +224,8 @@ class RequestPanel(QWidget):
         layout = QVBoxLayout(widget)
 
         # Params table
-        self.params_table = QTableWidget()
-        self.params_table.setColumnCount(3)
-        self.params_table.setHorizontalHeaderLabels(["Key", "Value", "Description"])
-        self.params_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.Stretch
-        )
+        self.params_model = KeyValueModel(["Key", "Value", "Description"], parent=self)
+        self.params_table = self._create_table_view(self.params_model)
         layout.addWidget(self.params_table)
 
         # Params buttons
@@ -191,12 +282,10 @@ class RequestPanel(QWidget):
         layout = QVBoxLayout(widget)
 
         # Form data table
-        self.form_data_table = QTableWidget()
-        self.form_data_table.setColumnCount(3)
-        self.form_data_table.setHorizontalHeaderLabels(["Key", "Value", "Type"])
-        self.form_data_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.Stretch
+        self.form_data_model = KeyValueModel(
+            ["Key", "Value", "Type"], extra_default="Text", parent=self
         )
+        self.form_data_table = self._create_table_view(self.form_data_model)
         layout.addWidget(self.form_data_table)
 
         # Form data buttons
@@ -259,87 +348,69 @@ class RequestPanel(QWidget):
         elif body_type == "raw":
             self.body_stack.setCurrentIndex(1)
 
+    def _add_row(self, table, model):
+        """Append a blank row and start editing its key in place."""
+        model.add_row("", "")
+        index = model.index(model.rowCount() - 1, 0)
+        table.setCurrentIndex(index)
+        table.edit(index)
+        return index.row()
+
     def add_header(self):
         """Add a new header."""
-        key, ok = QInputDialog.getText(self, "Add Header", "Header name:")
-        if ok and key:
-            value, ok = QInputDialog.getText(self, "Add Header", "Header value:")
-            if ok:
-                row = self.headers_table.rowCount()
-                self.headers_table.insertRow(row)
-                self.headers_table.setItem(row, 0, QTableWidgetItem(key))
-                self.headers_table.setItem(row, 1, QTableWidgetItem(value))
+        self._add_row(self.headers_table, self.headers_model)
 
     def remove_header(self):
         """Remove the selected header."""
-        current_row = self.headers_table.currentRow()
+        current_row = self.headers_table.currentIndex().row()
         if current_row >= 0:
-            self.headers_table.removeRow(current_row)
+            self.headers_model.remove_row(current_row)
 
     def add_param(self):
         """Add a new parameter."""
-        key, ok = QInputDialog.getText(self, "Add Parameter", "Parameter name:")
-        if ok and key:
-            value, ok = QInputDialog.getText(self, "Add Parameter", "Parameter value:")
-            if ok:
-                row = self.params_table.rowCount()
-                self.params_table.insertRow(row)
-                self.params_table.setItem(row, 0, QTableWidgetItem(key))
-                self.params_table.setItem(row, 1, QTableWidgetItem(value))
-                self.params_table.setItem(row, 2, QTableWidgetItem(""))
+        self._add_row(self.params_table, self.params_model)
 
     def remove_param(self):
         """Remove the selected parameter."""
-        current_row = self.params_table.currentRow()
+        current_row = self.params_table.currentIndex().row()
         if current_row >= 0:
-            self.params_table.removeRow(current_row)
+            self.params_model.remove_row(current_row)
 
     def add_form_data(self):
         """Add a new form data field."""
-        key, ok = QInputDialog.getText(self, "Add Field", "Field name:")
-        if ok and key:
-            value, ok = QInputDialog.getText(self, "Add Field", "Field value:")
-            if ok:
-                row = self.form_data_table.rowCount()
-                self.form_data_table.insertRow(row)
-                self.form_data_table.setItem(row, 0, QTableWidgetItem(key))
-                self.form_data_table.setItem(row, 1, QTableWidgetItem(value))
-
-                type_combo = QComboBox()
-                type_combo.addItems(["Text", "File"])
-                self.form_data_table.setCellWidget(row, 2, type_combo)
+        row = self._add_row(self.form_data_table, self.form_data_model)
+        # Persistent, so the combo keeps writing to its row after removals
+        type_index = QPersistentModelIndex(self.form_data_model.index(row, 2))
+
+        type_combo = QComboBox()
+        type_combo.addItems(["Text", "File"])
+        type_combo.currentTextChanged.connect(
+            lambda text: self.form_data_model.setData(
+                self.form_data_model.index(type_index.row(), 2), text
+            )
+        )
+        self.form_data_table.setIndexWidget(
+            self.form_data_model.index(row, 2), type_combo
+        )
 
     def remove_form_data(self):
         """Remove the selected form data field."""
-        current_row = self.form_data_table.currentRow()
+        current_row = self.form_data_table.currentIndex().row()
         if current_row >= 0:
-            self.form_data_table.removeRow(current_row)
+            self.form_data_model.remove_row(current_row)
 
     def load_request(self, request):
         """Load a request into the panel."""
-        print(f"RequestPanel: Loading request: {request.name}")
+        logger.debug("Loading request: %s", request.name)
         self.current_request = request
 
         # Load basic request data
         self.method_combo.setCurrentText(request.method)
         self.url_edit.setText(request.url)
 
-        # Load headers
-        self.headers_table.setRowCount(0)
-        for key, value in request.headers.items():
-            row = self.headers_table.rowCount()
-            self.headers_table.insertRow(row)
-            self.headers_table.setItem(row, 0, QTableWidgetItem(key))
-            self.headers_table.setItem(row, 1, QTableWidgetItem(value))
-
-        # Load parameters
-        self.params_table.setRowCount(0)
-        for key, value in request.params.items():
-            row = self.params_table.rowCount()
-            self.params_table.insertRow(row)
-            self.params_table.setItem(row, 0, QTableWidgetItem(key))
-            self.params_table.setItem(row, 1, QTableWidgetItem(value))
-            self.params_table.setItem(row, 2, QTableWidgetItem(""))
+        # Load headers and parameters, one model reset each
+        self.headers_model.set_items(request.headers.items())
+        self.params_model.set_items(request.params.items())
 
         # Load body
         self.body_type_combo.setCurrentText(request.body_type)
@@ -349,106 +420,105 @@ class RequestPanel(QWidget):
         self.script_edit.setPlainText(request.pre_request_script)
         self.tests_edit.setPlainText(request.tests)
 
-    def save_request(self):
-        """Save the current request data."""
+    @staticmethod
+    def _model_dict(model, strip=False):
+        """Return a key/value model's rows as a dict, optionally trimmed.
+
+        Rows whose key is still blank, such as a just-added row, are skipped.
+        """
+        if not strip:
+            return {key: value for key, value in model.items() if key}
+        # Trimmed keys and values
+        return {k: value.strip() for key, value in model.items() if (k := key.strip())}
+
+    def _form_fields(self, strip=False):
+        """Read the editable request fields from the widgets in a single pass."""
+        return {
+            "method": self.method_combo.currentText(),
+            "url": self.url_edit.text(),
+            "headers": self._model_dict(self.headers_model, strip),
+            "params": self._model_dict(self.params_model, strip),
+            "body": self.raw_body_edit.toPlainText(),
+            "body_type": self.body_type_combo.currentText(),
+            "pre_request_script": self.script_edit.toPlainText(),
+            "tests": self.tests_edit.toPlainText(),
+        }
+
+    def save_request(self, fields=None):
+        """Save the current request data.
+
+        ``fields`` may be passed when the caller has already read the widgets
+        with _form_fields(), so the tables are not walked a second time.
+        """
         if not self.current_request:
             return
+        if fields is None:
+            fields = self._form_fields()
 
         # Save basic request data
-        self.current_request.method = self.method_combo.currentText()
-        self.current_request.url = self.url_edit.text()
+        self.current_request.method = fields["method"]
+        self.current_request.url = fields["url"]
 
         # Save headers
-        headers = {}
-        for row in range(self.headers_table.rowCount()):
-            key_item = self.headers_table.item(row, 0)
-            value_item = self.headers_table.item(row, 1)
-            if key_item and value_item:
-                headers[key_item.text()] = value_item.text()
-        self.current_request.headers = headers
+        self.current_request.headers = fields["headers"]
 
         # Save parameters
-        params = {}
-        for row in range(self.params_table.rowCount()):
-            key_item = self.params_table.item(row, 0)
-            value_item = self.params_table.item(row, 1)
-            if key_item and value_item:
-                params[key_item.text()] = value_item.text()
-        self.current_request.params = params
+        self.current_request.params = fields["params"]
 
         # Save body
-        self.current_request.body_type = self.body_type_combo.currentText()
-        self.current_request.body = self.raw_body_edit.toPlainText()
+        self.current_request.body_type = fields["body_type"]
+        self.current_request.body = fields["body"]
 
         # Save scripts
-        self.current_request.pre_request_script = self.script_edit.toPlainText()
-        self.current_request.tests = self.tests_edit.toPlainText()
+        self.current_request.pre_request_script = fields["pre_request_script"]
+        self.current_request.tests = fields["tests"]
+
+    def _on_send_clicked(self):
+        """Send on the first click of a burst and ignore the repeats."""
+        if not self._send_guard.isActive():
+            self.send_request_clicked()
+        self._send_guard.start()
+
+    def set_sending(self, sending):
+        """Disable the Send button while a request is in flight."""
+        self.send_btn.setEnabled(not sending)
 
     def send_request_clicked(self):
         """Handle send request button click."""
-        print(f"RequestPanel: Send button clicked!")
+        # Read every field once; the same dicts feed the saved request and the send
+        fields = self._form_fields()
 
         # Validate URL
-        url = self.url_edit.text().strip()
+        url = fields["url"].strip()
         if not url:
-            print("RequestPanel: URL is empty, not sending request")
+            logger.debug("URL is empty, not sending request")
             return
 
         # Save current request
-        self.save_request()
+        self.save_request(fields)
 
         # Prepare request data
-        request_data = {
-            "method": self.method_combo.currentText(),
-            "url": url,
-            "headers": {},
-            "params": {},
-            "body": "",
-            "body_type": self.body_type_combo.currentText(),
-            "pre_request_script": self.script_edit.toPlainText(),
-            "tests": self.tests_edit.toPlainText(),
-        }
-
-        # Get headers
-        for row in range(self.headers_table.rowCount()):
-            key_item = self.headers_table.item(row, 0)
-            value_item = self.headers_table.item(row, 1)
-            if key_item and value_item:
-                request_data["headers"][key_item.text()] = value_item.text()
-
-        # Get parameters
-        for row in range(self.params_table.rowCount()):
-            key_item = self.params_table.item(row, 0)
-            value_item = self.params_table.item(row, 1)
-            if key_item and value_item:
-                request_data["params"][key_item.text()] = value_item.text()
+        request_data = dict(fields, url=url, body="")
 
         # Get body
-        if self.body_type_combo.currentText() == "raw":
-            request_data["body"] = self.raw_body_edit.toPlainText()
-        elif self.body_type_combo.currentText() in [
+        body_type = fields["body_type"]
+        if body_type == "raw":
+            request_data["body"] = fields["body"]
+        elif body_type in [
             "form-data",
             "x-www-form-urlencoded",
         ]:
             # Convert form data to appropriate format
-            form_data = {}
-            for row in range(self.form_data_table.rowCount()):
-                key_item = self.form_data_table.item(row, 0)
-                value_item = self.form_data_table.item(row, 1)
-                if key_item and value_item:
-                    form_data[key_item.text()] = value_item.text()
-
-            if self.body_type_combo.currentText() == "x-www-form-urlencoded":
-                import urllib.parse
+            form_data = self._model_dict(self.form_data_model)
 
-                request_data["body"] = urllib.parse.urlencode(form_data)
+            if body_type == "x-www-form-urlencoded":
+                request_data["body"] = urlencode(form_data)
             else:
-                request_data["body"] = json.dumps(form_data)
+                # Handed over as a dict; no JSON round trip through the body
+                request_data["form_fields"] = form_data
 
         # Emit signal
-        print(
-            f"RequestPanel: Emitting request data: {request_data.get('method')} {request_data.get('url')}"
-        )
+        logger.debug("Emitting request data: %s %s", request_data["method"], url)
         self.send_request.emit(request_data)
 
     def get_current_request(self):
@@ -456,36 +526,9 @@ class RequestPanel(QWidget):
         if not self.current_request:
             return None
 
-        # Update current request with current UI data
-        self.current_request.method = self.method_combo.currentText()
-        self.current_request.url = self.url_edit.text()
-
-        # Update headers
-        headers = {}
-        for row in range(self.headers_table.rowCount()):
-            key_item = self.headers_table.item(row, 0)
-            value_item = self.headers_table.item(row, 1)
-            if key_item and value_item and key_item.text().strip():
-                headers[key_item.text().strip()] = value_item.text().strip()
-        self.current_request.headers = headers
-
-        # Update params
-        params = {}
-        for row in range(self.params_table.rowCount()):
-            key_item = self.params_table.item(row, 0)
-            value_item = self.params_table.item(row, 1)
-            if key_item and value_item and key_item.text().strip():
-                params[key_item.text().strip()] = value_item.text().strip()
-        self.current_request.params = params
-
-        # Update body
-        self.current_request.body = self.raw_body_edit.toPlainText()
-        self.current_request.body_type = (
-            self.body_type_combo.currentText().lower().replace(" ", "-")
-        )
-
-        # Update scripts
-        self.current_request.pre_request_script = self.script_edit.toPlainText()
-        self.current_request.tests = self.tests_edit.toPlainText()
+        # Update current request with current UI data, trimming table rows
+        fields = self._form_fields(strip=True)
+        fields["body_type"] = fields["body_type"].lower().replace(" ", "-")
+        self.save_request(fields)
 
         return self.current_request
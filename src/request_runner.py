@@ -3,13 +3,98 @@ Request Runner for the API Testing Application
 """
 
 import json
+import logging
 import re
 import time
+from http.cookiejar import DefaultCookiePolicy
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
 from PySide6.QtCore import QThread, Signal
 
+logger = logging.getLogger(__name__)
+
+# Patterns are compiled once here rather than on every call
+_ENV_VAR_RE = re.compile(r"\{\{([^}]+)\}\}")
+_PM_SET_RE = re.compile(
+    r'pm\.environment\.set\s*\(\s*["\']([^"\']+)["\']\s*,\s*["\']([^"\']+)["\']\s*\)'
+)
+_PM_TEST_HEAD_RE = re.compile(
+    r'pm\.test\s*\(\s*["\']([^"\']+)["\']\s*,\s*function\s*\(\)\s*\{'
+)
+_BRACE_RE = re.compile(r"[{}]")
+
+# Recognised pm.test assertions, checked in order: (marker, check) where
+# check(response_data) returns (passed, detail shown on failure)
+_ASSERTIONS = (
+    (
+        "pm.response.to.have.status(200)",
+        lambda r: (r["status_code"] == 200, f"got {r['status_code']}"),
+    ),
+    (
+        "pm.expect(pm.response.responseTime).to.be.below(1000)",
+        lambda r: (r["response_time"] < 1000, f"took {r['response_time']:.2f}ms"),
+    ),
+    (
+        'pm.response.to.have.header("Content-Type")',
+        lambda r: ("Content-Type" in r["headers"], "Content-Type header not found"),
+    ),
+    (
+        'pm.response.to.have.status("OK")',
+        lambda r: (r["status_code"] == 200, "status not OK"),
+    ),
+)
+
+
+def _pm_test_blocks(script):
+    """Yield (name, body) for each pm.test() block in a single forward scan.
+
+    Bodies are found by brace depth, so object literals and nested functions
+    inside a test don't cut it short. A block that is never closed is skipped.
+    """
+    pos = 0
+    while match := _PM_TEST_HEAD_RE.search(script, pos):
+        depth = 1
+        pos = match.end()
+        for brace in _BRACE_RE.finditer(script, pos):
+            depth += 1 if brace.group() == "{" else -1
+            if depth == 0:
+                yield match.group(1), script[match.end() : brace.start()]
+                pos = brace.end()
+                break
+
+
+def _decode_body(content, encoding):
+    """Decode body bytes the way Response.text would.
+
+    Without a declared encoding, the charset is detected from the bytes, as
+    Response.apparent_encoding does. That property can't be used here because
+    the streamed body has already been consumed.
+    """
+    if not encoding:
+        encoding = chardet.detect(content)["encoding"] if chardet else None
+    try:
+        return content.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        # An encoding name Python doesn't know
+        return content.decode("utf-8", errors="replace")
+
+
+def create_session(pool_connections=10, pool_maxsize=20):
+    """Create a Session that keeps connections alive between requests.
+
+    The session stores no cookies. Every request goes out with only the
+    headers it was given, as when each one used its own throwaway session.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class RequestRunner(QThread):
     """Thread for executing HTTP requests."""
@@ -17,16 +102,61 @@ class RequestRunner(QThread):
     response_received = Signal(dict)
     error_occurred = Signal(str)
 
-    def __init__(self, request_data, environment=None):
+    # Bodies larger than this many bytes are cut off rather than held in memory
+    max_body_size = 10 * 1024 * 1024
+
+    # Most substitution results remembered; the oldest is dropped beyond this
+    subst_cache_size = 256
+
+    def __init__(self, request_data, environment=None, session=None):
         super().__init__()
         self.request_data = request_data
         self.environment = environment
+        self.session = session  # Optional requests.Session shared between runners
         self.response_data = None
         self.test_results = None
+        self.error_message = None
+        self._subst_cache = {}  # (text, environment version) -> substituted text
 
     def run(self):
-        """Execute the HTTP request."""
-        print(f"RequestRunner: Starting request execution...")
+        """Execute the HTTP request on this thread and emit the outcome."""
+        self.execute()
+        if self.error_message:
+            self.error_occurred.emit(self.error_message)
+        else:
+            logger.debug(
+                "Emitting response with status %s", self.response_data["status_code"]
+            )
+            self.response_received.emit(self.response_data)
+
+    def execute(self, request_kwargs=None):
+        """Execute the HTTP request synchronously on the calling thread.
+
+        Stores the response and test results for get_response() and
+        get_test_results() instead of emitting signals, so callers that
+        already run off the GUI thread don't need a QThread per request.
+        ``request_kwargs`` from an earlier prepare() skips that step.
+        """
+        logger.debug("Starting request execution")
+        if request_kwargs is None:
+            request_kwargs = self.prepare()
+            if request_kwargs is None:
+                return  # prepare() stored the error
+
+        try:
+            self._send(request_kwargs)
+        except requests.exceptions.RequestException as e:
+            self._fail("Request failed", e)
+        except Exception as e:
+            self._fail("Unexpected error", e)
+
+    def prepare(self):
+        """Run the pre-request script and build the HTTP call's arguments.
+
+        This is the only step that reads or writes the environment. Returns
+        the keyword arguments for Session.request(), or None once the error
+        has been stored for get_response().
+        """
         try:
             # Process pre-request script
             self.process_pre_request_script()
@@ -34,8 +164,10 @@ class RequestRunner(QThread):
             # Prepare request
             method = self.request_data.get("method", "GET")
             url = self.request_data.get("url", "")
-            headers = self.request_data.get("headers", {}).copy()
-            params = self.request_data.get("params", {}).copy()
+            # Not copied: substitution builds new dicts only when values change,
+            # and a default Content-Type is added to a copy below
+            headers = self.request_data.get("headers", {})
+            params = self.request_data.get("params", {})
             body = self.request_data.get("body", "")
             body_type = self.request_data.get("body_type", "none")
 
@@ -52,103 +184,133 @@ class RequestRunner(QThread):
                 "headers": headers,
                 "params": params,
                 "timeout": 30,
+                "stream": True,  # Body is read in chunks, up to max_body_size
             }
 
             # Handle body
             if body_type == "raw" and body:
                 request_kwargs["data"] = body
                 if "Content-Type" not in headers:
-                    headers["Content-Type"] = "application/json"
-            elif body_type in ["form-data", "x-www-form-urlencoded"] and body:
-                if body_type == "x-www-form-urlencoded":
-                    request_kwargs["data"] = body
-                    if "Content-Type" not in headers:
-                        headers["Content-Type"] = "application/x-www-form-urlencoded"
-                else:
-                    # Handle form-data
+                    request_kwargs["headers"] = {
+                        **headers,
+                        "Content-Type": "application/json",
+                    }
+            elif body_type == "x-www-form-urlencoded" and body:
+                request_kwargs["data"] = body
+                if "Content-Type" not in headers:
+                    request_kwargs["headers"] = {
+                        **headers,
+                        "Content-Type": "application/x-www-form-urlencoded",
+                    }
+            elif body_type == "form-data":
+                # The request panel passes its fields as a dict; saved and
+                # imported requests carry them as a JSON body
+                form_fields = self.request_data.get("form_fields")
+                if form_fields is not None:
+                    request_kwargs["data"] = (
+                        self.replace_environment_variables_in_dict(form_fields)
+                    )
+                elif body:
                     try:
                         form_data = json.loads(body)
                         request_kwargs["data"] = form_data
                     except json.JSONDecodeError:
                         request_kwargs["data"] = body
-
-            # Execute request
-            print(f"RequestRunner: Executing {method} request to {url}")
-            start_time = time.time()
-            response = requests.request(**request_kwargs)
-            end_time = time.time()
-            print(
-                f"RequestRunner: Request completed in {(end_time - start_time) * 1000:.2f}ms"
-            )
-
-            # Prepare response data
-            response_data = {
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "body": response.text,
-                "response_time": (end_time - start_time)
-                * 1000,  # Convert to milliseconds
-                "size": len(response.content),
-                "url": response.url,
-                "method": method,
-            }
-
-            # Run tests if provided
-            test_results = self.run_tests(response_data)
-            response_data["test_results"] = test_results
-
-            # Store results for synchronous access
-            self.response_data = response_data
-            self.test_results = test_results
-
-            # Emit response
-            print(
-                f"RequestRunner: Emitting response with status {response_data['status_code']}"
-            )
-            self.response_received.emit(response_data)
-
-        except requests.exceptions.RequestException as e:
-            print(f"RequestRunner: Request failed: {str(e)}")
-            # Create error response data
-            error_response_data = {
-                "status_code": 0,
-                "headers": {},
-                "body": "",
-                "response_time": 0,
-                "size": 0,
-                "url": self.request_data.get("url", ""),
-                "method": self.request_data.get("method", "GET"),
-                "error": str(e),
-                "test_results": {
-                    "passed": False,
-                    "results": [f"Request failed: {str(e)}"],
-                    "summary": "Request failed",
-                },
-            }
-            self.response_data = error_response_data
-            self.test_results = error_response_data["test_results"]
-            self.error_occurred.emit(f"Request failed: {str(e)}")
         except Exception as e:
-            print(f"RequestRunner: Unexpected error: {str(e)}")
-            # Create error response data
-            error_response_data = {
-                "status_code": 0,
-                "headers": {},
-                "body": "",
-                "response_time": 0,
-                "size": 0,
-                "url": self.request_data.get("url", ""),
-                "method": self.request_data.get("method", "GET"),
-                "error": str(e),
-                "test_results": {
-                    "passed": False,
-                    "results": [f"Unexpected error: {str(e)}"],
-                    "summary": "Unexpected error",
-                },
-            }
-            self.response_data = error_response_data
-            self.test_results = error_response_data["test_results"]
-            self.error_occurred.emit(f"Unexpected error: {str(e)}")
+            self._fail("Unexpected error", e)
+            return None
+        return request_kwargs
+
+    def _send(self, request_kwargs):
+        """Send a prepared request and store the response and test results."""
+        method = request_kwargs["method"]
+        url = request_kwargs["url"]
+
+        # Execute request
+        logger.debug("Executing %s request to %s", method, url)
+        start_time = time.time()
+        sender = self.session if self.session is not None else requests
+        response = sender.request(**request_kwargs)
+        try:
+            content, truncated = self._read_body(response)
+        finally:
+            response.close()
+        end_time = time.time()
+        logger.debug("Request completed in %.2fms", (end_time - start_time) * 1000)
+
+        # Decode once; the raw bytes are not kept alongside the text
+        body = _decode_body(content, response.encoding)
+        if truncated:
+            body += f"\n[truncated at {self.max_body_size} bytes]"
+
+        # Prepare response data
+        response_data = {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "body": body,
+            "response_time": (end_time - start_time) * 1000,  # In milliseconds
+            "size": self._body_size(response, content, truncated),
+            "truncated": truncated,
+            "url": response.url,
+            "method": method,
+        }
+
+        # Run tests if provided
+        test_results = self.run_tests(response_data)
+        response_data["test_results"] = test_results
+
+        # Store results for synchronous access
+        self.response_data = response_data
+        self.test_results = test_results
+
+    def _fail(self, summary, error):
+        """Store an error response, as get_response() and run() report it."""
+        logger.debug("%s: %s", summary, error)
+        message = f"{summary}: {error}"
+        self.response_data = {
+            "status_code": 0,
+            "headers": {},
+            "body": "",
+            "response_time": 0,
+            "size": 0,
+            "url": self.request_data.get("url", ""),
+            "method": self.request_data.get("method", "GET"),
+            "error": str(error),
+            "test_results": {
+                "passed": False,
+                "results": [message],
+                "summary": summary,
+            },
+        }
+        self.test_results = self.response_data["test_results"]
+        self.error_message = message
+
+    def _read_body(self, response):
+        """Read a streamed response body, stopping after max_body_size bytes.
+
+        Returns the bytes read and whether the body was cut short.
+        """
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total > self.max_body_size:
+                return b"".join(chunks)[: self.max_body_size], True
+        return b"".join(chunks), False
+
+    @staticmethod
+    def _body_size(response, content, truncated):
+        """Size of the response body in bytes, without re-reading it.
+
+        A complete body is measured directly. A truncated one reports the
+        server's Content-Length when it sent a usable one.
+        """
+        if truncated:
+            length = response.headers.get("Content-Length", "")
+            if length.isdigit():
+                return int(length)
+        return len(content)
 
     def process_pre_request_script(self):
         """Process pre-request script to set environment variables."""
@@ -162,10 +324,7 @@ class RequestRunner(QThread):
         for line in lines:
             line = line.strip()
             # Look for patterns like: pm.environment.set("key", "value");
-            match = re.search(
-                r'pm\.environment\.set\s*\(\s*["\']([^"\']+)["\']\s*,\s*["\']([^"\']+)["\']\s*\)',
-                line,
-            )
+            match = _PM_SET_RE.search(line)
             if match:
                 key = match.group(1)
                 value = match.group(2)
@@ -173,27 +332,42 @@ class RequestRunner(QThread):
 
     def replace_environment_variables(self, text):
         """Replace environment variables in text."""
-        if not self.environment:
+        # Most text has no placeholders; skip the regex scan for it
+        if not self.environment or not text or "{{" not in text:
             return text
 
-        # Replace {{variable}} patterns
-        pattern = r"\{\{([^}]+)\}\}"
+        # The same placeholder text often recurs across a request's values
+        key = (text, self.environment.version)
+        result = self._subst_cache.get(key)
+        if result is not None:
+            return result
 
+        # Replace {{variable}} patterns
         def replace_var(match):
             var_name = match.group(1)
             return self.environment.get_variable(var_name) or match.group(0)
 
-        return re.sub(pattern, replace_var, text)
+        result = _ENV_VAR_RE.sub(replace_var, text)
+        if len(self._subst_cache) >= self.subst_cache_size:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._subst_cache[next(iter(self._subst_cache))]
+        self._subst_cache[key] = result
+        return result
 
     def replace_environment_variables_in_dict(self, data_dict):
-        """Replace environment variables in dictionary values."""
-        if not self.environment:
+        """Replace environment variables in dictionary values.
+
+        The dict itself is returned when no value contains a placeholder.
+        """
+        if not self.environment or not any(
+            "{{" in value for value in data_dict.values()
+        ):
             return data_dict
 
-        result = {}
-        for key, value in data_dict.items():
-            result[key] = self.replace_environment_variables(value)
-        return result
+        return {
+            key: self.replace_environment_variables(value)
+            for key, value in data_dict.items()
+        }
 
     def run_tests(self, response_data):
         """Run test scripts on the response."""
@@ -210,12 +384,8 @@ class RequestRunner(QThread):
         passed_tests = 0
         total_tests = 0
 
-        # Count all pm.test() blocks
-        test_blocks = re.findall(
-            r'pm\.test\s*\(\s*["\']([^"\']+)["\']\s*,\s*function\s*\(\)\s*\{[^}]*\}',
-            tests_script,
-            re.DOTALL,
-        )
+        # Collect all pm.test() blocks as (name, body) pairs
+        test_blocks = list(_pm_test_blocks(tests_script))
         total_tests = len(test_blocks)
 
         if total_tests == 0:
@@ -225,64 +395,21 @@ class RequestRunner(QThread):
                 total_tests = 1
                 passed_tests = 1
         else:
-            # Process each test block
-            for i, test_name in enumerate(test_blocks):
-                # Extract the test block content
-                test_pattern = rf'pm\.test\s*\(\s*["\']{re.escape(test_name)}["\']\s*,\s*function\s*\(\)\s*\{{([^}}]*)\}}'
-                test_match = re.search(test_pattern, tests_script, re.DOTALL)
-
-                if test_match:
-                    test_content = test_match.group(1)
-
-                    # Check status code tests
-                    if "pm.response.to.have.status(200)" in test_content:
-                        if response_data["status_code"] == 200:
-                            test_results.append(f"✓ {test_name} passed")
-                            passed_tests += 1
-                        else:
-                            test_results.append(
-                                f"✗ {test_name} failed (got {response_data['status_code']})"
-                            )
-
-                    # Check response time tests
-                    elif (
-                        "pm.expect(pm.response.responseTime).to.be.below(1000)"
-                        in test_content
-                    ):
-                        if response_data["response_time"] < 1000:
-                            test_results.append(f"✓ {test_name} passed")
-                            passed_tests += 1
-                        else:
-                            test_results.append(
-                                f"✗ {test_name} failed (took {response_data['response_time']:.2f}ms)"
-                            )
-
-                    # Check Content-Type header tests
-                    elif 'pm.response.to.have.header("Content-Type")' in test_content:
-                        if "Content-Type" in response_data["headers"]:
-                            test_results.append(f"✓ {test_name} passed")
-                            passed_tests += 1
-                        else:
-                            test_results.append(
-                                f"✗ {test_name} failed (Content-Type header not found)"
-                            )
-
-                    # Check status name tests
-                    elif 'pm.response.to.have.status("OK")' in test_content:
-                        if response_data["status_code"] == 200:
-                            test_results.append(f"✓ {test_name} passed")
-                            passed_tests += 1
-                        else:
-                            test_results.append(f"✗ {test_name} failed (status not OK)")
-
-                    # Default: assume test passed if we can't parse it
-                    else:
-                        test_results.append(f"✓ {test_name} passed")
-                        passed_tests += 1
+            # Process each test block against the first assertion it contains
+            for test_name, test_content in test_blocks:
+                for marker, check in _ASSERTIONS:
+                    if marker in test_content:
+                        passed, detail = check(response_data)
+                        break
                 else:
-                    # Fallback if we can't extract the test content
+                    # Default: assume test passed if we can't parse it
+                    passed = True
+
+                if passed:
                     test_results.append(f"✓ {test_name} passed")
                     passed_tests += 1
+                else:
+                    test_results.append(f"✗ {test_name} failed ({detail})")
 
         # If we still don't have results, add basic checks
         if not test_results and total_tests > 0:
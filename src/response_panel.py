@@ -3,8 +3,9 @@ Response Panel for the API Testing Application
 """
 
 import json
+import logging
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PySide6.QtGui import QColor, QFont
 from PySide6.QtWidgets import (
     QFormLayout,
@@ -14,8 +15,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QProgressBar,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
     QTextEdit,
     QVBoxLayout,
@@ -24,6 +24,42 @@ from PySide6.QtWidgets import (
 
 from .models import Response
 
+logger = logging.getLogger(__name__)
+
+
+class ResponseTableModel(QAbstractTableModel):
+    """Read-only table model over rows of strings, such as response headers."""
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self.headers = tuple(headers)
+        self._rows = []
+
+    def set_rows(self, rows):
+        """Replace all rows with the given tuples of column values."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
 
 class ResponsePanel(QWidget):
     """Panel for displaying HTTP responses."""
@@ -123,12 +159,17 @@ class ResponsePanel(QWidget):
         layout = QVBoxLayout(widget)
 
         # Headers table
-        self.headers_table = QTableWidget()
-        self.headers_table.setColumnCount(2)
-        self.headers_table.setHorizontalHeaderLabels(["Header", "Value"])
+        self.headers_model = ResponseTableModel(["Header", "Value"], self)
+        self.headers_table = QTableView()
+        self.headers_table.setModel(self.headers_model)
         self.headers_table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
+        # Fixed row height, so rows are never measured against their contents
+        self.headers_table.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
+        self.headers_table.verticalHeader().setDefaultSectionSize(22)
         self.headers_table.setMaximumHeight(150)  # Limit height to make it more compact
         layout.addWidget(self.headers_table)
 
@@ -140,14 +181,19 @@ class ResponsePanel(QWidget):
         layout = QVBoxLayout(widget)
 
         # Cookies table
-        self.cookies_table = QTableWidget()
-        self.cookies_table.setColumnCount(4)
-        self.cookies_table.setHorizontalHeaderLabels(
-            ["Name", "Value", "Domain", "Path"]
+        self.cookies_model = ResponseTableModel(
+            ["Name", "Value", "Domain", "Path"], self
         )
+        self.cookies_table = QTableView()
+        self.cookies_table.setModel(self.cookies_model)
         self.cookies_table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
+        # Fixed row height, so rows are never measured against their contents
+        self.cookies_table.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
+        self.cookies_table.verticalHeader().setDefaultSectionSize(22)
         self.cookies_table.setMaximumHeight(100)  # Limit height to make it more compact
         layout.addWidget(self.cookies_table)
 
@@ -168,14 +214,15 @@ class ResponsePanel(QWidget):
 
     def display_response(self, response_data):
         """Display a response in the panel."""
-        print(
-            f"ResponsePanel: Received response with status {response_data.get('status_code', 'Unknown')}"
+        logger.debug(
+            "Received response with status %s",
+            response_data.get("status_code", "Unknown"),
         )
         self.current_response = response_data
 
         # Update status information
         status_code = response_data.get("status_code", 0)
-        print(f"ResponsePanel: Updating status code to {status_code}")
+        logger.debug("Updating status code to %s", status_code)
         self.status_code_label.setText(f"{status_code}")
 
         # Set status code color
@@ -212,7 +259,7 @@ class ResponsePanel(QWidget):
 
         # Update body
         body = response_data.get("body", "")
-        print(f"ResponsePanel: Updating response body (length: {len(body)})")
+        logger.debug("Updating response body (length: %d)", len(body))
         self.body_edit.setPlainText(body)
 
         # Try to format JSON
@@ -231,19 +278,15 @@ class ResponsePanel(QWidget):
 
         # Update headers
         headers = response_data.get("headers", {})
-        print(f"ResponsePanel: Updating response headers (count: {len(headers)})")
-        self.headers_table.setRowCount(len(headers))
-
-        for i, (key, value) in enumerate(headers.items()):
-            self.headers_table.setItem(i, 0, QTableWidgetItem(key))
-            self.headers_table.setItem(i, 1, QTableWidgetItem(value))
+        logger.debug("Updating response headers (count: %d)", len(headers))
+        self.headers_model.set_rows(headers.items())
 
         # Update cookies (placeholder for now)
-        self.cookies_table.setRowCount(0)
+        self.cookies_model.set_rows([])
 
         # Update test results
         test_results = response_data.get("test_results", "No tests executed")
-        print(f"ResponsePanel: Updating test results: {test_results}")
+        logger.debug("Updating test results: %s", test_results)
         self.update_test_results(test_results)
 
     def format_size(self, size_bytes):
@@ -261,20 +304,20 @@ class ResponsePanel(QWidget):
 
     def clear_response(self):
         """Clear the response display."""
-        print("ResponsePanel: Clearing response display")
+        logger.debug("Clearing response display")
         self.status_code_label.setText("")
         self.response_time_label.setText("")
         self.size_label.setText("")
         self.url_label.setText("")
         self.body_edit.clear()
-        self.headers_table.setRowCount(0)
-        self.cookies_table.setRowCount(0)
+        self.headers_model.set_rows([])
+        self.cookies_model.set_rows([])
         self.tests_edit.clear()
         self.body_type_label.setText("")
 
     def display_error(self, error_message):
         """Display an error message."""
-        print(f"ResponsePanel: Displaying error: {error_message}")
+        logger.debug("Displaying error: %s", error_message)
         self.clear_response()
         self.status_code_label.setText("Error")
         self.status_code_label.setStyleSheet(
@@ -282,7 +325,7 @@ class ResponsePanel(QWidget):
         )
         self.body_edit.setPlainText(f"Request failed: {error_message}")
         self.body_type_label.setText("Error")
-        print(f"ResponsePanel: Error displayed in body: {error_message}")
+        logger.debug("Error displayed in body: %s", error_message)
 
     def update_test_results(self, test_results):
         """Update test results with visual feedback."""
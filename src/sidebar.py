@@ -2,6 +2,8 @@
 Sidebar component for the API Testing Application
 """
 
+import logging
+
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont, QIcon
 from PySide6.QtWidgets import (
@@ -29,6 +31,8 @@ from PySide6.QtWidgets import (
 
 from .models import Collection, Environment, Request
 
+logger = logging.getLogger(__name__)
+
 
 class Sidebar(QWidget):
     """Sidebar widget containing collections and environments."""
@@ -70,6 +74,7 @@ class Sidebar(QWidget):
             self.show_collection_context_menu
         )
         self.collections_tree.itemClicked.connect(self.on_collection_item_clicked)
+        self.collections_tree.itemExpanded.connect(self.on_item_expanded)
         layout.addWidget(self.collections_tree)
 
         # Buttons
@@ -88,49 +93,52 @@ class Sidebar(QWidget):
         self.collections = collections
         self.collections_tree.clear()
 
+        tree = self.collections_tree
         for collection in collections:
-            collection_item = QTreeWidgetItem(self.collections_tree)
-            collection_item.setText(0, collection.name)
-            collection_item.setData(0, Qt.ItemDataRole.UserRole, collection)
-
-            # Add requests
-            for request in collection.requests:
-                request_item = QTreeWidgetItem(collection_item)
-                request_item.setText(0, f"{request.method} {request.name}")
-                request_item.setData(0, Qt.ItemDataRole.UserRole, request)
-
-            # Add folders
-            for folder in collection.folders:
-                folder_item = QTreeWidgetItem(collection_item)
-                folder_item.setText(0, f"📁 {folder.name}")
-                folder_item.setData(0, Qt.ItemDataRole.UserRole, folder)
-
-                # Add requests in folders
-                for request in folder.requests:
-                    request_item = QTreeWidgetItem(folder_item)
-                    request_item.setText(0, f"{request.method} {request.name}")
-                    request_item.setData(0, Qt.ItemDataRole.UserRole, request)
-
-                # Add sub-folders (recursive)
-                self._add_folders_recursive(folder_item, folder.folders)
-
-        self.collections_tree.expandAll()
-
-    def _add_folders_recursive(self, parent_item, folders):
-        """Recursively add folders to the tree."""
-        for folder in folders:
-            folder_item = QTreeWidgetItem(parent_item)
-            folder_item.setText(0, f"📁 {folder.name}")
-            folder_item.setData(0, Qt.ItemDataRole.UserRole, folder)
-
-            # Add requests in folders
-            for request in folder.requests:
-                request_item = QTreeWidgetItem(folder_item)
-                request_item.setText(0, f"{request.method} {request.name}")
-                request_item.setData(0, Qt.ItemDataRole.UserRole, request)
-
-            # Add sub-folders (recursive)
-            self._add_folders_recursive(folder_item, folder.folders)
+            self._add_collection_item(tree, collection, collection.name)
+
+    def add_collection(self, collection):
+        """Show a collection that was appended to the collections list."""
+        self._add_collection_item(self.collections_tree, collection, collection.name)
+
+    def _add_collection_item(self, parent, collection, label):
+        """Add a collection or folder item to the tree."""
+        collection_item = QTreeWidgetItem(parent)
+        collection_item.setText(0, label)
+        collection_item.setData(0, Qt.ItemDataRole.UserRole, collection)
+
+        if collection.requests_loaded:
+            self._populate_collection_item(collection_item, collection)
+            collection_item.setExpanded(True)
+        else:
+            # Saved requests are only built and listed once the item is expanded
+            collection_item.setChildIndicatorPolicy(
+                QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+            )
+
+    def _populate_collection_item(self, collection_item, collection):
+        """Add the requests and folders of a collection under its item."""
+        # Add requests
+        for request in collection.requests:
+            request_item = QTreeWidgetItem(collection_item)
+            request_item.setText(0, f"{request.method} {request.name}")
+            request_item.setData(0, Qt.ItemDataRole.UserRole, request)
+
+        # Add folders (recursive)
+        for folder in collection.folders:
+            self._add_collection_item(collection_item, folder, f"📁 {folder.name}")
+
+    def on_item_expanded(self, item):
+        """Fill in a lazily loaded collection the first time it is expanded."""
+        policy = QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+        if item.childIndicatorPolicy() != policy:
+            return
+
+        item.setChildIndicatorPolicy(
+            QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless
+        )
+        collection = item.data(0, Qt.ItemDataRole.UserRole)
+        self._populate_collection_item(item, collection)
 
     def show_collection_context_menu(self, position):
         """Show context menu for collections."""
@@ -210,7 +218,7 @@ class Sidebar(QWidget):
         """Handle collection item click."""
         data = item.data(0, Qt.ItemDataRole.UserRole)
         if isinstance(data, Request):
-            print(f"Sidebar: Request selected: {data.name}")
+            logger.debug("Request selected: %s", data.name)
             self.request_selected.emit(data)
 
     def new_request(self):
@@ -367,11 +375,11 @@ class Sidebar(QWidget):
 
     def run_all_requests(self, collection):
         """Run all requests in a collection or folder."""
-        print(f"Sidebar: run_all_requests called for collection: {collection.name}")
+        logger.debug("run_all_requests called for collection: %s", collection.name)
 
         # Get all requests from the collection (including nested folders)
         all_requests = self._get_all_requests_from_collection(collection)
-        print(f"Sidebar: Found {len(all_requests)} requests in collection")
+        logger.debug("Found %d requests in collection", len(all_requests))
 
         if not all_requests:
             QMessageBox.information(
@@ -388,47 +396,49 @@ class Sidebar(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            print(f"Sidebar: User confirmed running {len(all_requests)} requests")
+            logger.debug("User confirmed running %d requests", len(all_requests))
             # Notify parent to run all requests
             parent = self.parent()
             while parent and not hasattr(parent, "run_all_requests"):
                 parent = parent.parent()
 
             if parent and hasattr(parent, "run_all_requests"):
-                print(f"Sidebar: Calling parent.run_all_requests")
+                logger.debug("Calling parent.run_all_requests")
                 parent.run_all_requests(all_requests)
             else:
-                print(
-                    f"Sidebar: Could not find run_all_requests method in parent hierarchy"
+                logger.debug(
+                    "Could not find run_all_requests method in parent hierarchy"
                 )
                 QMessageBox.warning(
                     self, "Error", "Could not start batch testing. Please try again."
                 )
         else:
-            print(f"Sidebar: User cancelled batch run")
+            logger.debug("User cancelled batch run")
 
     def _get_all_requests_from_collection(self, collection):
         """Get all requests from a collection, including nested folders."""
         requests = []
 
         # Add direct requests
-        print(
-            f"Sidebar: Collection '{collection.name}' has {len(collection.requests)} direct requests"
+        logger.debug(
+            "Collection '%s' has %d direct requests",
+            collection.name,
+            len(collection.requests),
         )
         requests.extend(collection.requests)
 
         # Add requests from nested folders
-        print(
-            f"Sidebar: Collection '{collection.name}' has {len(collection.folders)} folders"
+        logger.debug(
+            "Collection '%s' has %d folders", collection.name, len(collection.folders)
         )
         for folder in collection.folders:
             folder_requests = self._get_all_requests_from_collection(folder)
-            print(
-                f"Sidebar: Folder '{folder.name}' has {len(folder_requests)} requests"
+            logger.debug(
+                "Folder '%s' has %d requests", folder.name, len(folder_requests)
             )
             requests.extend(folder_requests)
 
-        print(f"Sidebar: Total requests found: {len(requests)}")
+        logger.debug("Total requests found: %d", len(requests))
         return requests
 
     def duplicate_request(self, request):
@@ -2,14 +2,18 @@
 Unit tests for the batch_request_runner module.
 """
 
+import threading
 import time
 import unittest
 from unittest.mock import MagicMock, patch
 
+import requests
+
 from PySide6.QtCore import QThread
 
 from src.batch_request_runner import BatchRequestRunner
 from src.models import Environment, Request
+from src.request_runner import RequestRunner
 
 
 class TestBatchRequestRunner(unittest.TestCase):
@@ -78,8 +82,7 @@ class TestBatchRequestRunner(unittest.TestCase):
         MockRequestRunner.assert_called_once_with(
             expected_request_data, self.environment
         )
-        mock_runner_instance.start.assert_called_once()
-        mock_runner_instance.wait.assert_called_once()
+        mock_runner_instance.execute.assert_called_once()
 
         # Verify results stored in batch_runner
         self.assertEqual(len(batch_runner.results), 1)
@@ -91,9 +94,9 @@ class TestBatchRequestRunner(unittest.TestCase):
     @patch("src.batch_request_runner.RequestRunner")
     def test_run_single_request_error(self, MockRequestRunner):
         """Test running a single request with error (orchestrated via BatchRequestRunner.run())."""
-        # Mock RequestRunner instance to raise an exception when start() is called
+        # Mock RequestRunner instance to raise an exception when execute() is called
         mock_runner_instance = MockRequestRunner.return_value
-        mock_runner_instance.start.side_effect = Exception(
+        mock_runner_instance.execute.side_effect = Exception(
             "Connection error during request"
         )
 
@@ -101,13 +104,12 @@ class TestBatchRequestRunner(unittest.TestCase):
         batch_runner = BatchRequestRunner([self.requests[0]], self.environment)
         batch_runner.run()  # Execute the run method
 
-        # Verify RequestRunner was called and start was attempted
+        # Verify RequestRunner was called and execute was attempted
         expected_request_data = self._get_expected_request_data_dict(self.requests[0])
         MockRequestRunner.assert_called_once_with(
             expected_request_data, self.environment
         )
-        mock_runner_instance.start.assert_called_once()
-        # No wait() is called if start() immediately raises an exception
+        mock_runner_instance.execute.assert_called_once()
 
         # Verify error is captured in results
         self.assertEqual(len(batch_runner.results), 1)
@@ -135,8 +137,7 @@ class TestBatchRequestRunner(unittest.TestCase):
         MockRequestRunner.assert_called_once_with(
             expected_request_data, self.environment
         )
-        mock_runner_instance.start.assert_called_once()
-        mock_runner_instance.wait.assert_called_once()
+        mock_runner_instance.execute.assert_called_once()
 
         # Verify results capture the no response scenario
         self.assertEqual(len(batch_runner.results), 1)
@@ -196,9 +197,15 @@ class TestBatchRequestRunner(unittest.TestCase):
         expected_call_2_data = self._get_expected_request_data_dict(self.requests[1])
         expected_call_3_data = self._get_expected_request_data_dict(self.requests[2])
 
-        MockRequestRunner.assert_any_call(expected_call_1_data, self.environment)
-        MockRequestRunner.assert_any_call(expected_call_2_data, self.environment)
-        MockRequestRunner.assert_any_call(expected_call_3_data, self.environment)
+        MockRequestRunner.assert_any_call(
+            expected_call_1_data, self.environment
+        )
+        MockRequestRunner.assert_any_call(
+            expected_call_2_data, self.environment
+        )
+        MockRequestRunner.assert_any_call(
+            expected_call_3_data, self.environment
+        )
 
         # Verify results
         self.assertEqual(len(batch_runner.results), 3)
@@ -206,6 +213,90 @@ class TestBatchRequestRunner(unittest.TestCase):
         self.assertEqual(batch_runner.results[1]["response"]["status_code"], 201)
         self.assertEqual(batch_runner.results[2]["response"]["status_code"], 404)
 
+    @patch("src.batch_request_runner.RequestRunner")
+    def test_run_requests_concurrently(self, MockRequestRunner):
+        """Test that requests overlap and results keep the original order."""
+        delays = [0.3, 0.2, 0.1]
+        mock_runners = []
+        for i, delay in enumerate(delays):
+            mock_runner = MagicMock()
+            mock_runner.execute.side_effect = lambda _kwargs, d=delay: time.sleep(d)
+            mock_runner.get_response.return_value = {"status_code": 200 + i}
+            mock_runner.get_test_results.return_value = {"passed": True}
+            mock_runners.append(mock_runner)
+        MockRequestRunner.side_effect = mock_runners
+
+        batch_runner = BatchRequestRunner(self.requests, self.environment)
+        completed = []
+        batch_runner.request_completed.connect(
+            lambda request, response, test_results: completed.append(request)
+        )
+
+        start = time.perf_counter()
+        batch_runner.run()
+        elapsed = time.perf_counter() - start
+
+        # Requests run side by side, so the batch takes about as long as the slowest
+        self.assertLess(elapsed, sum(delays))
+        self.assertEqual(completed[0], self.requests[2])
+        self.assertEqual(
+            [r["response"]["status_code"] for r in batch_runner.results],
+            [200, 201, 202],
+        )
+
+    def test_pre_request_scripts_run_in_order(self):
+        """Test that each request sees the variables set by the scripts before it."""
+        for i, request in enumerate(self.requests):
+            request.url = "https://httpbin.org/{{step}}/{{last}}"
+            request.pre_request_script = f'pm.environment.set("step", "{i}");'
+        self.requests[0].pre_request_script += '\npm.environment.set("last", "x");'
+
+        sent = {}
+
+        def fake_send(runner, request_kwargs):
+            sent[request_kwargs["method"]] = request_kwargs["url"]
+            runner.response_data = {"status_code": 200}
+            runner.test_results = {"passed": True}
+
+        with patch.object(RequestRunner, "_send", autospec=True) as mock_send:
+            mock_send.side_effect = fake_send
+            BatchRequestRunner(self.requests, self.environment).run()
+
+        self.assertEqual(
+            sent,
+            {
+                "GET": "https://httpbin.org/0/x",
+                "POST": "https://httpbin.org/1/x",
+                "PUT": "https://httpbin.org/2/x",
+            },
+        )
+
+    @patch("src.batch_request_runner.RequestRunner")
+    def test_run_uses_one_session_per_worker(self, MockRequestRunner):
+        """Test that pool threads never share a session and sessions keep no cookies."""
+        seen = []  # (thread id, session) for every request sent
+        mock_runners = []
+        for _ in self.requests:
+            mock_runner = MagicMock()
+            mock_runner.execute.side_effect = lambda _kwargs, r=mock_runner: (
+                seen.append((threading.get_ident(), r.session)),
+                time.sleep(0.05),
+            )
+            mock_runner.get_response.return_value = {"status_code": 200}
+            mock_runner.get_test_results.return_value = {"passed": True}
+            mock_runners.append(mock_runner)
+        MockRequestRunner.side_effect = mock_runners
+
+        BatchRequestRunner(self.requests, self.environment).run()
+
+        sessions_by_thread = {}
+        for thread_id, session in seen:
+            self.assertIs(sessions_by_thread.setdefault(thread_id, session), session)
+        sessions = list(sessions_by_thread.values())
+        self.assertEqual(len({id(session) for session in sessions}), len(sessions))
+        self.assertIsInstance(sessions[0], requests.Session)
+        self.assertEqual(sessions[0].cookies.get_policy().allowed_domains(), ())
+
     @patch("src.batch_request_runner.RequestRunner")
     def test_run_method(self, MockRequestRunner):
         """Test the main run method orchestrates request execution."""
@@ -223,8 +314,8 @@ class TestBatchRequestRunner(unittest.TestCase):
             # Ensure each call was with a request dict and environment
             self.assertEqual(_call.args[0], expected_call_data)
             self.assertEqual(_call.args[1], self.environment)
-        mock_runner_instance.start.call_count = len(self.requests)
-        mock_runner_instance.wait.call_count = len(self.requests)
+        self.assertEqual(mock_runner_instance.execute.call_count, len(self.requests))
+        mock_runner_instance.start.assert_not_called()
 
     def test_batch_runner_with_empty_requests(self):
         """Test BatchRequestRunner with empty requests list."""
@@ -328,17 +419,18 @@ class TestBatchRequestRunner(unittest.TestCase):
     @patch("src.batch_request_runner.RequestRunner")
     def test_batch_runner_timeout_handling(self, MockRequestRunner):
         """Test timeout handling in batch execution.
-        Simulate timeout by having RequestRunner.wait() not set a response.
+        Simulate timeout by having RequestRunner.execute() not set a response.
         """
         mock_runner_instance = MockRequestRunner.return_value
-        # Simulate that wait finishes, but no response is set (e.g., due to internal timeout)
+        # Simulate that execute finishes, but no response is set
+        # (e.g., due to internal timeout)
         mock_runner_instance.get_response.return_value = None
         mock_runner_instance.get_test_results.return_value = None
 
         batch_runner = BatchRequestRunner([self.requests[0]], self.environment)
         # Note: Actual timeout logic is within RequestRunner. We simulate RequestRunner's failure to produce
         # a response due to timeout from BatchRequestRunner's perspective.
-        batch_runner.run()  # This will call runner.start() and runner.wait()
+        batch_runner.run()  # This will call runner.execute()
 
         self.assertEqual(len(batch_runner.results), 1)
         result = batch_runner.results[0]
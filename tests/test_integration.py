@@ -9,7 +9,8 @@ import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtTest import QTest
 from PySide6.QtWidgets import QApplication
 
 # Set up headless environment for CI
@@ -61,6 +62,7 @@ class TestSendApiIntegration(unittest.TestCase):
             print(f"Warning: Could not create MainWindow: {e}")
             self.main_window = None
         self.temp_dir = tempfile.mkdtemp()
+        self.main_window.data_path = os.path.join(self.temp_dir, "sendapi.json")
 
         # Clear any previously loaded data to ensure a clean state for each test
         self.main_window.collections = []
@@ -159,6 +161,30 @@ class TestSendApiIntegration(unittest.TestCase):
         self.assertIn('--data-raw \'{"key": "value"}\'', curl_command)
         self.assertIn("https://httpbin.org/post?param1=value1", curl_command)
 
+    def test_curl_export_form_data_and_existing_query(self):
+        """Test cURL export of form-data bodies onto a URL with a query string."""
+        request = Request(
+            name="Form Request",
+            method="POST",
+            url="https://httpbin.org/post?a=1",
+            params={"b": "2"},
+            body='{"field": "value"}',
+            body_type="form-data",
+        )
+        curl_command = self.main_window._generate_curl_command(request)
+        self.assertIn('-F "field=value"', curl_command)
+        self.assertTrue(curl_command.endswith('"https://httpbin.org/post?a=1&b=2"'))
+
+        # Query parameters are URL-encoded, keeping {{variable}} placeholders
+        request.params = {"q": "a b&c", "token": "{{TOKEN}}"}
+        curl_command = self.main_window._generate_curl_command(request)
+        self.assertIn("?a=1&q=a+b%26c&token={{TOKEN}}", curl_command)
+
+        # Bodies that are not a JSON object are sent raw
+        request.body = "not json"
+        curl_command = self.main_window._generate_curl_command(request)
+        self.assertIn('--data-raw "not json"', curl_command)
+
     def test_environment_management_integration(self):
         """Test environment management through the main window."""
         # Add environment
@@ -383,6 +409,138 @@ class TestSendApiIntegration(unittest.TestCase):
         self.main_window.on_response_received(mock_response)
         self.assertEqual(self.main_window.last_response, mock_response)
 
+    def test_read_data_parses_data_file(self):
+        """Test that the data file is parsed straight into model objects."""
+        path = self.main_window.data_path
+        with open(path, "w") as f:
+            json.dump({"environments": [self.test_environment.to_dict()]}, f)
+
+        collections, environments, errors = MainWindow.read_data(path)
+        self.assertEqual(collections, [])
+        self.assertEqual(errors, [])
+        self.assertEqual(environments[0].id, self.test_environment.id)
+
+    def test_send_request_retires_previous_runner(self):
+        """Test that a superseded runner no longer delivers its response."""
+        request_data = {"method": "GET", "url": "https://httpbin.org/get"}
+        with patch.object(RequestRunner, "start"):
+            self.main_window.on_send_request(request_data)
+            first_runner = self.main_window.request_runner
+            self.main_window.on_send_request(request_data)
+
+        self.assertIsNot(self.main_window.request_runner, first_runner)
+        self.main_window.last_response = None
+        first_runner.response_received.emit({"status_code": 200})
+        self.assertIsNone(self.main_window.last_response)
+
+        # The current runner is still connected
+        self.main_window.request_runner.response_received.emit({"status_code": 201})
+        self.assertEqual(self.main_window.last_response, {"status_code": 201})
+
+    def test_send_request_reuses_http_session(self):
+        """Test that consecutive sends share one keep-alive HTTP session."""
+        request_data = {"method": "GET", "url": "https://httpbin.org/get"}
+        with patch.object(RequestRunner, "start"):
+            self.main_window.on_send_request(request_data)
+            first_session = self.main_window.request_runner.session
+            self.main_window.on_send_request(request_data)
+
+        self.assertIsNotNone(first_session)
+        self.assertIs(self.main_window.request_runner.session, first_session)
+
+        # Cookies from one response are never sent with the next request
+        self.assertEqual(first_session.cookies.get_policy().allowed_domains(), ())
+
+    def test_send_button_disabled_while_request_in_flight(self):
+        """Test that Send is disabled until the runner reports back."""
+        request_data = {"method": "GET", "url": "https://httpbin.org/get"}
+        with patch.object(RequestRunner, "start"):
+            self.main_window.on_send_request(request_data)
+        self.assertFalse(self.main_window.request_panel.send_btn.isEnabled())
+
+        self.main_window.request_runner.response_received.emit({"status_code": 200})
+        self.assertTrue(self.main_window.request_panel.send_btn.isEnabled())
+
+    def test_schedule_save_coalesces_writes(self):
+        """Test that a burst of scheduled saves results in one background write."""
+        self.main_window.collections.append(self.test_collection)
+        with patch.object(MainWindow, "_write_data") as mock_write:
+            self.main_window.schedule_save()
+            self.main_window.schedule_save()
+            mock_write.assert_not_called()
+
+            QTest.qWait(700)
+            self.main_window._save_pool.waitForDone()
+            mock_write.assert_called_once()
+            path, collections_data, _ = mock_write.call_args.args
+            self.assertEqual(path, self.main_window.data_path)
+            self.assertEqual(collections_data[0]["name"], "Test Collection")
+
+    def test_file_dialogs_start_in_last_directory(self):
+        """Test that file dialogs reopen in the last directory used."""
+        picked = os.path.join(self.temp_dir, "collection.json")
+        with patch(
+            "src.main_window.QFileDialog.getOpenFileName",
+            return_value=(picked, "JSON Files (*.json)"),
+        ):
+            self.assertEqual(self.main_window._get_open_path("Open", "*.json"), picked)
+
+        with patch(
+            "src.main_window.QFileDialog.getSaveFileName", return_value=("", "")
+        ) as mock_save:
+            self.main_window._get_save_path("Save", "response.txt", "*.txt")
+            self.assertEqual(
+                mock_save.call_args.args[2],
+                os.path.join(self.temp_dir, "response.txt"),
+            )
+
+    def test_load_data_in_background(self):
+        """Test that saved data is read off the UI thread and applied later."""
+        path = self.main_window.data_path
+        with open(path, "w") as f:
+            json.dump({"environments": [self.test_environment.to_dict()]}, f)
+
+        window = MainWindow(data_path=path)
+        self.assertEqual(window.environments, [])
+
+        # Saving first applies the pending load, so nothing is lost
+        window.save_data()
+        self.assertEqual(
+            [env.name for env in window.environments], ["Test Environment"]
+        )
+        window.close()
+
+    def test_save_data_migrates_legacy_files(self):
+        """Test that data from the old per-type files is saved to the data file."""
+        with open(os.path.join(self.temp_dir, "environments.json"), "w") as f:
+            json.dump([self.test_environment.to_dict()], f)
+
+        path = self.main_window.data_path
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            collections, environments, errors = MainWindow.read_data(path)
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(errors, [])
+        self.assertEqual([env.name for env in environments], ["Test Environment"])
+
+        MainWindow._write_data(path, [], [env.to_dict() for env in environments])
+        collections, environments, errors = MainWindow.read_data(path)
+        self.assertEqual([env.name for env in environments], ["Test Environment"])
+
+    def test_batch_testing_tab_built_on_demand(self):
+        """Test that the batch testing tab is only built when first shown."""
+        self.assertFalse(hasattr(self.main_window, "results_table"))
+
+        self.main_window.content_tab_widget.setCurrentIndex(1)
+        results_table = self.main_window.results_table
+
+        # Switching away and back reuses the same widgets
+        self.main_window.content_tab_widget.setCurrentIndex(0)
+        self.main_window.content_tab_widget.setCurrentIndex(1)
+        self.assertIs(self.main_window.results_table, results_table)
+
     def test_batch_testing_ui_integration(self):
         """Test batch testing UI functionality."""
         # Prepare batch testing
@@ -394,13 +552,10 @@ class TestSendApiIntegration(unittest.TestCase):
         self.main_window.prepare_batch_testing(requests)
 
         # Verify batch testing table was prepared
-        self.assertEqual(self.main_window.results_table.rowCount(), 2)
-        self.assertEqual(
-            self.main_window.results_table.item(0, 0).text(), "Batch Request 1"
-        )
-        self.assertEqual(
-            self.main_window.results_table.item(1, 0).text(), "Batch Request 2"
-        )
+        model = self.main_window.results_table.model()
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.index(0, 0).data(), "Batch Request 1")
+        self.assertEqual(model.index(1, 0).data(), "Batch Request 2")
 
         # Test batch request completion
         mock_response = {
@@ -422,10 +577,53 @@ class TestSendApiIntegration(unittest.TestCase):
         )
 
         # Verify table was updated
-        status_item = self.main_window.results_table.item(0, 1)
-        self.assertIsNotNone(status_item)
-        self.assertIn("Status: 200", status_item.text())
-        self.assertIn("2/2 tests passed", status_item.text())
+        status_text = model.index(0, 1).data()
+        self.assertIn("Status: 200", status_text)
+        self.assertIn("2/2 tests passed", status_text)
+        self.assertEqual(model.index(0, 2).data(), "150.00 ms")
+        self.assertEqual(
+            model.index(0, 1).data(Qt.ItemDataRole.BackgroundRole),
+            MainWindow._BRUSH_PASS,
+        )
+
+    def test_batch_responses_shown_once_visible(self):
+        """Test that batch responses are coalesced and held while hidden."""
+        requests = [
+            Request("Batch Request 1", "GET", "https://httpbin.org/get"),
+            Request("Batch Request 2", "GET", "https://httpbin.org/get"),
+        ]
+        self.main_window.prepare_batch_testing(requests)
+        self.main_window.content_tab_widget.setCurrentIndex(1)
+        panel = self.main_window.response_panel
+
+        with patch.object(panel, "display_response") as mock_display, patch.object(
+            panel, "update_test_results"
+        ):
+            for i, request in enumerate(requests):
+                self.main_window.on_batch_request_completed(
+                    request, {"status_code": 200 + i}, {}
+                )
+            QTest.qWait(200)
+            mock_display.assert_not_called()
+
+            self.main_window.content_tab_widget.setCurrentIndex(0)
+            mock_display.assert_called_once_with({"status_code": 201})
+
+    def test_batch_results_rows_with_duplicate_names(self):
+        """Test that results land on each request's own row despite equal names."""
+        requests = [
+            Request("Same Name", "GET", "https://httpbin.org/get"),
+            Request("Same Name", "GET", "https://httpbin.org/status/404"),
+        ]
+        self.main_window.prepare_batch_testing(requests)
+
+        self.main_window.on_batch_request_completed(
+            requests[1], {"status_code": 404, "response_time": 5.0}, {}
+        )
+
+        model = self.main_window.results_table.model()
+        self.assertEqual(model.index(0, 1).data(), "Pending")
+        self.assertIn("Status: 404", model.index(1, 1).data())
 
 
 if __name__ == "__main__":
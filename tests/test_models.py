@@ -2,9 +2,12 @@
 Unit tests for the models module.
 """
 
+import base64
 import json
+import sys
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 
 from src.models import Collection, Environment, Request, Response
 
@@ -77,6 +80,34 @@ class TestRequest(unittest.TestCase):
         self.assertEqual(request.method, "POST")
         self.assertEqual(request.url, "https://api.example.com/test")
 
+    def test_request_from_dict_keeps_timestamps(self):
+        """Test that saved timestamps are used without computing a fallback."""
+        data = {"name": "Saved", "created_at": "2024-01-01", "updated_at": "2024-01-02"}
+        with patch("src.models._now_iso") as mock_now:
+            request = Request.from_dict(data)
+        mock_now.assert_not_called()
+        self.assertEqual(request.created_at, "2024-01-01")
+        self.assertEqual(request.updated_at, "2024-01-02")
+
+    def test_ids_generated_only_when_missing(self):
+        """Test that ids are generated for new objects but not for saved ones."""
+        self.assertTrue(Request("New").id)
+        self.assertNotEqual(Collection("A").id, Collection("B").id)
+        self.assertTrue(Environment.from_dict({"name": "No id"}).id)
+
+        with patch("src.models.uuid.uuid4") as mock_uuid4:
+            request = Request.from_dict({"id": "saved-id", "name": "Saved"})
+        mock_uuid4.assert_not_called()
+        self.assertEqual(request.id, "saved-id")
+
+    def test_request_from_dict_interns_method(self):
+        """Test that requests loaded from JSON share their method strings."""
+        first, second = json.loads(
+            '[{"name": "A", "method": "POST"}, {"name": "B", "method": "POST"}]'
+        )
+        self.assertIs(Request.from_dict(first).method, Request.from_dict(second).method)
+        self.assertEqual(Request.from_dict({"method": None}).method, "GET")
+
     def test_request_default_values(self):
         """Test Request with default values."""
         request = Request("Test Request")
@@ -113,6 +144,33 @@ class TestCollection(unittest.TestCase):
         self.assertEqual(len(self.collection.requests), 1)
         self.assertEqual(self.collection.requests[0], self.request)
 
+    def test_collection_get_and_remove_request(self):
+        """Test looking up and removing requests by id."""
+        other = Request(name="Other")
+        self.collection.add_request(self.request)
+        self.assertIs(self.collection.get_request(self.request.id), self.request)
+
+        # Requests added after the index is built are found too
+        self.collection.add_request(other)
+        self.assertIs(self.collection.get_request(other.id), other)
+
+        self.collection.remove_request(self.request.id)
+        self.assertIsNone(self.collection.get_request(self.request.id))
+        self.assertEqual(self.collection.requests, [other])
+
+        # Replacing the list rebuilds the index
+        self.collection.requests = [self.request]
+        self.assertIs(self.collection.get_request(self.request.id), self.request)
+        self.assertIsNone(self.collection.get_request(other.id))
+
+    def test_collection_remove_missing_request(self):
+        """Test that removing an unknown id leaves the collection untouched."""
+        self.collection.add_request(self.request)
+        updated_at = self.collection.updated_at
+        self.collection.remove_request("missing")
+        self.assertEqual(self.collection.requests, [self.request])
+        self.assertEqual(self.collection.updated_at, updated_at)
+
     def test_collection_add_folder(self):
         """Test adding a folder to a collection."""
         self.collection.folders.append(self.folder)
@@ -128,6 +186,22 @@ class TestCollection(unittest.TestCase):
         self.assertEqual(len(collection_dict["requests"]), 1)
         self.assertEqual(len(collection_dict["folders"]), 1)
 
+    def test_collection_to_dict_deeply_nested_folders(self):
+        """Test that folders nested beyond the recursion limit are converted."""
+        depth = sys.getrecursionlimit() + 100
+        folder = self.collection
+        for level in range(depth):
+            child = Collection(f"Folder {level}")
+            folder.folders.append(child)
+            folder = child
+        folder.add_request(self.request)
+
+        data = self.collection.to_dict()
+        for level in range(depth):
+            (data,) = data["folders"]
+            self.assertEqual(data["name"], f"Folder {level}")
+        self.assertEqual(data["requests"][0]["name"], "Test Request")
+
     def test_collection_from_dict(self):
         """Test Collection from_dict method."""
         collection_dict = {
@@ -142,6 +216,19 @@ class TestCollection(unittest.TestCase):
         self.assertEqual(len(collection.requests), 1)
         self.assertEqual(len(collection.folders), 1)
 
+    def test_collection_from_dict_builds_requests_lazily(self):
+        """Test that loaded requests are only built when first accessed."""
+        collection_dict = {"name": "Lazy", "requests": [self.request.to_dict()]}
+        collection = Collection.from_dict(collection_dict)
+        self.assertFalse(collection.requests_loaded)
+
+        # Saving an untouched collection writes the loaded dicts back out
+        self.assertEqual(collection.to_dict()["requests"], [self.request.to_dict()])
+        self.assertFalse(collection.requests_loaded)
+
+        self.assertEqual(collection.requests[0].name, self.request.name)
+        self.assertTrue(collection.requests_loaded)
+
     def test_collection_get_all_requests(self):
         """Test getting all requests from a collection including folders."""
         request1 = Request("Request 1", "GET", "https://api.example.com/1")
@@ -195,12 +282,43 @@ class TestEnvironment(unittest.TestCase):
         )
         self.assertEqual(len(self.environment.variables), 2)
 
+    def test_environment_set_unchanged_variable(self):
+        """Test that re-setting the same value reports no change."""
+        updated_at = self.environment.updated_at
+        self.assertFalse(
+            self.environment.set_variable("API_URL", "https://api.example.com")
+        )
+        self.assertEqual(self.environment.updated_at, updated_at)
+        self.assertTrue(self.environment.set_variable("API_URL", "https://other"))
+
     def test_environment_remove_variable(self):
         """Test removing a variable from an environment."""
         self.environment.remove_variable("API_KEY")
         self.assertNotIn("API_KEY", self.environment.variables)
         self.assertEqual(len(self.environment.variables), 1)
 
+    def test_environment_items_cache(self):
+        """Test that the cached items list is rebuilt after writes."""
+        items = self.environment.items()
+        self.assertIs(self.environment.items(), items)
+        self.assertEqual(items[0], ("API_URL", "https://api.example.com"))
+
+        self.environment.set_variable("TOKEN", "abc")
+        self.assertEqual(self.environment.items()[-1], ("TOKEN", "abc"))
+
+        self.environment.remove_variable("TOKEN")
+        self.assertNotIn(("TOKEN", "abc"), self.environment.items())
+
+    def test_environment_variable_names_shared(self):
+        """Test that variable names are shared between environments."""
+        first, second = json.loads(
+            '[{"name": "Dev", "variables": {"base_url": "dev"}},'
+            ' {"name": "Prod", "variables": {"base_url": "prod"}}]'
+        )
+        (dev_key,) = Environment.from_dict(first).variables
+        (prod_key,) = Environment.from_dict(second).variables
+        self.assertIs(dev_key, prod_key)
+
     def test_environment_to_dict(self):
         """Test Environment to_dict method."""
         env_dict = self.environment.to_dict()
@@ -250,7 +368,10 @@ class TestResponse(unittest.TestCase):
             {"Content-Type": "application/json", "Server": "nginx"},
         )
         self.assertEqual(
-            self.response.body, '{"message": "success", "data": [1, 2, 3]}'
+            self.response.body, b'{"message": "success", "data": [1, 2, 3]}'
+        )
+        self.assertEqual(
+            self.response.body_text, '{"message": "success", "data": [1, 2, 3]}'
         )
         self.assertEqual(self.response.response_time, 150.5)
 
@@ -262,11 +383,18 @@ class TestResponse(unittest.TestCase):
             response_dict["headers"],
             {"Content-Type": "application/json", "Server": "nginx"},
         )
+        self.assertEqual(response_dict["body_encoding"], "base64")
         self.assertEqual(
-            response_dict["body"], '{"message": "success", "data": [1, 2, 3]}'
+            base64.b64decode(response_dict["body"]),
+            b'{"message": "success", "data": [1, 2, 3]}',
         )
         self.assertEqual(response_dict["response_time"], 150.5)
 
+        # Binary bodies survive the round trip
+        binary = Response(200, {}, b"\x89PNG\xff", 0.0, 5, "", "GET")
+        self.assertEqual(Response.from_dict(binary.to_dict()).body, b"\x89PNG\xff")
+        self.assertEqual(binary.body_text, "\ufffdPNG\ufffd")
+
     def test_response_from_dict(self):
         """Test Response from_dict method."""
         response_dict = {
@@ -281,7 +409,8 @@ class TestResponse(unittest.TestCase):
         response = Response.from_dict(response_dict)
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.headers, {"Content-Type": "text/plain"})
-        self.assertEqual(response.body, "Not Found")
+        self.assertEqual(response.body, b"Not Found")
+        self.assertEqual(response.body_text, "Not Found")
         self.assertEqual(response.response_time, 50.2)
 
     def test_response_is_success(self):
@@ -2,14 +2,17 @@
 Unit tests for the postman_importer module.
 """
 
+import io
 import json
 import os
+import sys
 import tempfile
 import unittest
 from unittest.mock import mock_open, patch
 
 from src.models import Collection, Environment, Request
 from src.postman_importer import PostmanImporter
+from src.request_runner import RequestRunner
 
 
 class TestPostmanImporter(unittest.TestCase):
@@ -106,6 +109,35 @@ class TestPostmanImporter(unittest.TestCase):
         finally:
             os.unlink(file_path)
 
+    def test_import_collection_shares_one_timestamp(self):
+        """Test that everything in one import is stamped with the same time."""
+        with patch("src.postman_importer._now_iso", return_value="T") as mock_now:
+            collection = PostmanImporter._import_postman_collection(
+                self.sample_collection_data
+            )[0]
+        mock_now.assert_called_once()
+
+        folder = collection.folders[0]
+        stamps = {collection.created_at, collection.updated_at}
+        stamps |= {folder.created_at, folder.updated_at}
+        for request in collection.requests + folder.requests:
+            stamps |= {request.created_at, request.updated_at}
+        self.assertEqual(stamps, {"T"})
+
+    def test_load_json_builds_requests_while_parsing(self):
+        """Test that request items are already Requests once the file is parsed."""
+        f = io.BytesIO(json.dumps(self.sample_collection_data).encode())
+        data = PostmanImporter._load_json(f, "T")
+
+        request, folder = data["item"]
+        self.assertIsInstance(request, Request)
+        self.assertEqual(request.created_at, "T")
+        self.assertIsInstance(folder["item"][0], Request)
+
+        collection = PostmanImporter._import_postman_collection(data, "T")[0]
+        self.assertEqual(collection.requests, [request])
+        self.assertEqual(collection.folders[0].requests[0].name, "Nested Request")
+
     def test_import_collection_internal_format(self):
         """Test importing our internal collection format."""
         internal_collection_data = {
@@ -258,6 +290,24 @@ class TestPostmanImporter(unittest.TestCase):
         finally:
             os.unlink(file_path)
 
+    def test_import_file_workspace_shares_one_timestamp(self):
+        """Test that a workspace import reads the clock only once."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(self.sample_workspace_data, f)
+            file_path = f.name
+
+        try:
+            with patch("src.postman_importer._now_iso", return_value="T") as mock_now:
+                collections, environments = PostmanImporter.import_file(file_path)
+            mock_now.assert_called_once()
+
+            environment = environments[0]
+            self.assertEqual(environment.created_at, "T")
+            self.assertEqual(environment.updated_at, "T")
+            self.assertEqual(collections[0].updated_at, "T")
+        finally:
+            os.unlink(file_path)
+
     def test_import_file_error_handling(self):
         """Test error handling when importing invalid files."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
@@ -317,6 +367,21 @@ class TestPostmanImporter(unittest.TestCase):
         self.assertEqual(nested_request.name, "Nested Request")
         self.assertEqual(nested_request.method, "POST")
 
+    def test_process_items_deeply_nested_folders(self):
+        """Test that folders nested beyond the recursion limit are imported."""
+        depth = sys.getrecursionlimit() + 100
+        items = [{"name": "Leaf", "request": {"method": "GET", "url": "/leaf"}}]
+        for level in range(depth):
+            items = [{"name": f"Folder {level}", "item": items}]
+
+        collection = Collection("Deep")
+        PostmanImporter._process_items(items, collection)
+
+        folder = collection
+        for _ in range(depth):
+            (folder,) = folder.folders
+        self.assertEqual(folder.requests[0].name, "Leaf")
+
     def test_create_request_from_item(self):
         """Test creating a request from a Postman item."""
         item = {
@@ -364,6 +429,71 @@ class TestPostmanImporter(unittest.TestCase):
         self.assertEqual(request.params, {})
         self.assertEqual(request.body, "")
 
+    def test_create_request_from_item_key_values(self):
+        """Test that entries without a key or value are left out."""
+        item = {
+            "name": "Form Request",
+            "request": {
+                "method": "POST",
+                "header": [{"key": "Accept", "value": "*/*"}, {"key": "Empty"}],
+                "body": {
+                    "mode": "urlencoded",
+                    "urlencoded": [
+                        {"key": "user", "value": "alice"},
+                        {"key": "note", "value": "a&b c"},
+                        {"key": "token", "value": "{{TOKEN}}"},
+                        {"value": "no-key"},
+                    ],
+                },
+                "url": "https://api.example.com/form",
+            },
+        }
+
+        request = PostmanImporter._create_request_from_item(item)
+
+        self.assertEqual(request.url, "https://api.example.com/form")
+        self.assertEqual(request.headers, {"Accept": "*/*"})
+        self.assertEqual(request.params, {})
+        self.assertEqual(request.body, "user=alice&note=a%26b+c&token={{TOKEN}}")
+        self.assertEqual(request.body_type, "x-www-form-urlencoded")
+
+        # The placeholder is still substituted in the body that is sent
+        environment = Environment("Test", {"TOKEN": "secret"})
+        request_kwargs = RequestRunner(request.to_dict(), environment).prepare()
+        self.assertEqual(request_kwargs["data"], "user=alice&note=a%26b+c&token=secret")
+
+    def test_create_request_from_item_scripts(self):
+        """Test that JavaScript event scripts are imported by listen type."""
+        item = {
+            "name": "Scripted Request",
+            "event": [
+                {
+                    "listen": "prerequest",
+                    "script": {"type": "text/javascript", "exec": ["setup();"]},
+                },
+                {
+                    "listen": "test",
+                    "script": {
+                        "type": "text/javascript",
+                        "exec": ["check();", "done();"],
+                    },
+                },
+                {"listen": "test", "script": {"type": "text/plain", "exec": ["x"]}},
+            ],
+            "request": {"method": "GET", "url": "https://api.example.com/"},
+        }
+
+        request = PostmanImporter._create_request_from_item(item)
+
+        self.assertEqual(request.pre_request_script, "setup();")
+        self.assertEqual(request.tests, "check();\ndone();")
+
+        # A script given as one string is kept whole
+        item["event"] = [
+            {"listen": "test", "script": {"type": "text/javascript", "exec": "ok();"}}
+        ]
+        self.assertEqual(PostmanImporter._create_request_from_item(item).tests, "ok();")
+
     def test_create_folder_from_item(self):
         """Test creating a folder from a Postman item."""
         item = {
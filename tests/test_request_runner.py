@@ -49,6 +49,31 @@ class TestRequestRunner(unittest.TestCase):
         self.assertEqual(substituted_url, "https://httpbin.org/get")
         self.assertEqual(substituted_headers["Authorization"], "Bearer test-key-123")
 
+    def test_substitute_variables_without_placeholders(self):
+        """Test that text and dicts without placeholders are returned as-is."""
+        runner = RequestRunner(self.request, self.environment)
+        headers = {"Accept": "*/*"}
+
+        self.assertIs(runner.replace_environment_variables_in_dict(headers), headers)
+        self.assertEqual(
+            runner.replace_environment_variables("/get?a={b}"), "/get?a={b}"
+        )
+        self.assertEqual(runner.replace_environment_variables(""), "")
+
+    def test_substitute_variables_cache_follows_environment(self):
+        """Test that cached substitutions are redone after a variable changes."""
+        runner = RequestRunner(self.request, self.environment)
+        runner.subst_cache_size = 2
+
+        replace = runner.replace_environment_variables
+        self.assertEqual(replace("{{API_KEY}}"), "test-key-123")
+        self.environment.set_variable("API_KEY", "rotated")
+        self.assertEqual(replace("{{API_KEY}}"), "rotated")
+
+        # The cache stays within its bound
+        replace("{{API_URL}}")
+        self.assertEqual(len(runner._subst_cache), 2)
+
     def test_substitute_variables_no_environment(self):
         """Test variable substitution without environment."""
         request_text = "{{API_URL}}/get"
@@ -66,9 +91,9 @@ class TestRequestRunner(unittest.TestCase):
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "application/json", "Server": "nginx"}
-        mock_response.text = '{"message": "success"}'
+        mock_response.encoding = "utf-8"
         mock_response.elapsed.total_seconds.return_value = 0.15
-        mock_response.content = b'{"message": "success"}'  # Mock content for size
+        mock_response.iter_content.return_value = [b'{"message": ', b'"success"}']
         mock_response.url = "https://httpbin.org/get"
         mock_request.return_value = mock_response
 
@@ -93,7 +118,10 @@ class TestRequestRunner(unittest.TestCase):
             },  # Ensure headers are correctly passed
             params={"param1": "value1"},  # Ensure params are correctly passed
             timeout=30,
+            stream=True,
         )
+        self.assertEqual(response_data["size"], 22)
+        self.assertFalse(response_data["truncated"])
 
     @patch("src.request_runner.requests.request")
     def test_execute_request_error(self, mock_request):
@@ -113,6 +141,114 @@ class TestRequestRunner(unittest.TestCase):
         self.assertIn("error", response_data)
         self.assertIn("Connection error", response_data["error"])
 
+    @patch("src.request_runner.requests.request")
+    def test_execute_does_not_emit(self, mock_request):
+        """Test that execute() stores the response without emitting signals."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [b"{}"]
+        mock_response.url = "https://httpbin.org/get"
+        mock_request.return_value = mock_response
+
+        runner = RequestRunner(self.request.to_dict(), self.environment)
+        received = []
+        runner.response_received.connect(received.append)
+        runner.execute()
+
+        self.assertEqual(runner.get_response()["status_code"], 200)
+        self.assertIsNone(runner.error_message)
+        self.assertEqual(received, [])
+
+    @patch("src.request_runner.requests.request")
+    def test_execute_leaves_request_headers_untouched(self, mock_request):
+        """Test that the default Content-Type is not written into request_data."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [b"{}"]
+        mock_request.return_value = mock_response
+
+        request_data = self.request.to_dict()
+        request_data.update(body='{"a": 1}', body_type="raw")
+        runner = RequestRunner(request_data, None)
+        runner.execute()
+
+        sent_headers = mock_request.call_args.kwargs["headers"]
+        self.assertEqual(sent_headers["Content-Type"], "application/json")
+        self.assertEqual(request_data["headers"], {"User-Agent": "SendApi/1.0"})
+
+    @patch("src.request_runner.requests.request")
+    def test_execute_form_fields(self, mock_request):
+        """Test that form_fields are substituted and sent as form data."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [b"{}"]
+        mock_request.return_value = mock_response
+
+        request_data = self.request.to_dict()
+        request_data.update(
+            body_type="form-data", body="", form_fields={"key": "{{API_KEY}}"}
+        )
+        RequestRunner(request_data, self.environment).execute()
+        self.assertEqual(mock_request.call_args.kwargs["data"], {"key": "test-key-123"})
+
+        # Saved requests still carry form-data as a JSON body
+        request_data = self.request.to_dict()
+        request_data.update(body_type="form-data", body='{"a": "1"}')
+        RequestRunner(request_data, self.environment).execute()
+        self.assertEqual(mock_request.call_args.kwargs["data"], {"a": "1"})
+
+    @patch("src.request_runner.requests.request")
+    def test_execute_detects_undeclared_encoding(self, mock_request):
+        """Test that a body without a charset is decoded by detection, not UTF-8."""
+        text = "Grüße aus Köln, schöne Straße, Übermut und Ärger " * 4
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.encoding = None
+        mock_response.iter_content.return_value = [text.encode("latin-1")]
+        mock_request.return_value = mock_response
+
+        runner = RequestRunner(self.request.to_dict(), self.environment)
+        runner.execute()
+
+        self.assertNotIn("\ufffd", runner.get_response()["body"])
+
+    @patch("src.request_runner.requests.request")
+    def test_execute_truncates_large_body(self, mock_request):
+        """Test that reading stops once the body passes max_body_size."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.encoding = None
+        mock_response.iter_content.return_value = iter([b"abcd", b"efgh", b"ijkl"])
+        mock_response.url = "https://httpbin.org/get"
+        mock_request.return_value = mock_response
+
+        runner = RequestRunner(self.request.to_dict(), self.environment)
+        runner.max_body_size = 6
+        runner.execute()
+
+        response_data = runner.get_response()
+        self.assertEqual(response_data["body"], "abcdef\n[truncated at 6 bytes]")
+        self.assertEqual(response_data["size"], 6)
+        self.assertTrue(response_data["truncated"])
+
+        # The third chunk is never pulled and the connection is released
+        self.assertEqual(list(mock_response.iter_content.return_value), [b"ijkl"])
+        mock_response.close.assert_called_once()
+
+        # With a Content-Length, a truncated body still reports its full size
+        mock_response.headers = {"Content-Length": "12"}
+        mock_response.iter_content.return_value = iter([b"abcd", b"efgh", b"ijkl"])
+        runner.execute()
+        self.assertEqual(runner.get_response()["size"], 12)
+
     def test_run_tests_no_tests(self):
         """Test running tests when no tests are provided."""
         response_data = {
@@ -238,6 +374,79 @@ class TestRequestRunner(unittest.TestCase):
         self.assertEqual(test_results["total_count"], 3)
         self.assertIn("2/3 tests passed", test_results["summary"])
 
+    def test_run_tests_duplicate_names_use_own_body(self):
+        """Test that blocks sharing a name are each checked against their own body."""
+        response_data = {
+            "status_code": 200,
+            "headers": {},
+            "body": "",
+            "response_time": 1500.0,
+            "url": "",
+            "method": "",
+        }
+
+        tests_script = """
+        pm.test("Check", function () {
+            pm.response.to.have.status(200);
+        });
+
+        pm.test("Check", function () {
+            pm.expect(pm.response.responseTime).to.be.below(1000);
+        });
+        """
+
+        request_data = self.request.to_dict()
+        request_data["tests"] = tests_script
+        runner = RequestRunner(request_data, self.environment)
+        test_results = runner.run_tests(response_data)
+
+        self.assertEqual(test_results["passed_count"], 1)
+        self.assertEqual(test_results["total_count"], 2)
+        self.assertIn("✗ Check failed (took 1500.00ms)", test_results["results"])
+
+    def test_run_tests_nested_braces(self):
+        """Test that a body containing braces is read up to its own closing brace."""
+        response_data = {
+            "status_code": 404,
+            "headers": {},
+            "body": "",
+            "response_time": 10.0,
+            "url": "",
+            "method": "",
+        }
+
+        tests_script = """
+        pm.test("Body has fields", function () {
+            const expected = {id: 1, tags: {primary: true}};
+            pm.response.to.have.status(200);
+        });
+
+        pm.test("Unclosed", function () {
+        """
+
+        request_data = self.request.to_dict()
+        request_data["tests"] = tests_script
+        runner = RequestRunner(request_data, self.environment)
+        test_results = runner.run_tests(response_data)
+
+        self.assertEqual(test_results["total_count"], 1)
+        self.assertEqual(
+            test_results["results"], ["✗ Body has fields failed (got 404)"]
+        )
+
+    def test_pre_request_script_sets_variables(self):
+        """Test that pm.environment.set() calls update the environment."""
+        request_data = self.request.to_dict()
+        request_data["pre_request_script"] = (
+            'pm.environment.set("token", "abc");\n'
+            "pm.environment.set('user', 'alice');"
+        )
+        runner = RequestRunner(request_data, self.environment)
+        runner.process_pre_request_script()
+
+        self.assertEqual(self.environment.get_variable("token"), "abc")
+        self.assertEqual(self.environment.get_variable("user"), "alice")
+
     def test_run_complete_flow(self):
         """Test complete request execution flow."""
         request_data_for_run = self.request.to_dict()
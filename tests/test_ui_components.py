@@ -6,7 +6,8 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QTableWidgetItem
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QMessageBox
 
 from src.environment_panel import EnvironmentPanel
 from src.models import Collection, Environment, Request
@@ -106,9 +107,13 @@ class TestUIComponents(unittest.TestCase):
         )  # Changed from response_text
 
         # Verify headers are displayed (now in a table)
-        self.assertEqual(panel.headers_table.rowCount(), 1)
-        self.assertEqual(panel.headers_table.item(0, 0).text(), "Content-Type")
-        self.assertEqual(panel.headers_table.item(0, 1).text(), "application/json")
+        model = panel.headers_table.model()
+        self.assertEqual(model.rowCount(), 1)
+        self.assertEqual(model.index(0, 0).data(), "Content-Type")
+        self.assertEqual(model.index(0, 1).data(), "application/json")
+
+        panel.clear_response()
+        self.assertEqual(model.rowCount(), 0)
 
     def test_sidebar_creation(self):
         """Test Sidebar creation."""
@@ -136,6 +141,37 @@ class TestUIComponents(unittest.TestCase):
             request_item.text(0), "GET Test Request"
         )  # Expects method prefix
 
+    def test_sidebar_loads_saved_requests_on_expand(self):
+        """Test that requests of a loaded collection are built on expand."""
+        sidebar = Sidebar(None)
+        collection = Collection.from_dict(self.collection.to_dict())
+        sidebar.update_collections([collection])
+
+        root_item = sidebar.collections_tree.topLevelItem(0)
+        self.assertFalse(collection.requests_loaded)
+        self.assertEqual(root_item.childCount(), 0)
+
+        root_item.setExpanded(True)
+        self.assertTrue(collection.requests_loaded)
+        self.assertEqual(root_item.child(0).text(0), "GET Test Request")
+
+    def test_sidebar_add_collection(self):
+        """Test appending a collection without rebuilding the tree."""
+        sidebar = Sidebar(None)
+        collections = [self.collection]
+        sidebar.update_collections(collections)
+        first_item = sidebar.collections_tree.topLevelItem(0)
+
+        other = Collection("Other Collection")
+        collections.append(other)
+        sidebar.add_collection(other)
+
+        self.assertEqual(sidebar.collections_tree.topLevelItemCount(), 2)
+        self.assertIs(sidebar.collections_tree.topLevelItem(0), first_item)
+        self.assertEqual(
+            sidebar.collections_tree.topLevelItem(1).text(0), "Other Collection"
+        )
+
     def test_sidebar_context_menu(self):
         """Test sidebar context menu functionality."""
         sidebar = Sidebar(None)
@@ -183,52 +219,196 @@ class TestUIComponents(unittest.TestCase):
         panel.env_combo.setCurrentIndex(1)  # Select "Test Environment"
 
         # Verify variables are displayed
-        self.assertEqual(panel.variables_table.rowCount(), 1)
-        self.assertEqual(panel.variables_table.item(0, 0).text(), "API_URL")
-        self.assertEqual(panel.variables_table.item(0, 1).text(), "https://httpbin.org")
+        model = panel.variables_table.model()
+        self.assertEqual(model.rowCount(), 1)
+        self.assertEqual(model.index(0, 0).data(), "API_URL")
+        self.assertEqual(model.index(0, 1).data(), "https://httpbin.org")
+
+    def test_environment_panel_add_remove_variable(self):
+        """Test adding and removing variables row by row."""
+        panel = EnvironmentPanel()
+        panel.update_environments([self.environment])
+        panel.env_combo.setCurrentIndex(1)  # Select "Test Environment"
+        model = panel.variables_table.model()
+
+        resets = []
+        model.modelReset.connect(lambda: resets.append(True))
+        with patch(
+            "src.environment_panel.QInputDialog.getText",
+            side_effect=[("TOKEN", True), ("abc", True)],
+        ):
+            panel.add_variable()
+
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.index(1, 0).data(), "TOKEN")
+        self.assertEqual(self.environment.variables["TOKEN"], "abc")
+
+        panel.variables_table.setCurrentIndex(model.index(0, 0))
+        panel.remove_variable()
+        self.assertEqual(model.rowCount(), 1)
+        self.assertEqual(model.index(0, 0).data(), "TOKEN")
+        self.assertEqual(self.environment.variables, {"TOKEN": "abc"})
+        self.assertEqual(resets, [])
+
+    def test_environment_panel_delete_environment(self):
+        """Test deleting the selected environment by position."""
+        panel = EnvironmentPanel()
+        duplicate = Environment("Test Environment")
+        environments = [self.environment, duplicate]
+        panel.update_environments(environments)
+        panel.env_combo.setCurrentIndex(2)
+
+        with patch(
+            "src.environment_panel.QMessageBox.question",
+            return_value=QMessageBox.StandardButton.Yes,
+        ):
+            panel.delete_environment()
+
+        self.assertEqual(environments, [self.environment])
+        self.assertEqual(panel.env_combo.count(), 2)
+        self.assertIs(panel.get_current_environment(), self.environment)
 
     def test_request_panel_headers_management(self):
         """Test headers management in request panel."""
         panel = RequestPanel(None)
 
-        # Simulate adding a header directly to the table
-        row_count = panel.headers_table.rowCount()
-        panel.headers_table.insertRow(row_count)
-        panel.headers_table.setItem(row_count, 0, QTableWidgetItem("X-Custom-Header"))
-        panel.headers_table.setItem(row_count, 1, QTableWidgetItem("CustomValue"))
+        # Simulate adding a header directly to the table's model
+        model = panel.headers_table.model()
+        model.add_row("X-Custom-Header", "CustomValue")
 
         # Verify header was added by inspecting the table
         headers = {}
-        for row in range(panel.headers_table.rowCount()):
-            key_item = panel.headers_table.item(row, 0)
-            value_item = panel.headers_table.item(row, 1)
-            if key_item and value_item:
-                headers[key_item.text()] = value_item.text()
+        for row in range(model.rowCount()):
+            headers[model.index(row, 0).data()] = model.index(row, 1).data()
 
         self.assertIn("X-Custom-Header", headers)
         self.assertEqual(headers["X-Custom-Header"], "CustomValue")
 
+        # Edits made in the table are picked up when the request is sent
+        model.setData(model.index(0, 1), "Edited")
+        panel.url_edit.setText("https://httpbin.org/get")
+        with patch.object(panel, "send_request") as mock_send_signal:
+            panel.send_request_clicked()
+        request_data = mock_send_signal.emit.call_args.args[0]
+        self.assertEqual(request_data["headers"], {"X-Custom-Header": "Edited"})
+
+        # Removing the current row removes the header
+        panel.headers_table.setCurrentIndex(model.index(0, 0))
+        panel.remove_header()
+        self.assertEqual(model.rowCount(), 0)
+
     def test_request_panel_params_management(self):
         """Test parameters management in request panel."""
         panel = RequestPanel(None)
 
-        # Simulate adding a parameter directly to the table
-        row_count = panel.params_table.rowCount()
-        panel.params_table.insertRow(row_count)
-        panel.params_table.setItem(row_count, 0, QTableWidgetItem("newParam"))
-        panel.params_table.setItem(row_count, 1, QTableWidgetItem("paramValue"))
-        panel.params_table.setItem(row_count, 2, QTableWidgetItem(""))
+        # Simulate adding a parameter directly to the table's model
+        model = panel.params_table.model()
+        model.add_row("newParam", "paramValue")
 
         # Verify parameter was added by inspecting the table
         params = {}
-        for row in range(panel.params_table.rowCount()):
-            key_item = panel.params_table.item(row, 0)
-            value_item = panel.params_table.item(row, 1)
-            if key_item and value_item:
-                params[key_item.text()] = value_item.text()
+        for row in range(model.rowCount()):
+            params[model.index(row, 0).data()] = model.index(row, 1).data()
 
         self.assertIn("newParam", params)
         self.assertEqual(params["newParam"], "paramValue")
+        self.assertEqual(model.index(0, 2).data(), "")
+
+    def test_request_panel_add_rows_inline(self):
+        """Test that Add inserts a blank row for in-place editing."""
+        panel = RequestPanel(None)
+        panel.load_request(self.request)
+
+        panel.add_header()
+        model = panel.headers_table.model()
+        self.assertEqual(model.rowCount(), 1)
+        self.assertEqual(panel.headers_table.currentIndex().row(), 0)
+
+        # A row whose key is still blank is not saved
+        panel.save_request()
+        self.assertEqual(self.request.headers, {})
+
+        model.setData(model.index(0, 0), "Accept")
+        model.setData(model.index(0, 1), "*/*")
+        panel.save_request()
+        self.assertEqual(self.request.headers, {"Accept": "*/*"})
+
+        panel.add_form_data()
+        form_index = panel.form_data_model.index(0, 2)
+        self.assertIsNotNone(panel.form_data_table.indexWidget(form_index))
+
+    def test_request_panel_load_request_tables(self):
+        """Test that loading a request fills and then replaces the tables."""
+        panel = RequestPanel(None)
+        self.request.headers = {"Accept": "*/*", "X-Id": "1"}
+        self.request.params = {"page": "2"}
+        panel.load_request(self.request)
+
+        self.assertEqual(panel.headers_table.model().rowCount(), 2)
+        self.assertEqual(panel.params_table.model().index(0, 1).data(), "2")
+
+        panel.load_request(Request("Other"))
+        self.assertEqual(panel.headers_table.model().rowCount(), 0)
+        self.assertEqual(panel.get_current_request().params, {})
+
+    def test_request_panel_get_current_request_trims_rows(self):
+        """Test that get_current_request trims table rows and drops blank keys."""
+        panel = RequestPanel(None)
+        panel.load_request(self.request)
+        panel.headers_model.add_row(" Accept ", " */* ")
+        panel.headers_model.add_row("  ", "ignored")
+        panel.save_request()
+        self.assertIn(" Accept ", self.request.headers)
+
+        request = panel.get_current_request()
+        self.assertEqual(request.headers, {"Accept": "*/*"})
+
+    def test_request_panel_send_saves_request(self):
+        """Test that sending saves the same header and param values it emits."""
+        panel = RequestPanel(None)
+        self.request.headers = {"Accept": "*/*"}
+        self.request.params = {"page": "2"}
+        panel.load_request(self.request)
+
+        emitted = []
+        panel.send_request.connect(emitted.append)
+        panel.send_request_clicked()
+
+        self.assertEqual(len(emitted), 1)
+        self.assertEqual(emitted[0]["headers"], {"Accept": "*/*"})
+        self.assertEqual(emitted[0]["params"], self.request.params)
+        self.assertEqual(emitted[0]["url"], "https://httpbin.org/get")
+        self.assertEqual(emitted[0]["body"], "")
+
+    def test_request_panel_send_form_data_as_dict(self):
+        """Test that form-data fields are sent as a dict, not a JSON body."""
+        panel = RequestPanel(None)
+        panel.load_request(self.request)
+        panel.body_type_combo.setCurrentText("form-data")
+        panel.form_data_model.add_row("user", "alice")
+
+        emitted = []
+        panel.send_request.connect(emitted.append)
+        panel.send_request_clicked()
+
+        self.assertEqual(emitted[0]["form_fields"], {"user": "alice"})
+        self.assertEqual(emitted[0]["body"], "")
+
+    def test_request_panel_send_button_drops_repeat_clicks(self):
+        """Test that a burst of Send clicks sends a single request."""
+        panel = RequestPanel(None)
+        panel.load_request(self.request)
+
+        emitted = []
+        panel.send_request.connect(emitted.append)
+        panel.send_btn.click()
+        panel.send_btn.click()
+        self.assertEqual(len(emitted), 1)
+
+        # Once the guard interval has passed, Send works again
+        panel._send_guard.stop()
+        panel.send_btn.click()
+        self.assertEqual(len(emitted), 2)
 
     def test_request_panel_body_management(self):
         """Test body management in request panel."""
@@ -303,8 +483,9 @@ class TestUIComponents(unittest.TestCase):
         panel.update_environments(environments)
         panel.env_combo.setCurrentIndex(1)  # Select "Test Environment"
 
-        # Edit a variable by setting text in the table item directly
-        panel.variables_table.item(0, 1).setText("https://new-api.example.com")
+        # Edit a variable through the table model, as the view's editor does
+        model = panel.variables_table.model()
+        model.setData(model.index(0, 1), "https://new-api.example.com")
 
         # Verify variable was updated via the panel's internal get_current_environment
         current_env = panel.get_current_environment()
@@ -312,6 +493,129 @@ class TestUIComponents(unittest.TestCase):
             current_env.variables["API_URL"], "https://new-api.example.com"
         )
 
+    def test_environment_panel_selection_uses_item_data(self):
+        """Test selecting environments that share a name and reselecting."""
+        panel = EnvironmentPanel()
+        duplicate = Environment("Test Environment")
+        panel.update_environments([self.environment, duplicate])
+
+        emitted = []
+        panel.environment_changed.connect(emitted.append)
+        panel.env_combo.setCurrentIndex(2)
+        self.assertIs(panel.get_current_environment(), duplicate)
+
+        # Re-announcing the same selection does not emit again
+        panel.on_environment_changed("Test Environment")
+        self.assertEqual(emitted, [duplicate])
+
+        panel.env_combo.setCurrentIndex(0)
+        self.assertIsNone(panel.get_current_environment())
+        self.assertEqual(panel.variables_table.model().rowCount(), 0)
+
+    def test_environment_panel_update_keeps_selection(self):
+        """Test that rebuilding the combo keeps the selection without re-emitting."""
+        panel = EnvironmentPanel()
+        panel.update_environments([self.environment])
+        panel.env_combo.setCurrentIndex(1)
+
+        emitted = []
+        panel.environment_changed.connect(emitted.append)
+        other = Environment("Other Environment")
+        panel.update_environments([other, self.environment])
+
+        self.assertIs(panel.get_current_environment(), self.environment)
+        self.assertEqual(panel.env_combo.currentIndex(), 2)
+        self.assertEqual(emitted, [])
+
+        # A removed environment falls back to "No Environment"
+        panel.update_environments([other])
+        self.assertIsNone(panel.get_current_environment())
+        self.assertEqual(panel.variables_table.model().rowCount(), 0)
+
+    def test_environment_panel_update_skips_unchanged_list(self):
+        """Test that refreshing with the same environments does not rebuild."""
+        panel = EnvironmentPanel()
+        environments = [self.environment]
+        panel.update_environments(environments)
+
+        with patch.object(panel.env_combo, "clear") as mock_clear:
+            panel.update_environments(list(environments))
+            mock_clear.assert_not_called()
+
+            self.environment.name = "Renamed Environment"
+            panel.update_environments(environments)
+            mock_clear.assert_called_once()
+
+    def test_environment_panel_add_environment(self):
+        """Test appending an environment without rebuilding the combo."""
+        panel = EnvironmentPanel()
+        environments = [self.environment]
+        panel.update_environments(environments)
+        panel.env_combo.setCurrentIndex(1)
+
+        other = Environment("Other Environment")
+        environments.append(other)
+        with patch.object(panel.env_combo, "clear") as mock_clear:
+            panel.add_environment(other)
+            panel.update_environments(environments)
+            mock_clear.assert_not_called()
+
+        self.assertEqual(panel.env_combo.itemData(2), other)
+        self.assertIs(panel.get_current_environment(), self.environment)
+
+    def test_environment_panel_variable_rename(self):
+        """Test renaming a variable by editing its name cell."""
+        panel = EnvironmentPanel()
+        panel.update_environments([self.environment])
+        panel.env_combo.setCurrentIndex(1)  # Select "Test Environment"
+
+        emitted = []
+        panel.environment_changed.connect(emitted.append)
+        model = panel.variables_table.model()
+        self.assertTrue(model.setData(model.index(0, 0), "BASE_URL"))
+
+        self.assertEqual(
+            self.environment.variables, {"BASE_URL": "https://httpbin.org"}
+        )
+        self.assertEqual(model.index(0, 0).data(), "BASE_URL")
+        QTest.qWait(100)
+        self.assertEqual(emitted, [self.environment])
+
+        # Empty names are rejected
+        self.assertFalse(model.setData(model.index(0, 0), "  "))
+        self.assertIn("BASE_URL", self.environment.variables)
+
+        # Names already used by another variable are rejected
+        model.add_variable("TOKEN", "abc")
+        self.assertFalse(model.setData(model.index(0, 0), "TOKEN"))
+        self.assertEqual(
+            self.environment.variables,
+            {"BASE_URL": "https://httpbin.org", "TOKEN": "abc"},
+        )
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.index(0, 0).data(), "BASE_URL")
+
+        # Unchanged values are not re-announced
+        self.assertFalse(model.setData(model.index(0, 1), "https://httpbin.org"))
+        QTest.qWait(100)
+        self.assertEqual(emitted, [self.environment])
+
+    def test_environment_panel_edits_emit_once(self):
+        """Test that a burst of variable edits produces a single emission."""
+        panel = EnvironmentPanel()
+        panel.update_environments([self.environment])
+        panel.env_combo.setCurrentIndex(1)  # Select "Test Environment"
+
+        emitted = []
+        panel.environment_changed.connect(emitted.append)
+        model = panel.variables_table.model()
+        for value in ("https://a.example.com", "https://b.example.com"):
+            model.setData(model.index(0, 1), value)
+        self.assertEqual(emitted, [])
+
+        QTest.qWait(100)
+        self.assertEqual(emitted, [self.environment])
+
     def test_request_panel_validation(self):
         """Test request validation in request panel."""
         panel = RequestPanel(None)